@@ -0,0 +1 @@
+from .ball_trajectory import BallTrajectory, interpolate_ball, reject_outliers, kalman_smooth
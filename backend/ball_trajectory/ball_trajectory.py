@@ -0,0 +1,130 @@
+import numpy as np
+
+from track_store import ObjectTracks
+
+
+class BallTrajectory:
+    """interpolate_ball 결과 (프레임별)
+
+    - bbox: 보간/보정한 볼 bbox (num_frames, 4), 감지가 하나도 없으면 NaN
+    - detected: 실제 감지가 있는 프레임
+    - outlier: 감지됐지만 튀는 값으로 판단해 버린 프레임
+    - confidence: 0~1 신뢰도 (남은 감지 프레임은 1, 가까운 감지에서 멀어질수록 반감)
+    """
+
+    def __init__(self, bbox, detected, outlier, confidence):
+        self.bbox = bbox
+        self.detected = detected
+        self.outlier = outlier
+        self.confidence = confidence
+
+    @property
+    def num_frames(self):
+        return len(self.bbox)
+
+    def to_objects(self, ball_id=1):
+        """볼 ObjectTracks (좌표가 있는 프레임마다 {ball_id: {'bbox': ...}}, 기존 보간 결과와 같은 필드)"""
+        frames = np.flatnonzero(~np.isnan(self.bbox).any(axis=1))
+        return ObjectTracks.from_columns(frames, ball_id, self.num_frames, bbox=self.bbox[frames])
+
+
+def reject_outliers(frames, centers, max_speed):
+    """혼자 튀는 감지 마스크: 앞뒤 감지 양쪽으로 max_speed(px/프레임)를 넘게 움직였지만
+    앞뒤 감지끼리는 max_speed 안에서 이어지는 경우 (양 끝 감지는 판단하지 않음)"""
+    outlier = np.zeros(len(frames), dtype=bool)
+    if len(frames) < 3:
+        return outlier
+
+    def speed(a, b):
+        return np.linalg.norm(centers[b] - centers[a], axis=1) / (frames[b] - frames[a])
+
+    middle = np.arange(1, len(frames) - 1)
+    outlier[middle] = (
+        (speed(middle - 1, middle) > max_speed)
+        & (speed(middle, middle + 1) > max_speed)
+        & (speed(middle - 1, middle + 1) <= max_speed)
+    )
+    return outlier
+
+
+def kalman_smooth(frames, centers, num_frames, process_noise=1.0, measurement_noise=4.0):
+    """등속 모델 칼만 필터 + RTS 스무더로 첫~마지막 감지 구간의 볼 중심 (num_frames, 2) 계산
+
+    x/y 축을 한꺼번에 (축, 상태) 배열로 처리하고, 감지가 없는 프레임은 예측만 한다.
+    구간 밖 프레임은 양 끝 값을 그대로 쓴다 (기존 bfill과 같은 방식).
+    """
+    start, end = int(frames[0]), int(frames[-1]) + 1
+    length = end - start
+    measured = np.full((length, 2), np.nan)
+    measured[frames - start] = centers
+
+    F = np.array([[1.0, 1.0], [0.0, 1.0]])
+    Q = process_noise * np.array([[0.25, 0.5], [0.5, 1.0]])
+    x = np.stack([centers[0], np.zeros(2)], axis=1)  # (축, [위치, 속도])
+    P = np.tile(np.diag([measurement_noise, 100.0]), (2, 1, 1))
+
+    x_pred, P_pred = np.empty((length, 2, 2)), np.empty((length, 2, 2, 2))
+    x_filt, P_filt = np.empty((length, 2, 2)), np.empty((length, 2, 2, 2))
+    for t in range(length):
+        if t:
+            x = x @ F.T
+            P = F @ P @ F.T + Q
+        x_pred[t], P_pred[t] = x, P
+        if not np.isnan(measured[t, 0]):
+            gain = P[:, :, 0] / (P[:, 0, 0] + measurement_noise)[:, None]
+            x = x + gain * (measured[t] - x[:, 0])[:, None]
+            P = P - gain[:, :, None] * P[:, None, 0, :]
+        x_filt[t], P_filt[t] = x, P
+
+    smoothed = x_filt.copy()
+    for t in range(length - 2, -1, -1):
+        C = P_filt[t] @ F.T @ np.linalg.inv(P_pred[t + 1])
+        smoothed[t] = x_filt[t] + np.einsum("aij,aj->ai", C, smoothed[t + 1] - x_pred[t + 1])
+
+    positions = np.empty((num_frames, 2))
+    positions[start:end] = smoothed[:, :, 0]
+    positions[:start] = positions[start]
+    positions[end:] = positions[end - 1]
+    return positions
+
+
+def interpolate_ball(boxes, max_speed=80.0, kalman=False, process_noise=1.0, measurement_noise=4.0,
+                     confidence_half_life=5.0):
+    """프레임별 볼 bbox (num_frames, 4, 없으면 NaN) → BallTrajectory
+
+    튀는 감지를 버린 뒤 남은 감지 사이를 선형 보간하고 양 끝은 가장 가까운 값으로 채운다
+    (tracker.interpolate_ball_positions의 pandas interpolate() + bfill()과 같은 결과).
+    kalman=True면 bbox 중심을 칼만 스무더로 보정하고 크기는 보간값을 쓴다.
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    num_frames = len(boxes)
+    detected = ~np.isnan(boxes).any(axis=1)
+    frames = np.flatnonzero(detected)
+    centers = (boxes[frames, :2] + boxes[frames, 2:]) / 2
+
+    outlier = np.zeros(num_frames, dtype=bool)
+    if max_speed:
+        outlier[frames] = reject_outliers(frames, centers, max_speed)
+    keep = ~outlier[frames]
+    frames, centers = frames[keep], centers[keep]
+
+    bbox = np.full((num_frames, 4), np.nan)
+    confidence = np.zeros(num_frames)
+    if len(frames) == 0:
+        return BallTrajectory(bbox, detected, outlier, confidence)
+
+    all_frames = np.arange(num_frames)
+    for column in range(4):
+        bbox[:, column] = np.interp(all_frames, frames, boxes[frames, column])
+    if kalman and len(frames) > 1:
+        half_size = (bbox[:, 2:] - bbox[:, :2]) / 2
+        center = kalman_smooth(frames, centers, num_frames, process_noise, measurement_noise)
+        bbox = np.concatenate([center - half_size, center + half_size], axis=1)
+
+    # 가장 가까운 (남은) 감지까지의 프레임 거리로 신뢰도 계산
+    after = np.searchsorted(frames, all_frames)
+    previous = frames[np.clip(after - 1, 0, len(frames) - 1)]
+    following = frames[np.clip(after, 0, len(frames) - 1)]
+    gap = np.minimum(np.abs(all_frames - previous), np.abs(following - all_frames))
+    confidence = 0.5 ** (gap / confidence_half_life)
+    return BallTrajectory(bbox, detected, outlier, confidence)
@@ -0,0 +1 @@
+from .camera_motion import FastCameraMovementEstimator, create_camera_movement_estimator
@@ -0,0 +1,109 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+# CameraMovementEstimator의 특징점 영역(1920px 폭 기준 0~20px, 900~1050px)을 폭 비율로 옮긴 값
+DEFAULT_STRIPS = ((0.0, 20 / 1920), (900 / 1920, 1050 / 1920))
+
+
+class FastCameraMovementEstimator:
+    """축소 흑백 프레임으로 카메라 이동을 구하는 CameraMovementEstimator 대체
+
+    - 프레임 쌍마다 1/scale로 줄인 흑백 영상의 위상 상관(phase correlation)으로 전역 이동을 구하고,
+      응답이 min_response보다 약하면 특징점 영역(strips, 프레임 폭 비율)에서 피라미드 LK 광류로 대체한다.
+    - 프레임 쌍은 서로 독립이므로 workers개 스레드가 구간을 나눠 계산한다.
+    - 출력은 기존 get_camera_movement와 같은 프레임별 [dx, dy] 리스트 (이전 - 현재 좌표,
+      마지막으로 기록한 프레임 이후 누적 이동이 minimum_distance를 넘을 때만 기록, 나머지는 [0, 0]).
+    """
+
+    def __init__(self, frame, scale=0.25, method="phase", min_response=0.1, minimum_distance=5,
+                 strips=DEFAULT_STRIPS, workers=1):
+        self.scale = scale
+        self.method = method
+        self.min_response = min_response
+        self.minimum_distance = minimum_distance
+        self.workers = max(int(workers), 1)
+
+        height, width = self.prepare(frame).shape
+        self.window = cv2.createHanningWindow((width, height), cv2.CV_32F)
+        self.mask = np.zeros((height, width), dtype=np.uint8)
+        for start, end in strips:
+            # 축소 후에도 특징점을 찾을 수 있도록 영역 폭은 최소 8px
+            left = int(start * width)
+            self.mask[:, left:max(int(math.ceil(end * width)), left + 8)] = 1
+        self.features = dict(maxCorners=100, qualityLevel=0.3, minDistance=3, blockSize=7, mask=self.mask)
+        self.lk_params = dict(
+            winSize=(15, 15), maxLevel=3, criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03)
+        )
+
+    def prepare(self, frame):
+        """BGR 프레임 → 축소 흑백 float32"""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if self.scale != 1:
+            gray = cv2.resize(gray, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+        return gray.astype(np.float32)
+
+    def flow_shift(self, prev, cur):
+        """특징점 영역의 LK 광류 중앙값 (prev → cur 이동, 축소 좌표), 특징점이 없으면 None"""
+        prev8, cur8 = prev.astype(np.uint8), cur.astype(np.uint8)
+        points = cv2.goodFeaturesToTrack(prev8, **self.features)
+        if points is None:
+            return None
+        moved, status, _ = cv2.calcOpticalFlowPyrLK(prev8, cur8, points, None, **self.lk_params)
+        ok = status.ravel() == 1
+        if not ok.any():
+            return None
+        return np.median((moved - points).reshape(-1, 2)[ok], axis=0)
+
+    def pair_shift(self, prev, cur):
+        """축소 프레임 한 쌍의 이동량을 원본 좌표의 (이전 - 현재)로 반환"""
+        shift = None
+        if self.method == "phase":
+            (dx, dy), response = cv2.phaseCorrelate(prev, cur, self.window)
+            if response >= self.min_response:
+                shift = np.array([dx, dy])
+        if shift is None:
+            shift = self.flow_shift(prev, cur)
+        if shift is None:
+            return np.zeros(2)
+        return -np.asarray(shift, dtype=np.float64) / self.scale
+
+    def _shifts(self, frames):
+        prepared = [self.prepare(frame) for frame in frames]
+        return [self.pair_shift(prev, cur) for prev, cur in zip(prepared[:-1], prepared[1:])]
+
+    def estimate_shifts(self, frames):
+        """연속 프레임 쌍별 이동량 (len(frames) - 1, 2), 구간을 나눠 병렬 계산 (경계 프레임은 양쪽에 포함)"""
+        if len(frames) < 2:
+            return np.zeros((0, 2))
+        size = math.ceil((len(frames) - 1) / self.workers)
+        chunks = [frames[start:start + size + 1] for start in range(0, len(frames) - 1, size)]
+        if len(chunks) == 1:
+            return np.array(self._shifts(chunks[0]))
+        # cv2 연산은 GIL을 풀어주므로 스레드로 충분
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            return np.array([shift for part in pool.map(self._shifts, chunks) for shift in part])
+
+    def get_camera_movement(self, frames, read_from_stub=False, stub_path=None):
+        """CameraMovementEstimator.get_camera_movement와 같은 형식 (add_adjust_positions_to_tracks 입력)"""
+        camera_movement = [[0, 0]] * len(frames)
+        pending = np.zeros(2)
+        for frame_num, shift in enumerate(self.estimate_shifts(frames), 1):
+            pending += shift
+            if np.hypot(*pending) > self.minimum_distance:
+                camera_movement[frame_num] = pending.tolist()
+                pending = np.zeros(2)
+        return camera_movement
+
+
+def create_camera_movement_estimator(frame, mode="lk", scale=0.25, method="phase", workers=1):
+    """카메라 이동 추정기 생성 (mode: lk=기존 CameraMovementEstimator / fast=FastCameraMovementEstimator)
+
+    설정값만 받으므로 분석 서버와 청크 워커 프로세스가 같은 방식으로 만들 수 있다.
+    """
+    if mode == "fast":
+        return FastCameraMovementEstimator(frame, scale=scale, method=method, workers=workers)
+    from camera_movement_estimator import CameraMovementEstimator
+    return CameraMovementEstimator(frame)
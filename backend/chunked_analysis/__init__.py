@@ -0,0 +1,4 @@
+from .chunk_worker import track_windows, analyze_chunk
+from .track_stitching import match_track_ids, stitch_tracks
+from .chunked_analysis import split_chunks, track_video_chunked, assign_teams_sparse
+from .segment_render import split_segments, render_segment, render_video_segments
@@ -0,0 +1,72 @@
+import os
+
+from camera_motion import create_camera_movement_estimator
+from detectors import create_tracker
+from track_store import TrackStore
+from video_io import VideoReader
+
+
+def init_worker(threads):
+    """워커 프로세스 초기화: 프로세스끼리 코어를 나눠 쓰도록 스레드 수 제한"""
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    import cv2
+    cv2.setNumThreads(1)
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+
+def track_windows(tracker, windows, on_window=None, camera_config=None):
+    """윈도우 단위로 감지/추적/카메라 보정을 수행해서 전체 트랙(TrackStore) 반환
+
+    윈도우의 트랙은 바로 컬럼형 TrackStore로 옮기므로 영상 전체의 트랙 딕셔너리를 만들지 않는다.
+    on_window(window, window_tracks)는 프레임을 버리기 전에 호출되므로
+    팀 배정처럼 원본 프레임이 필요한 처리를 끼워 넣을 수 있다 (window_tracks는 TrackStore 뷰).
+    camera_config는 create_camera_movement_estimator 인자 (없으면 기존 CameraMovementEstimator).
+    """
+    camera_movement_estimator = None
+    parts = []
+    prev_frame = None
+
+    for window in windows:
+        # Tracker는 인스턴스에 추적 상태를 유지하므로 윈도우가 바뀌어도 트랙 ID가 이어짐
+        window_store = TrackStore.from_tracks(
+            tracker.get_object_tracks(window, read_from_stub=False, stub_path=None)
+        )
+        window_store.add_positions()
+
+        if camera_movement_estimator is None:
+            camera_movement_estimator = create_camera_movement_estimator(window[0], **(camera_config or {}))
+            camera_movement = camera_movement_estimator.get_camera_movement(
+                window, read_from_stub=False, stub_path=None
+            )
+        else:
+            # 이전 윈도우의 마지막 프레임을 앞에 붙여 윈도우 경계의 카메라 이동도 계산
+            camera_movement = camera_movement_estimator.get_camera_movement(
+                [prev_frame] + window, read_from_stub=False, stub_path=None
+            )[1:]
+        window_store.adjust_positions(camera_movement)
+
+        if on_window is not None:
+            on_window(window, window_store.view())
+
+        parts.append(window_store)
+        prev_frame = window[-1]
+
+    return TrackStore.concat(parts)
+
+
+def analyze_chunk(video_path, start_frame, end_frame, reader_options, window_size, detector_config,
+                  camera_config=None):
+    """[start_frame, end_frame) 구간의 감지/추적/카메라 보정 (프로세스 풀 워커에서 실행)
+
+    청크마다 새 Tracker를 만들기 때문에 트랙 ID는 청크 안에서만 유효하다 (병합 시 재매칭).
+    """
+    tracker = create_tracker(**detector_config)
+    with VideoReader(video_path, **reader_options) as reader:
+        windows = reader.iter_windows(window_size, start_frame, end_frame)
+        tracks = track_windows(tracker, windows, camera_config=camera_config)
+    print(f"[CHUNK] frames {start_frame}~{end_frame}: {tracks.num_frames} frames tracked ({tracks.nbytes // 1024} KB)")
+    return tracks
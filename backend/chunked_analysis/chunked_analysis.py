@@ -0,0 +1,106 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .chunk_worker import analyze_chunk, init_worker
+from .track_stitching import stitch_tracks
+
+
+def split_chunks(frame_count, num_chunks, overlap):
+    """[(decode_start, end, lead), ...] 청크 경계 계산
+
+    각 청크(첫 청크 제외)는 overlap 프레임 앞에서부터 디코딩해서 앞 청크와 겹치는 구간을 만든다.
+    마지막 청크의 end는 None (영상 끝까지, 메타데이터 프레임 수가 부정확할 수 있으므로).
+    """
+    chunk_len = math.ceil(frame_count / num_chunks)
+    bounds = []
+    for i in range(num_chunks):
+        start = i * chunk_len
+        if start >= frame_count:
+            break
+        decode_start = max(start - overlap, 0)
+        end = None if i == num_chunks - 1 else min(start + chunk_len, frame_count)
+        bounds.append((decode_start, end, start - decode_start))
+    return bounds
+
+
+def track_video_chunked(video_path, frame_count, workers, detector_config, reader_options,
+                        window_size=240, overlap=24, progress=None, camera_config=None):
+    """영상을 시간 구간으로 나눠 프로세스 풀에서 감지/추적/카메라 보정 후 트랙 ID를 이어 붙임
+
+    청크 결과는 컬럼형 TrackStore라서 프로세스 간 전달(pickle) 비용도 작다.
+
+    progress(done_chunks, total_chunks)로 진행 상황을 알린다.
+    """
+    bounds = split_chunks(frame_count, workers, overlap)
+    threads = max((os.cpu_count() or 1) // len(bounds), 1)
+    results = [None] * len(bounds)
+
+    # torch/스레드를 가진 부모 프로세스를 fork하지 않도록 spawn 사용
+    with ProcessPoolExecutor(
+        max_workers=len(bounds),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(threads,),
+    ) as pool:
+        futures = {
+            pool.submit(
+                analyze_chunk, video_path, decode_start, end, reader_options, window_size, detector_config,
+                camera_config,
+            ): i
+            for i, (decode_start, end, _) in enumerate(bounds)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if progress:
+                progress(done, len(bounds))
+
+    return stitch_tracks([(lead, tracks) for (_, _, lead), tracks in zip(bounds, results)])
+
+
+def assign_teams_sparse(reader, tracks, team_classifier):
+    """병합된 트랙(TrackStore)에 팀 배정
+
+    영상 전체에서 고르게 뽑은 학습 프레임, 각 선수가 처음 등장한 프레임, 재판정 주기 프레임만
+    한 번에 디코딩해서 선수별 특징을 구한 뒤, 학습 → 프레임 순 판정을 하고
+    나머지 행에는 선수별 최종 판정을 배열로 채워 넣는다.
+    """
+    players = tracks["players"]
+    data = players.data
+    if len(data) == 0:
+        return team_classifier
+
+    # 행이 프레임 순으로 정렬되어 있으므로 ID별 첫 행이 첫 등장 프레임
+    ids, first_rows, inverse = np.unique(data["track_id"], return_index=True, return_inverse=True)
+    fit_frames = set() if team_classifier.fitted else set(team_classifier.sample_indices(players.num_frames))
+    check_frames = set(data["frame"][first_rows].tolist())
+    check_frames |= set(range(0, players.num_frames, team_classifier.revalidate_interval))
+
+    features = {}
+    for frame_num, frame in reader.frames_at(fit_frames | check_frames):
+        features[frame_num] = team_classifier.frame_features(frame, data["bbox"][players.frame_rows(frame_num)])
+
+    if not team_classifier.fitted:
+        samples = [features[f] for f in sorted(fit_frames) if f in features]
+        if samples:
+            team_classifier.fit_features(
+                np.concatenate([hist for hist, _ in samples]), np.concatenate([colors for _, colors in samples])
+            )
+        if not team_classifier.fitted:
+            return team_classifier
+
+    for frame_num in sorted(check_frames & set(features)):
+        track_ids = data["track_id"][players.frame_rows(frame_num)].tolist()
+        need = team_classifier.pending(track_ids, frame_num)
+        if need:
+            hist, _ = features[frame_num]
+            team_classifier.vote([track_ids[i] for i in need], hist[need], frame_num)
+
+    teams = np.array([team_classifier.decision(player_id) for player_id in ids.tolist()], dtype=np.int8)[inverse]
+    assigned = teams > 0
+    players.set_column("team", teams[assigned], assigned)
+    players.set_column("team_color", team_classifier.color_table()[teams[assigned]], assigned)
+    return team_classifier
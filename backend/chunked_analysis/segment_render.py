@@ -0,0 +1,123 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from detectors import create_drawing_tracker, draw_window_annotations
+from overlay import OverlayCompositor
+from video_io import VideoReader, FFmpegVideoWriter, concat_videos
+
+from .chunk_worker import init_worker
+
+
+def split_segments(frame_count, num_segments, keyframes=(), min_frames=1):
+    """[(start, end), ...] 렌더링 구간 계산
+
+    균등 분할 경계에서 구간 길이의 1/4 이내에 원본 키프레임이 있으면 그 위치로 맞춰서
+    워커가 구간 시작으로 탐색(seek)한 뒤 버리는 디코딩을 줄인다.
+    min_frames보다 짧은 구간은 만들지 않는다.
+    """
+    segment_len = math.ceil(frame_count / max(num_segments, 1))
+    keyframes = np.asarray(keyframes, dtype=np.int64)
+    starts = [0]
+    for i in range(1, num_segments):
+        boundary = i * segment_len
+        if len(keyframes):
+            nearest = int(keyframes[np.argmin(np.abs(keyframes - boundary))])
+            if abs(nearest - boundary) <= segment_len // 4:
+                boundary = nearest
+        if boundary - starts[-1] >= min_frames and frame_count - boundary >= min_frames:
+            starts.append(boundary)
+    return list(zip(starts, starts[1:] + [frame_count]))
+
+
+def render_segment(video_path, output_path, start_frame, end_frame, tracks, team_ball_control, timeline,
+                   reader_options, window_size, writer_config, fps, model_path="models/best.pt",
+                   font_path="fonts/NanumGothic.ttf", cache_size=256, overlay_enabled=True):
+    """[start_frame, end_frame) 구간을 다시 디코딩해서 주석/오버레이를 그리고 H.264 조각으로 인코딩
+    (프로세스 풀 워커에서 실행)
+
+    tracks는 이 구간만 잘라낸 TrackStore(프레임 번호 0부터)이고, timeline은 전체 영상 기준
+    OverlayTimeline이라 점유율/해설/이벤트 문구는 원래 프레임 번호만으로 앞 구간과 이어진다.
+    overlay_enabled가 False(OVERLAY_ENABLED=0)면 직렬 경로처럼 Tracker가 점유율 박스를 그리고 오버레이는 생략한다.
+    """
+    # 그리기만 하므로 감지 모델은 로드하지 않음
+    tracker = create_drawing_tracker(model_path)
+    compositor = None
+    if overlay_enabled:
+        # 점유율 패널은 프레임 0부터 누적하는 Tracker 대신 미리 계산한 timeline으로 그림
+        tracker.draw_team_ball_control = lambda frame, frame_num, team_ball_control: frame
+        compositor = OverlayCompositor(font_path, cache_size)
+    view = tracks.view()
+    start = 0
+
+    with VideoReader(video_path, **reader_options) as reader, \
+            FFmpegVideoWriter(output_path, fps=fps, **writer_config) as writer:
+        for window in reader.iter_windows(window_size, start_frame, end_frame):
+            end = start + len(window)
+            window_tracks = {key: frames[start:end] for key, frames in view.items()}
+            annotated = draw_window_annotations(
+                tracker, window, window_tracks, team_ball_control, start_frame + start,
+            )
+            if compositor is not None:
+                for frame_num, frame in enumerate(annotated, start_frame + start):
+                    compositor.compose(frame, timeline, frame_num)
+            writer.write(annotated)
+            start = end
+    return writer.frame_count
+
+
+def render_video_segments(video_path, output_path, tracks, team_ball_control, timeline, workers, reader_options,
+                          window_size=240, writer_config=None, fps=24, model_path="models/best.pt",
+                          font_path="fonts/NanumGothic.ttf", cache_size=256, min_frames=480, progress=None,
+                          overlay_enabled=True):
+    """결과 영상을 시간 구간으로 나눠 프로세스 풀에서 그리기/인코딩한 뒤 재인코딩 없이 이어 붙임
+
+    구간마다 같은 libx264 설정으로 인코딩하고 각 조각은 키프레임으로 시작하므로
+    concat demuxer의 스트림 복사만으로 하나의 mp4가 된다.
+    writer_config는 FFmpegVideoWriter 인자(preset/crf/threads), progress(done, total)로 진행 상황을 알린다.
+    overlay_enabled가 False면 timeline은 쓰지 않는다 (None 가능).
+    """
+    frame_count = tracks.num_frames
+    with VideoReader(video_path, **reader_options) as reader:
+        keyframes = reader.keyframes()
+    bounds = split_segments(frame_count, workers, keyframes, min_frames)
+    threads = max((os.cpu_count() or 1) // len(bounds), 1)
+    writer_config = dict(writer_config or {})
+    if not writer_config.get("threads"):
+        writer_config["threads"] = threads
+
+    base = output_path.rsplit(".", 1)[0]
+    paths = [f"{base}_part{i:03d}.mp4" for i in range(len(bounds))]
+    counts = [0] * len(bounds)
+    try:
+        # 부모 프로세스를 fork하지 않도록 spawn 사용 (track_video_chunked와 동일)
+        with ProcessPoolExecutor(
+            max_workers=len(bounds),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=(threads,),
+        ) as pool:
+            futures = {
+                pool.submit(
+                    render_segment, video_path, path, start, end, tracks.slice_frames(start, end),
+                    team_ball_control, timeline, reader_options, window_size, writer_config, fps,
+                    model_path, font_path, cache_size, overlay_enabled,
+                ): i
+                for i, (path, (start, end)) in enumerate(zip(paths, bounds))
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                counts[futures[future]] = future.result()
+                if progress:
+                    progress(done, len(bounds))
+
+        concat_videos(paths, output_path)
+    finally:
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    print(f"[RENDER] {len(bounds)} segments {bounds}, {sum(counts)} frames")
+    return sum(counts)
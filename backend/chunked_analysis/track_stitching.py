@@ -0,0 +1,81 @@
+import numpy as np
+
+from track_store import TrackStore, ObjectTracks, FramesView
+
+
+def _bbox_iou(a, b):
+    x1, y1 = max(a[0], b[0]), max(a[1], b[1])
+    x2, y2 = min(a[2], b[2]), min(a[3], b[3])
+    inter = max(x2 - x1, 0) * max(y2 - y1, 0)
+    if inter == 0:
+        return 0.0
+    area_a = (a[2] - a[0]) * (a[3] - a[1])
+    area_b = (b[2] - b[0]) * (b[3] - b[1])
+    return inter / (area_a + area_b - inter)
+
+
+def match_track_ids(prev_frames, next_frames, min_iou=0.3):
+    """겹치는 구간의 같은 프레임들에서 bbox IoU 평균이 높은 순으로 트랙 ID 매칭
+
+    반환: {next_id: prev_id}
+    """
+    iou_sum = {}
+    for prev_frame, next_frame in zip(prev_frames, next_frames):
+        for prev_id, prev_track in prev_frame.items():
+            for next_id, next_track in next_frame.items():
+                iou = _bbox_iou(prev_track["bbox"], next_track["bbox"])
+                if iou > 0:
+                    iou_sum[(next_id, prev_id)] = iou_sum.get((next_id, prev_id), 0.0) + iou
+
+    overlap = max(min(len(prev_frames), len(next_frames)), 1)
+    mapping, used = {}, set()
+    for (next_id, prev_id), total in sorted(iou_sum.items(), key=lambda item: -item[1]):
+        if total / overlap < min_iou:
+            break
+        if next_id in mapping or prev_id in used:
+            continue
+        mapping[next_id] = prev_id
+        used.add(prev_id)
+    return mapping
+
+
+def stitch_tracks(chunks, min_iou=0.3, fixed_id_keys=("ball",)):
+    """청크별 트랙(TrackStore)을 하나로 합침
+
+    chunks: [(lead, tracks), ...] (lead = 앞 청크와 겹치는 앞부분 프레임 수)
+    겹치는 프레임은 앞 청크 결과를 쓰고, 뒤 청크의 트랙 ID는 겹치는 구간에서 매칭된 앞 청크 ID로,
+    매칭되지 않은 ID는 새 ID로 바꾼다. 공처럼 ID가 고정된 트랙은 그대로 이어 붙인다.
+    """
+    parts = {}
+    next_ids = {}
+
+    for lead, tracks in chunks:
+        if not parts:
+            for key, objects in tracks.items():
+                parts[key] = [objects]
+                next_ids[key] = int(objects.data["track_id"].max(initial=0)) + 1
+            continue
+
+        for key, objects in tracks.items():
+            rest = objects.slice_frames(lead)
+            if key in fixed_id_keys:
+                parts[key].append(rest)
+                continue
+
+            prev = parts[key][-1]
+            overlap = min(lead, prev.num_frames, objects.num_frames)
+            mapping = match_track_ids(
+                FramesView(prev)[prev.num_frames - overlap:], FramesView(objects)[:overlap], min_iou
+            )
+            # 매칭 안 된 ID는 처음 등장한 순서대로 새 ID 부여
+            ids = rest.data["track_id"]
+            _, first = np.unique(ids, return_index=True)
+            for tid in ids[np.sort(first)].tolist():
+                if tid not in mapping:
+                    mapping[tid] = next_ids[key]
+                    next_ids[key] += 1
+            parts[key].append(rest.relabel(mapping))
+
+    if not parts:
+        return TrackStore.empty()
+    return TrackStore({key: ObjectTracks.concat(key_parts) for key, key_parts in parts.items()})
@@ -0,0 +1,3 @@
+from .batched_detector import BatchedDetector, OnnxDetector, OpenVinoDetector, load_detector, attach_detector
+from .keyframe_detector import KeyframeDetector
+from .tracker_factory import create_tracker, create_drawing_tracker, draw_window_annotations
@@ -0,0 +1,242 @@
+import ast
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+
+
+def letterbox(image, size=640, pad_value=114):
+    """ultralytics와 동일한 방식으로 비율 유지 리사이즈 + 패딩
+
+    반환: (패딩된 이미지, 배율, (left, top) 패딩)
+    """
+    h, w = image.shape[:2]
+    r = min(size / h, size / w)
+    new_w, new_h = int(round(w * r)), int(round(h * r))
+    dw, dh = (size - new_w) / 2, (size - new_h) / 2
+    if (new_w, new_h) != (w, h):
+        image = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    top, bottom = int(round(dh - 0.1)), int(round(dh + 0.1))
+    left, right = int(round(dw - 0.1)), int(round(dw + 0.1))
+    image = cv2.copyMakeBorder(
+        image, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(pad_value,) * 3
+    )
+    return image, r, (left, top)
+
+
+def nms(boxes, scores, iou_threshold):
+    """numpy NMS (boxes: xyxy) → 남길 인덱스 (점수 내림차순)"""
+    x1, y1, x2, y2 = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    areas = (x2 - x1) * (y2 - y1)
+    order = scores.argsort()[::-1]
+    keep = []
+    while order.size > 0:
+        i = order[0]
+        keep.append(i)
+        xx1 = np.maximum(x1[i], x1[order[1:]])
+        yy1 = np.maximum(y1[i], y1[order[1:]])
+        xx2 = np.minimum(x2[i], x2[order[1:]])
+        yy2 = np.minimum(y2[i], y2[order[1:]])
+        inter = np.clip(xx2 - xx1, 0, None) * np.clip(yy2 - yy1, 0, None)
+        iou = inter / (areas[i] + areas[order[1:]] - inter + 1e-9)
+        order = order[1:][iou <= iou_threshold]
+    return np.array(keep, dtype=np.int64)
+
+
+def box_iou(a, b):
+    """(n, 4) x (m, 4) → (n, m) IoU 행렬"""
+    tl = np.maximum(a[:, None, :2], b[None, :, :2])
+    br = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    inter = np.prod(np.clip(br - tl, 0, None), axis=2)
+    area_a = np.prod(a[:, 2:] - a[:, :2], axis=1)
+    area_b = np.prod(b[:, 2:] - b[:, :2], axis=1)
+    return inter / (area_a[:, None] + area_b[None, :] - inter + 1e-9)
+
+
+def make_results(frames, detections, names):
+    """프레임별 (n, 6) 배열 → ultralytics Results 리스트"""
+    import torch
+    from ultralytics.engine.results import Results
+
+    return [
+        Results(orig_img=frame, path="", names=names, boxes=torch.from_numpy(det))
+        for frame, det in zip(frames, detections)
+    ]
+
+
+class BatchedDetector:
+    """내보낸(export) YOLOv8 모델을 고정 크기 배치로 실행하는 CPU 감지기 베이스
+
+    Tracker가 사용하는 ultralytics YOLO 객체 자리에 그대로 끼울 수 있도록
+    predict()/__call__()이 ultralytics Results 리스트를 반환하고 names 속성을 가진다.
+    하위 클래스는 _infer(batch) 만 구현하면 된다.
+    """
+
+    # ultralytics NMS의 클래스별 오프셋과 동일
+    MAX_WH = 7680
+
+    def __init__(self, names, imgsz=640, batch_size=8, conf=0.1, iou=0.7, max_det=300):
+        self.names = names
+        self.imgsz = imgsz
+        self.batch_size = batch_size
+        self.conf = conf
+        self.iou = iou
+        self.max_det = max_det
+        self.inference_time = 0.0
+
+    def _infer(self, batch):
+        """(B, 3, imgsz, imgsz) float32 → (B, 4 + nc, N) 원시 출력"""
+        raise NotImplementedError
+
+    def _preprocess(self, frames):
+        batch = np.zeros((self.batch_size, 3, self.imgsz, self.imgsz), dtype=np.float32)
+        meta = []
+        for i, frame in enumerate(frames):
+            image, ratio, pad = letterbox(frame, self.imgsz)
+            batch[i] = image[:, :, ::-1].transpose(2, 0, 1) / 255.0
+            meta.append((ratio, pad, frame.shape[:2]))
+        return batch, meta
+
+    def _postprocess(self, pred, ratio, pad, shape, conf):
+        pred = pred.T  # (N, 4 + nc)
+        scores = pred[:, 4:]
+        cls = scores.argmax(axis=1)
+        confidence = scores[np.arange(len(cls)), cls]
+        mask = confidence > conf
+        if not mask.any():
+            return np.zeros((0, 6), dtype=np.float32)
+
+        xywh, cls, confidence = pred[mask, :4], cls[mask], confidence[mask]
+        boxes = np.empty_like(xywh)
+        boxes[:, :2] = xywh[:, :2] - xywh[:, 2:] / 2
+        boxes[:, 2:] = xywh[:, :2] + xywh[:, 2:] / 2
+
+        keep = nms(boxes + cls[:, None] * self.MAX_WH, confidence, self.iou)[: self.max_det]
+        boxes, cls, confidence = boxes[keep], cls[keep], confidence[keep]
+
+        boxes[:, [0, 2]] -= pad[0]
+        boxes[:, [1, 3]] -= pad[1]
+        boxes /= ratio
+        boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, shape[1])
+        boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, shape[0])
+        return np.concatenate(
+            [boxes, confidence[:, None], cls[:, None].astype(np.float32)], axis=1
+        ).astype(np.float32)
+
+    def detect(self, frames, conf=None):
+        """프레임 리스트 → 프레임별 (n, 6) 배열 [x1, y1, x2, y2, conf, cls]"""
+        conf = self.conf if conf is None else conf
+        results = []
+        for start in range(0, len(frames), self.batch_size):
+            chunk = frames[start:start + self.batch_size]
+            # 정적 배치로 내보낸 모델이므로 마지막 배치는 0으로 채워서 실행
+            batch, meta = self._preprocess(chunk)
+            t0 = time.perf_counter()
+            preds = self._infer(batch)
+            self.inference_time += time.perf_counter() - t0
+            for i, (ratio, pad, shape) in enumerate(meta):
+                results.append(self._postprocess(preds[i], ratio, pad, shape, conf))
+        return results
+
+    def predict(self, source, conf=None, **kwargs):
+        """ultralytics YOLO.predict 호환 인터페이스"""
+        frames = source if isinstance(source, (list, tuple)) else [source]
+        return make_results(frames, self.detect(frames, conf), self.names)
+
+    __call__ = predict
+
+
+class OnnxDetector(BatchedDetector):
+    """ONNX Runtime CPU 감지기 (int8 양자화 모델도 그대로 사용 가능)"""
+
+    def __init__(self, model_path, batch_size=8, intra_op_threads=0, **kwargs):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_name = self.session.get_inputs()[0].name
+
+        # ultralytics export는 메타데이터에 names/imgsz를 문자열로 기록함
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        names = ast.literal_eval(metadata["names"]) if "names" in metadata else {}
+        input_shape = self.session.get_inputs()[0].shape
+        imgsz = input_shape[2] if isinstance(input_shape[2], int) else 640
+        # 배치 차원이 고정이면 그 크기를 따름
+        if isinstance(input_shape[0], int):
+            batch_size = input_shape[0]
+        super().__init__(names, imgsz=imgsz, batch_size=batch_size, **kwargs)
+
+    def _infer(self, batch):
+        return self.session.run(None, {self.input_name: batch})[0]
+
+
+class OpenVinoDetector(BatchedDetector):
+    """OpenVINO CPU 감지기 (ultralytics format="openvino" 내보내기 폴더 또는 .xml)"""
+
+    def __init__(self, model_path, batch_size=8, intra_op_threads=0, **kwargs):
+        import openvino as ov
+        import yaml
+
+        if os.path.isdir(model_path):
+            model_dir = model_path
+            model_path = next(
+                os.path.join(model_dir, f) for f in os.listdir(model_dir) if f.endswith(".xml")
+            )
+        else:
+            model_dir = os.path.dirname(model_path)
+
+        names, imgsz = {}, 640
+        metadata_path = os.path.join(model_dir, "metadata.yaml")
+        if os.path.exists(metadata_path):
+            with open(metadata_path) as f:
+                metadata = yaml.safe_load(f)
+            names = metadata.get("names", {})
+            imgsz = metadata.get("imgsz", [640])[0]
+            batch_size = metadata.get("batch", batch_size)
+
+        core = ov.Core()
+        config = {"PERFORMANCE_HINT": "THROUGHPUT"}
+        if intra_op_threads:
+            config["INFERENCE_NUM_THREADS"] = intra_op_threads
+        self.compiled_model = core.compile_model(model_path, "CPU", config)
+        # 레지스트리로 여러 작업이 공유하므로 infer request는 스레드별로 생성
+        self._local = threading.local()
+        super().__init__(names, imgsz=imgsz, batch_size=batch_size, **kwargs)
+
+    def _infer(self, batch):
+        request = getattr(self._local, "request", None)
+        if request is None:
+            request = self._local.request = self.compiled_model.create_infer_request()
+        request.infer({0: batch})
+        return request.get_output_tensor(0).data.copy()
+
+
+DETECTOR_BACKENDS = {
+    "onnx": OnnxDetector,
+    "openvino": OpenVinoDetector,
+}
+
+
+def load_detector(backend, model_path, batch_size=8, intra_op_threads=0, **kwargs):
+    """backend 이름("onnx"/"openvino")으로 감지기 생성"""
+    if backend not in DETECTOR_BACKENDS:
+        raise ValueError(f"지원하지 않는 감지기 백엔드: {backend}")
+    detector = DETECTOR_BACKENDS[backend](
+        model_path, batch_size=batch_size, intra_op_threads=intra_op_threads, **kwargs
+    )
+    print(f"[DETECTOR] {backend} backend loaded: {model_path} (batch={detector.batch_size})")
+    return detector
+
+
+def attach_detector(tracker, detector):
+    """Tracker의 YOLO 모델을 감지기로 교체 (트랙 구조는 그대로 유지)"""
+    tracker.model = detector
+    return tracker
@@ -0,0 +1,94 @@
+"""YOLOv8 best.pt → CPU 감지기용 모델 내보내기
+
+사용 예:
+    python -m detectors.export_model --format onnx --batch 8
+    python -m detectors.export_model --format onnx --batch 8 --int8 --calib-video sample.mp4
+    python -m detectors.export_model --format openvino --batch 8 --int8 --data data.yaml
+"""
+import argparse
+import os
+
+import numpy as np
+
+from .batched_detector import letterbox
+
+
+def export(weights, fmt, imgsz, batch, int8=False, data=None):
+    from ultralytics import YOLO
+
+    model = YOLO(weights)
+    kwargs = {"format": fmt, "imgsz": imgsz, "batch": batch, "dynamic": False}
+    if fmt == "openvino" and int8:
+        # OpenVINO int8은 ultralytics가 NNCF로 데이터셋 기반 보정까지 수행
+        kwargs.update({"int8": True, "data": data})
+    return model.export(**kwargs)
+
+
+def calibration_batches(video_path, imgsz, batch, num_batches=16):
+    """보정용 영상에서 프레임을 고르게 뽑아 입력 배치 생성"""
+    from video_io import VideoReader
+
+    with VideoReader(video_path, max_height=None) as reader:
+        step = max(reader.frame_count // (batch * num_batches), 1)
+        images = []
+        for i, frame in enumerate(reader.frames()):
+            if i % step:
+                continue
+            image, _, _ = letterbox(frame, imgsz)
+            images.append(image[:, :, ::-1].transpose(2, 0, 1) / 255.0)
+            if len(images) >= batch * num_batches:
+                break
+    for start in range(0, len(images) - batch + 1, batch):
+        yield np.stack(images[start:start + batch]).astype(np.float32)
+
+
+def quantize_onnx(onnx_path, calib_video, imgsz, batch):
+    """ONNX 모델을 영상 프레임으로 보정해서 int8 정적 양자화"""
+    from onnxruntime.quantization import (
+        CalibrationDataReader, QuantFormat, QuantType, quantize_static,
+    )
+
+    class VideoCalibrationReader(CalibrationDataReader):
+        def __init__(self, input_name):
+            self.input_name = input_name
+            self.batches = calibration_batches(calib_video, imgsz, batch)
+
+        def get_next(self):
+            batch_data = next(self.batches, None)
+            return None if batch_data is None else {self.input_name: batch_data}
+
+    import onnxruntime as ort
+    input_name = ort.InferenceSession(onnx_path, providers=["CPUExecutionProvider"]).get_inputs()[0].name
+
+    output_path = onnx_path.replace(".onnx", "_int8.onnx")
+    quantize_static(
+        onnx_path, output_path, VideoCalibrationReader(input_name),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=True,
+    )
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YOLO 모델을 ONNX/OpenVINO로 내보내기")
+    parser.add_argument("--weights", default=os.path.join("models", "best.pt"))
+    parser.add_argument("--format", choices=["onnx", "openvino"], default="onnx")
+    parser.add_argument("--imgsz", type=int, default=640)
+    parser.add_argument("--batch", type=int, default=8)
+    parser.add_argument("--int8", action="store_true")
+    parser.add_argument("--calib-video", help="ONNX int8 보정용 영상")
+    parser.add_argument("--data", help="OpenVINO int8 보정용 데이터셋 yaml")
+    args = parser.parse_args()
+
+    output = export(args.weights, args.format, args.imgsz, args.batch, args.int8, args.data)
+    if args.format == "onnx" and args.int8:
+        if not args.calib_video:
+            parser.error("ONNX int8 양자화에는 --calib-video 가 필요합니다")
+        output = quantize_onnx(output, args.calib_video, args.imgsz, args.batch)
+    print(f"[EXPORT] {output}")
+
+
+if __name__ == "__main__":
+    main()
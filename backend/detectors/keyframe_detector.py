@@ -0,0 +1,162 @@
+import cv2
+import numpy as np
+
+from .batched_detector import BatchedDetector, make_results
+
+
+def _to_array(result):
+    """ultralytics Results → (n, 6) [x1, y1, x2, y2, conf, cls]"""
+    data = result.boxes.data
+    data = data.cpu().numpy() if hasattr(data, "cpu") else np.asarray(data)
+    return data[:, :6].astype(np.float32)
+
+
+def _match(a, b, max_shift):
+    """같은 클래스끼리 중심 이동량이 작은 순으로 greedy 매칭 → [(i, j), ...]
+
+    이동량은 박스 대각선 길이로 정규화하므로 공처럼 작은 박스도 IoU 없이 매칭된다.
+    """
+    if len(a) == 0 or len(b) == 0:
+        return []
+    center_a = (a[:, :2] + a[:, 2:4]) / 2
+    center_b = (b[:, :2] + b[:, 2:4]) / 2
+    diag = np.linalg.norm(a[:, 2:4] - a[:, :2], axis=1)
+    shift = np.linalg.norm(center_a[:, None] - center_b[None], axis=2) / (diag[:, None] + 1e-6)
+    shift[a[:, None, 5] != b[None, :, 5]] = np.inf
+    pairs = []
+    used_a, used_b = set(), set()
+    for flat in np.argsort(shift, axis=None):
+        i, j = np.unravel_index(flat, shift.shape)
+        if shift[i, j] > max_shift:
+            break
+        if i in used_a or j in used_b:
+            continue
+        used_a.add(i)
+        used_b.add(j)
+        pairs.append((i, j))
+    return pairs
+
+
+class KeyframeDetector:
+    """키프레임에서만 감지를 돌리고 사이 프레임은 박스를 보간하는 감지기 래퍼
+
+    - 키프레임: max_interval 프레임마다, 또는 직전 키프레임 대비 화면 변화량이
+      motion_threshold를 넘을 때. 배치(predict 호출)의 마지막 프레임은 항상 키프레임.
+    - 사이 프레임: 양쪽 키프레임에서 매칭된 박스를 등속 모델로 선형 보간.
+    - 양쪽 키프레임 중 하나라도 불확실하면(공 미감지, 매칭 실패 비율 높음, 평균 신뢰도 낮음)
+      그 구간은 모든 프레임을 감지해서 정확도를 유지.
+
+    감지 결과를 Tracker에 그대로 넘기므로 tracks['players']/tracks['ball'] 구조는 변하지 않는다.
+    """
+
+    def __init__(self, model, max_interval=3, motion_threshold=0.03, max_shift=1.0,
+                 max_unmatched_ratio=0.3, min_mean_conf=0.3, ball_class="ball", motion_width=160):
+        self.model = model
+        self.names = model.names
+        self.max_interval = max_interval
+        self.motion_threshold = motion_threshold
+        self.max_shift = max_shift
+        self.max_unmatched_ratio = max_unmatched_ratio
+        self.min_mean_conf = min_mean_conf
+        self.motion_width = motion_width
+        names = model.names.items() if isinstance(model.names, dict) else enumerate(model.names)
+        self.ball_class_id = next((k for k, v in names if v == ball_class), None)
+
+        self.frames_total = 0
+        self.frames_detected = 0
+
+    def _detect(self, frames, conf):
+        if not frames:
+            return []
+        if isinstance(self.model, BatchedDetector):
+            return self.model.detect(frames, conf)
+        kwargs = {"conf": conf} if conf is not None else {}
+        return [_to_array(r) for r in self.model.predict(frames, verbose=False, **kwargs)]
+
+    def _small_gray(self, frame):
+        h, w = frame.shape[:2]
+        size = (self.motion_width, max(int(h * self.motion_width / w), 1))
+        return cv2.cvtColor(cv2.resize(frame, size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+
+    def _select_keyframes(self, frames):
+        keyframes = [0]
+        key_gray = self._small_gray(frames[0])
+        for i in range(1, len(frames)):
+            gray = self._small_gray(frames[i])
+            motion = cv2.absdiff(gray, key_gray).mean() / 255.0
+            if i - keyframes[-1] >= self.max_interval or motion > self.motion_threshold:
+                keyframes.append(i)
+                key_gray = gray
+        if keyframes[-1] != len(frames) - 1:
+            keyframes.append(len(frames) - 1)
+        return keyframes
+
+    def _is_uncertain(self, det):
+        if len(det) == 0:
+            return True
+        if self.ball_class_id is not None and not (det[:, 5] == self.ball_class_id).any():
+            return True
+        return float(det[:, 4].mean()) < self.min_mean_conf
+
+    def _interpolate(self, a, b, pairs, t):
+        """키프레임 a → b 사이 비율 t 지점의 박스 (매칭 안 된 박스는 가까운 쪽 키프레임 유지)"""
+        rows = []
+        matched_a = {i for i, _ in pairs}
+        matched_b = {j for _, j in pairs}
+        for i, j in pairs:
+            row = a[i].copy()
+            row[:4] = a[i, :4] + (b[j, :4] - a[i, :4]) * t
+            row[4] = min(a[i, 4], b[j, 4])
+            rows.append(row)
+        if t < 0.5:
+            rows.extend(a[i] for i in range(len(a)) if i not in matched_a)
+        else:
+            rows.extend(b[j] for j in range(len(b)) if j not in matched_b)
+        if not rows:
+            return np.zeros((0, 6), dtype=np.float32)
+        return np.stack(rows).astype(np.float32)
+
+    def detect(self, frames, conf=None):
+        if not frames:
+            return []
+        keyframes = self._select_keyframes(frames)
+        detections = [None] * len(frames)
+        for i, det in zip(keyframes, self._detect([frames[i] for i in keyframes], conf)):
+            detections[i] = det
+
+        # 불확실한 구간은 전부 감지 (한 번에 배치로)
+        dense = []
+        segments = []
+        for k0, k1 in zip(keyframes, keyframes[1:]):
+            if k1 - k0 < 2:
+                continue
+            a, b = detections[k0], detections[k1]
+            pairs = _match(a, b, self.max_shift)
+            unmatched = (len(a) + len(b) - 2 * len(pairs)) / max(len(a) + len(b), 1)
+            if self._is_uncertain(a) or self._is_uncertain(b) or unmatched > self.max_unmatched_ratio:
+                dense.extend(range(k0 + 1, k1))
+            else:
+                segments.append((k0, k1, pairs))
+
+        for i, det in zip(dense, self._detect([frames[i] for i in dense], conf)):
+            detections[i] = det
+
+        for k0, k1, pairs in segments:
+            for i in range(k0 + 1, k1):
+                t = (i - k0) / (k1 - k0)
+                detections[i] = self._interpolate(detections[k0], detections[k1], pairs, t)
+
+        self.frames_total += len(frames)
+        self.frames_detected += len(keyframes) + len(dense)
+        return detections
+
+    def predict(self, source, conf=None, **kwargs):
+        """ultralytics YOLO.predict 호환 인터페이스"""
+        frames = source if isinstance(source, (list, tuple)) else [source]
+        return make_results(frames, self.detect(list(frames), conf), self.names)
+
+    __call__ = predict
+
+    @property
+    def detection_ratio(self):
+        return self.frames_detected / max(self.frames_total, 1)
@@ -0,0 +1,151 @@
+"""PyTorch(best.pt) 경로와 CPU 감지기 백엔드의 결과 비교
+
+같은 프레임에 대해 두 경로의 감지 결과와 Tracker 트랙을 비교해서
+박스 매칭률/평균 IoU, 프레임별 트랙 수 차이, 트랙 ID 일치율을 출력한다.
+허용 범위를 벗어나면 exit code 1 (tests/test_detector_parity.py가 같은 검사를 pytest로 실행).
+
+사용 예:
+    python -m detectors.parity --video sample.mp4 --backend onnx --model models/best.onnx
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from .batched_detector import box_iou, load_detector, attach_detector
+
+
+def compare_detections(reference, candidate, iou_threshold=0.5):
+    """프레임별 감지 결과 비교 → (매칭률, 평균 IoU)"""
+    matched, total, ious = 0, 0, []
+    for ref, cand in zip(reference, candidate):
+        total += len(ref)
+        if len(ref) == 0 or len(cand) == 0:
+            continue
+        iou = box_iou(ref[:, :4], cand[:, :4])
+        same_class = ref[:, None, 5] == cand[None, :, 5]
+        best = np.where(same_class, iou, 0).max(axis=1)
+        matched += int((best >= iou_threshold).sum())
+        ious.extend(best[best >= iou_threshold].tolist())
+    return matched / max(total, 1), float(np.mean(ious)) if ious else 0.0
+
+
+def _bbox_iou(a, b):
+    return float(box_iou(np.asarray([a[:4]], dtype=np.float32), np.asarray([b[:4]], dtype=np.float32))[0, 0])
+
+
+def compare_tracks(reference, candidate, iou_threshold=0.5):
+    """트랙 딕셔너리 비교 → {key: {"frames", "max_count_diff", "id_match", ...}}
+
+    - max_count_diff: 프레임별 트랙 수 차이의 최댓값
+    - id_match: 기준 트랙 중 같은 프레임에 같은 ID로 IoU >= iou_threshold인 트랙이 있는 비율
+    """
+    report = {}
+    for key, ref_frames in reference.items():
+        cand_frames = candidate.get(key, [])
+        count_diff, matched, total = 0, 0, 0
+        for ref, cand in zip(ref_frames, cand_frames):
+            count_diff = max(count_diff, abs(len(ref) - len(cand)))
+            for track_id, track in ref.items():
+                total += 1
+                other = cand.get(track_id)
+                if other is not None and _bbox_iou(track["bbox"], other["bbox"]) >= iou_threshold:
+                    matched += 1
+        report[key] = {
+            "frames": (len(ref_frames), len(cand_frames)),
+            "tracks": (sum(len(f) for f in ref_frames), sum(len(f) for f in cand_frames)),
+            "max_count_diff": count_diff,
+            "id_match": matched / total if total else 1.0,
+        }
+    return report
+
+
+def run_parity(video_path, weights, backend, model_path, num_frames=120, batch_size=8, threads=0):
+    """num_frames 프레임으로 PyTorch 경로와 백엔드 감지기를 비교 → 결과 딕셔너리"""
+    from trackers import Tracker
+    from video_io import VideoReader
+
+    with VideoReader(video_path) as reader:
+        frames = []
+        for frame in reader.frames():
+            frames.append(frame)
+            if len(frames) >= num_frames:
+                break
+
+    detector = load_detector(backend, model_path, batch_size, threads)
+
+    torch_tracker = Tracker(weights)
+    t0 = time.perf_counter()
+    reference = [
+        r.boxes.data.cpu().numpy() for r in torch_tracker.model.predict(frames, conf=detector.conf, verbose=False)
+    ]
+    torch_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    candidate = detector.detect(frames)
+    backend_time = time.perf_counter() - t0
+    match_rate, mean_iou = compare_detections(reference, candidate)
+
+    # 같은 프레임으로 트랙 구조/ID까지 비교
+    torch_tracks = torch_tracker.get_object_tracks(frames, read_from_stub=False, stub_path=None)
+    backend_tracker = attach_detector(Tracker(weights), detector)
+    backend_tracks = backend_tracker.get_object_tracks(frames, read_from_stub=False, stub_path=None)
+    return {
+        "match_rate": match_rate,
+        "mean_iou": mean_iou,
+        "torch_time": torch_time,
+        "backend_time": backend_time,
+        "tracks": compare_tracks(torch_tracks, backend_tracks),
+    }
+
+
+def parity_failures(result, min_match=0.95, max_count_diff=2, min_id_match=0.9):
+    """허용 범위를 벗어난 항목 메시지 리스트 (비어 있으면 통과)"""
+    failures = []
+    if result["match_rate"] < min_match:
+        failures.append(f"match rate {result['match_rate']:.3f} < {min_match}")
+    for key, tracks in result["tracks"].items():
+        if tracks["frames"][0] != tracks["frames"][1]:
+            failures.append(f"'{key}' 프레임 수 불일치 {tracks['frames']}")
+        if tracks["max_count_diff"] > max_count_diff:
+            failures.append(f"'{key}' 프레임별 트랙 수 차이 {tracks['max_count_diff']} > {max_count_diff}")
+        if tracks["id_match"] < min_id_match:
+            failures.append(f"'{key}' 트랙 ID 일치율 {tracks['id_match']:.3f} < {min_id_match}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감지기 백엔드 PyTorch 대비 정합성 검사")
+    parser.add_argument("--video", required=True)
+    parser.add_argument("--weights", default=os.path.join("models", "best.pt"))
+    parser.add_argument("--backend", choices=["onnx", "openvino"], default="onnx")
+    parser.add_argument("--model", required=True)
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--batch", type=int, default=8)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--min-match", type=float, default=0.95)
+    parser.add_argument("--max-count-diff", type=int, default=2)
+    parser.add_argument("--min-id-match", type=float, default=0.9)
+    args = parser.parse_args()
+
+    result = run_parity(args.video, args.weights, args.backend, args.model, args.frames, args.batch, args.threads)
+    print(f"[PARITY] detections: match={result['match_rate']:.3f} mean_iou={result['mean_iou']:.3f}")
+    print(f"[PARITY] time: pytorch={result['torch_time']:.2f}s {args.backend}={result['backend_time']:.2f}s")
+    for key, tracks in result["tracks"].items():
+        print(
+            f"[PARITY] tracks['{key}']: pytorch={tracks['tracks'][0]} {args.backend}={tracks['tracks'][1]} "
+            f"max_count_diff={tracks['max_count_diff']} id_match={tracks['id_match']:.3f}"
+        )
+
+    failures = parity_failures(result, args.min_match, args.max_count_diff, args.min_id_match)
+    for failure in failures:
+        print(f"[PARITY] FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("[PARITY] OK")
+
+
+if __name__ == "__main__":
+    main()
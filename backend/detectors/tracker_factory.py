@@ -0,0 +1,113 @@
+import inspect
+import threading
+
+from model_registry import get_registry
+
+from .batched_detector import load_detector, attach_detector
+from .keyframe_detector import KeyframeDetector
+
+
+class SharedModel:
+    """여러 작업이 공유하는 YOLO 모델
+
+    ultralytics predictor는 스레드 안전하지 않으므로 predict 호출만 직렬화하고
+    나머지 속성은 원래 모델로 넘긴다.
+    """
+
+    def __init__(self, model):
+        self._model = model
+        self._predict_lock = threading.Lock()
+
+    def predict(self, *args, **kwargs):
+        with self._predict_lock:
+            return self._model.predict(*args, **kwargs)
+
+    __call__ = predict
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
+
+
+class PlaceholderModel:
+    """Tracker 생성 시 YOLO 대신 넣는 빈 모델 (가중치를 읽지 않음)
+
+    CPU 감지기 백엔드는 생성 직후 감지기로 교체하므로 best.pt를 메모리에 올릴 필요가 없다.
+    (GPU 패치된 Tracker.__init__이 model.to("cuda")를 호출하므로 to()만 지원)
+    """
+
+    def to(self, *args, **kwargs):
+        return self
+
+
+def _build_tracker(model_path, model):
+    """이미 로드된 model로 Tracker 생성 (Tracker.__init__의 YOLO 로드 생략)
+
+    배포 서버의 trackers/tracker.py는 fix_tracker_model.py로 model= 인자를 받도록 패치한다.
+    패치 전 Tracker면 평소대로 만든 뒤 model을 바꿔 끼운다 (이때는 best.pt를 한 번 더 읽음).
+    """
+    from trackers import Tracker
+
+    if "model" in inspect.signature(Tracker.__init__).parameters:
+        return Tracker(model_path, model=model)
+    print("[TRACKER] Tracker does not accept model= (run fix_tracker_model.py), loading YOLO weights again")
+    tracker = Tracker(model_path)
+    tracker.model = model
+    return tracker
+
+
+def _shared_yolo(model_path):
+    """레지스트리에서 공유하는 YOLO 모델 (프로세스마다 best.pt를 한 번만 로드)"""
+    def load():
+        from ultralytics import YOLO
+        return SharedModel(YOLO(model_path))
+
+    return get_registry().get(f"yolo:{model_path}", load)
+
+
+def create_drawing_tracker(model_path="models/best.pt"):
+    """그리기(draw_annotations) 전용 Tracker (감지 모델을 로드하지 않음, 구간 렌더링 워커용)"""
+    return _build_tracker(model_path, PlaceholderModel())
+
+
+def draw_window_annotations(tracker, frames, tracks, team_ball_control, start_frame=0):
+    """윈도우 단위로 draw_annotations를 호출하되 점유율 박스에는 영상 전체 기준 프레임 번호를 넘김
+
+    Tracker는 윈도우 안의 순번을 프레임 번호로 쓰므로 그대로 부르면 점유율이 윈도우마다 처음부터 누적된다.
+    """
+    overridden = "draw_team_ball_control" in vars(tracker)
+    draw_ball_control = tracker.draw_team_ball_control
+    tracker.draw_team_ball_control = lambda frame, frame_num, ball_control: draw_ball_control(
+        frame, start_frame + frame_num, ball_control
+    )
+    try:
+        return tracker.draw_annotations(frames, tracks, team_ball_control)
+    finally:
+        if overridden:
+            tracker.draw_team_ball_control = draw_ball_control
+        else:
+            del tracker.draw_team_ball_control
+
+
+def create_tracker(model_path="models/best.pt", backend="pytorch", backend_model_path=None,
+                   batch_size=8, threads=0, keyframe=False, keyframe_interval=3,
+                   keyframe_motion=0.03):
+    """Tracker 생성 (CPU 감지기 백엔드/키프레임 감지 설정 적용)
+
+    설정값만 받으므로 분석 서버와 청크 워커 프로세스가 같은 방식으로 Tracker를 만들 수 있다.
+    감지 모델은 프로세스 전역 레지스트리에서 한 번만 로드해서 공유하고,
+    추적 상태는 Tracker 인스턴스마다 따로 가진다.
+    onnx/openvino 백엔드는 best.pt YOLO를 로드하지 않고 빈 모델로 Tracker를 만든 뒤 감지기를 붙인다.
+    """
+    if backend == "pytorch":
+        tracker = _build_tracker(model_path, _shared_yolo(model_path))
+    else:
+        detector = get_registry().get(
+            f"{backend}:{backend_model_path}",
+            lambda: load_detector(backend, backend_model_path, batch_size, threads),
+        )
+        tracker = attach_detector(_build_tracker(model_path, PlaceholderModel()), detector)
+    if keyframe:
+        attach_detector(tracker, KeyframeDetector(
+            tracker.model, max_interval=keyframe_interval, motion_threshold=keyframe_motion,
+        ))
+    return tracker
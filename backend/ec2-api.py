@@ -13,74 +13,17 @@ import uuid
 from datetime import datetime
 import traceback
 
-from utils import read_video, save_video
-from trackers import Tracker
-from team_assigner import TeamAssigner
-from player_ball_assigner import PlayerBallAssigner
-from camera_movement_estimator import CameraMovementEstimator
-from view_transformer import ViewTransformer
-from speed_and_distance_estimator import SpeedAndDistance_Estimator
-from retriever.generate_commentary import generate_commentary
-from openai import OpenAI
+from model_registry import get_registry
+from job_queue import JobQueue, StoreJobQueue, QueueFullError
+from video_analysis import generate_coaching, jobs, reset_for_retry, UNFINISHED_STATUSES, RUNNING_STATUSES
+from video_analysis.config import (
+    ANALYSIS_MODE, ANALYSIS_JOB_WORKERS, ANALYSIS_QUEUE_SIZE, ANALYSIS_AVG_JOB_SECONDS,
+    PRELOAD_MODELS, S3_BUCKET, OUTPUT_MODES,
+    COMMENTARY_MODES, OVERLAY_ENABLED, OVERLAY_FONT_PATH,
+)
 import json
 from typing import List, Optional
 
-coaching_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
-def generate_coaching(subtitle_data, event_data, ball_control, my_team=None):
-    commentary_text = "\n".join([s["text"] if isinstance(s, dict) else s for s in subtitle_data if s])
-    events_text = "\n".join([e for e in event_data if e and e.strip()])
-    ball_info = f"팀1 점유율: {ball_control.get('team1', 0)}%, 팀2 점유율: {ball_control.get('team2', 0)}%"
-
-    my_team_instruction = ""
-    if my_team:
-        other_team = "팀2" if my_team == "팀1" else "팀1"
-        my_team_instruction = (
-            f"\n\n[중요] 너는 '{my_team}'의 전담 코치야. "
-            f"'{my_team}'을 '우리팀', '{other_team}'을 '상대팀'으로 지칭하고, "
-            f"우리팀의 승리를 위한 관점에서 분석하고 피드백해야 해. "
-            f"우리팀의 장점은 살리고, 약점은 냉철하게 지적하며, 상대팀의 허점을 공략하는 전술을 제시할 것."
-        )
-
-    system_prompt = (
-        "너는 데이터와 전술 이론에 정통한 '엘리트 축구 감독'이야. "
-        "경기 결과뿐만 아니라 팀의 전술적 구조(Structural Analysis)를 해부하고, "
-        "포지션별로 책임을 명확히 묻는 엄격한 피드백을 제공해야 해."
-        + my_team_instruction +
-        "\n\n[분석 지침: 5개 핵심 섹션] 아래 데이터를 바탕으로 다음 순서로 분석을 진행할 것:\n\n"
-        "1. 전반적인 전술 구조 분석 (Tactical Setup)\n"
-        "공격 형태: 지공/역습의 효율성, 공격 시 선수들의 간격과 대형(Structure)이 적절했는지 분석.\n"
-        "수비 형태: 전방 압박의 강도나 수비 블록의 견고함, 상대 전술에 대한 대응력을 평가할 것.\n\n"
-        "2. 결정력 및 xG(기대 득점) 분석\n"
-        "슈팅의 위치와 질을 평가하고, 기회 창출 대비 득점 전환율이 낮았던 원인을 분석할 것.\n\n"
-        "3. 포지션별 1:1 집중 피드백\n"
-        "공격진(FW): 박스 안에서의 집중력, 결정적 기회에서의 선택(Shot vs Pass).\n"
-        "수비진(DF): 대인 마크 실패 지점, 공간 커버 범위, 라인 조절의 미숙함.\n"
-        "골키퍼(GK): 실점 상황의 위치 선정 및 수비진을 지휘하는 리더십(Commanding).\n\n"
-        "4. 공수 전환 및 위기 관리 (Transition)\n"
-        "공격에서 수비로 전환될 때의 속도와 하프 스페이스(Half-space) 허용 여부를 지적할 것.\n\n"
-        "5. 감독의 최종 지시 (The Locker Room)\n"
-        "총평: 오늘 전술의 성패를 한 문장으로 요약할 것.\n"
-        "지시: 다음 경기 승리를 위해 '전술적 수정 사항'과 '선수단 정신 무장'을 냉철하게 전달할 것."
-    )
-
-    user_content = f"[볼 점유율]\n{ball_info}\n\n[AI 중계 내용]\n{commentary_text}\n\n[이벤트 기록]\n{events_text}"
-
-    try:
-        response = coaching_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_content}
-            ],
-            max_tokens=1500,
-            temperature=0.7,
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        print(f"[COACHING GPT ERROR] {e}")
-        return "코칭 분석을 생성할 수 없습니다."
-
 app = FastAPI(title="Football Analysis API")
 
 # CORS 설정
@@ -94,7 +37,6 @@ app.add_middleware(
 
 # S3 클라이언트 초기화
 s3_client = boto3.client('s3')
-S3_BUCKET = os.getenv('S3_BUCKET_NAME', 'football-analysis-bucket')
 
 # 마지막 API 활동 시간 기록 (자동 정지용)
 LAST_ACTIVITY_FILE = "/tmp/ec2_last_activity"
@@ -119,11 +61,12 @@ class ActivityTracker(BaseHTTPMiddleware):
 
 app.add_middleware(ActivityTracker)
 
-# 작업 상태 저장 (메모리)
-jobs = {}
-
 class AnalyzeRequest(BaseModel):
     video_s3_key: str
+    # video(주석 영상) / overlay(주석 데이터 + WebVTT, 프론트엔드가 원본 위에 그림), 없으면 서버 기본값
+    output_mode: Optional[str] = None
+    # llm(Bedrock 해설) / fast(로컬 템플릿 해설, 외부 호출 없음), 없으면 서버 기본값
+    commentary_mode: Optional[str] = None
 
 class AnalyzeResponse(BaseModel):
     status: str
@@ -132,314 +75,41 @@ class AnalyzeResponse(BaseModel):
     team_ball_control: dict = {}
     message: str
 
-def analyze_video(input_path: str, output_path: str, job_id: str = None):
-    """영상 분석 메인 로직"""
-    vector_store_path = os.path.abspath(
-        os.path.join("commentary_ai", "generator", "vector_store.pkl")
+# 분석 작업 대기열: 동시 분석 수 제한 + 대기열 크기 제한
+if ANALYSIS_MODE == "external":
+    # API 서버는 작업을 저장소에 넣고 상태만 읽음 (분석은 python -m video_analysis.worker)
+    job_queue = StoreJobQueue(
+        jobs,
+        workers=ANALYSIS_JOB_WORKERS,
+        max_queued=ANALYSIS_QUEUE_SIZE,
+        initial_job_seconds=ANALYSIS_AVG_JOB_SECONDS,
+        running_statuses=RUNNING_STATUSES,
     )
-
-    video_frames = read_video(input_path)
-    total_frames = len(video_frames)
-    
-    # 진행 상황 초기화
-    if job_id and job_id in jobs:
-        jobs[job_id]["total_frames"] = total_frames
-        jobs[job_id]["current_frame"] = 0
-        jobs[job_id]["progress_percent"] = 0
-        jobs[job_id]["progress_stage"] = "초기화"
-
-    # fps 구하기
-    import cv2 as cv2_cap
-    cap = cv2_cap.VideoCapture(input_path)
-    video_fps = cap.get(cv2_cap.CAP_PROP_FPS) or 24
-    cap.release()
-
-    # 진행 단계 업데이트 헬퍼
-    def update_stage(stage_text, stage_progress):
-        if job_id and job_id in jobs:
-            jobs[job_id]["progress_percent"] = stage_progress
-            jobs[job_id]["progress_stage"] = stage_text
-
-    update_stage("영상 전처리 중...", 5)
-
-    # 480p 리사이즈로 YOLO 처리 속도 향상
-    import cv2
-    if video_frames and video_frames[0].shape[0] > 720:
-        h, w = video_frames[0].shape[:2]
-        new_h = 720
-        new_w = int(w * (new_h / h))
-        video_frames = [cv2.resize(f, (new_w, new_h)) for f in video_frames]
-        print(f"[RESIZE] {w}x{h} → {new_w}x{new_h} ({len(video_frames)} frames)")
-
-    update_stage("선수/볼 추적 중...", 10)
-    tracker = Tracker('models/best.pt')
-    tracks = tracker.get_object_tracks(video_frames, read_from_stub=False, stub_path=None)
-    tracker.add_positions_to_tracks(tracks)
-    
-    if job_id and job_id in jobs:
-        jobs[job_id]["progress_percent"] = 30
-
-    update_stage("카메라 움직임 분석 중...", 30)
-    camera_movement_estimator = CameraMovementEstimator(video_frames[0])
-    camera_movement_per_frame = camera_movement_estimator.get_camera_movement(
-        video_frames, read_from_stub=False, stub_path=None
+else:
+    from overlay import check_font
+    from video_analysis.pipeline import preload_models, start_model_janitor
+    from video_analysis.runner import run_analysis_job
+
+    job_queue = JobQueue(
+        run_analysis_job,
+        workers=ANALYSIS_JOB_WORKERS,
+        max_queued=ANALYSIS_QUEUE_SIZE,
+        initial_job_seconds=ANALYSIS_AVG_JOB_SECONDS,
+        table=jobs,
     )
-    camera_movement_estimator.add_adjust_positions_to_tracks(tracks, camera_movement_per_frame)
-    
-    if job_id and job_id in jobs:
-        jobs[job_id]["progress_percent"] = 40
-
-    update_stage("좌표 변환 중...", 40)
-    view_transformer = ViewTransformer()
-    view_transformer.add_transformed_position_to_tracks(tracks)
-
-    tracks["ball"] = tracker.interpolate_ball_positions(tracks["ball"])
-
-    update_stage("속도/거리 계산 중...", 45)
-    speed_and_distance_estimator = SpeedAndDistance_Estimator()
-    speed_and_distance_estimator.add_speed_and_distance_to_tracks(tracks)
-    
-    if job_id and job_id in jobs:
-        jobs[job_id]["progress_percent"] = 50
-
-    # 4단계: 팀 배정 (50-55%)
-    if job_id and job_id in jobs:
-        jobs[job_id]["progress_stage"] = "팀 분석중"
-        jobs[job_id]["progress_percent"] = 50
-    
-    team_assigner = TeamAssigner()
-    team_assigner.assign_team_color(video_frames[0], tracks['players'][0])
-    for frame_num, player_track in enumerate(tracks['players']):
-        for player_id, track in player_track.items():
-            team = team_assigner.get_player_team(video_frames[frame_num], track['bbox'], player_id)
-            tracks['players'][frame_num][player_id]['team'] = team
-            tracks['players'][frame_num][player_id]['team_color'] = team_assigner.team_colors[team]
-    
-    if job_id and job_id in jobs:
-        jobs[job_id]["progress_percent"] = 55
-
-    # 5단계: 이벤트 감지 (55-85%)
-    if job_id and job_id in jobs:
-        jobs[job_id]["progress_stage"] = "이벤트 감지중"
-        jobs[job_id]["progress_percent"] = 55
-    
-    player_assigner = PlayerBallAssigner()
-    team_ball_control = []
-    previous_player_with_ball = -1
-    previous_team_with_ball = None
-
-    subtitle_data = []
-    event_data = []
-    events_list = []
-    
-    # 총 프레임 수 (이벤트 감지 진행률 계산용)
-    total_player_frames = len(tracks['players'])
-
-    def frame_to_time(f):
-        total_sec = int(f / video_fps)
-        m, s = divmod(total_sec, 60)
-        return f"{m}:{s:02d}"
-
-    total_frames = len(tracks['players'])
-
-    for frame_num, player_track in enumerate(tracks['players']):
-        # 진행률 업데이트 (50~90% 범위, 10프레임마다)
-        if job_id and job_id in jobs and frame_num % 10 == 0:
-            frame_progress = 50 + ((frame_num + 1) / total_frames * 40)
-            jobs[job_id]["progress_percent"] = round(frame_progress, 1)
-            jobs[job_id]["progress_stage"] = "이벤트 분석 중..."
-            jobs[job_id]["current_frame"] = frame_num
-            jobs[job_id]["partial_subtitles"] = subtitle_data.copy()
-            jobs[job_id]["live_events"] = events_list.copy()
-        ball_bbox = tracks['ball'][frame_num][1]['bbox']
-        ball_speed = tracks['ball'][frame_num].get('speed', 0)
-        assigned_player = player_assigner.assign_ball_to_player(player_track, ball_bbox)
-
-        if assigned_player != -1:
-            tracks['players'][frame_num][assigned_player]['has_ball'] = True
-            current_team_with_ball = tracks['players'][frame_num][assigned_player]['team']
-            tracker.update_ball_owner(assigned_player, current_team_with_ball)
-            team_ball_control.append(current_team_with_ball)
-        else:
-            current_team_with_ball = previous_team_with_ball
-
-        event_texts = []
-
-        if previous_player_with_ball != -1 and assigned_player != previous_player_with_ball:
-            if assigned_player != -1:
-                event_text = f"패스 성공! 플레이어 {previous_player_with_ball} ➡ 플레이어 {assigned_player}"
-                event_texts.append(event_text)
-                events_list.append({"frame": frame_num, "time": frame_to_time(frame_num), "type": "pass", "description": event_text})
-        elif assigned_player != -1:
-            speed = tracks['players'][frame_num][assigned_player].get('speed', 0)
-            if speed > 1.5:
-                event_text = f"플레이어 {assigned_player}이 드리블 중입니다."
-                event_texts.append(event_text)
-
-        if previous_team_with_ball is not None and current_team_with_ball != previous_team_with_ball:
-            event_text = "태클 성공! 상대 팀이 볼을 차단했습니다."
-            event_texts.append(event_text)
-            events_list.append({"frame": frame_num, "time": frame_to_time(frame_num), "type": "tackle", "description": event_text})
-
-        if ball_speed > 8:
-            event_text = "슛! 볼이 빠른 속도로 움직입니다."
-            event_texts.append(event_text)
-            events_list.append({"frame": frame_num, "time": frame_to_time(frame_num), "type": "shot", "description": event_text})
-
-        goal_area = ((100, 50), (200, 100))
-        if goal_area[0][0] < ball_bbox[0] < goal_area[1][0] and goal_area[0][1] < ball_bbox[1] < goal_area[1][1]:
-            event_text = "골! 볼이 골대에 들어갔습니다!"
-            event_texts.append(event_text)
-            events_list.append({"frame": frame_num, "time": frame_to_time(frame_num), "type": "goal", "description": event_text})
-
-        event_text = "\n".join(event_texts)
-        event_data.append(event_text)
-
-        if assigned_player != -1:
-            speed = tracks['players'][frame_num][assigned_player].get('speed', 0)
-        else:
-            speed = 0
-
-        if frame_num % 72 == 0:
-            # 최근 이벤트 수집 (이 구간 동안 발생한 이벤트)
-            recent_events = [e for e in events_list if e["frame"] > max(0, frame_num - 72) and e["frame"] <= frame_num]
-            recent_events_text = ""
-            if recent_events:
-                recent_events_text = "최근 이벤트: " + ", ".join([e["description"] for e in recent_events[-5:]])
-            else:
-                recent_events_text = "최근 특별한 이벤트 없음"
-
-            # 점유율 계산
-            if len(team_ball_control) > 0:
-                recent_control = team_ball_control[-72:] if len(team_ball_control) >= 72 else team_ball_control
-                t1 = sum(1 for t in recent_control if t == 1)
-                t2 = sum(1 for t in recent_control if t == 2)
-                total = t1 + t2
-                possession_text = f"최근 점유율 - 팀1: {t1*100//max(total,1)}%, 팀2: {t2*100//max(total,1)}%"
-            else:
-                possession_text = "점유율 데이터 없음"
-
-            query = (
-                f"축구 경기 중계를 해주세요. 현재 상황:\n"
-                f"- 볼 소유: 팀{current_team_with_ball}의 플레이어 {assigned_player}\n"
-                f"- 플레이어 이동 속도: {speed:.2f}\n"
-                f"- 볼 속도: {ball_speed:.2f}\n"
-                f"- {possession_text}\n"
-                f"- {recent_events_text}\n"
-                f"짧고 생동감 있게 실제 축구 중계처럼 해설해주세요. 1~2문장으로."
-            )
-
-            subtitle_text = generate_commentary(query, vector_store_path)
-            subtitle_data.append({"frame": frame_num, "time": frame_to_time(frame_num), "text": subtitle_text})
-
-        previous_player_with_ball = assigned_player
-        previous_team_with_ball = current_team_with_ball
-
-    # 6단계: 영상 렌더링 (85-95%)
-    if job_id and job_id in jobs:
-        jobs[job_id]["progress_stage"] = "영상 렌더링중"
-        jobs[job_id]["progress_percent"] = 85
-    
-    output_video_frames = tracker.draw_annotations(video_frames, tracks, team_ball_control)
-    save_video(output_video_frames, output_path)
-    
-    if job_id and job_id in jobs:
-        jobs[job_id]["progress_percent"] = 95
-
-    # 7단계: 최종 처리 (95-100%)
-    if job_id and job_id in jobs:
-        jobs[job_id]["progress_stage"] = "최종 처리중"
-        jobs[job_id]["progress_percent"] = 95
-    
-    import subprocess
-    h264_path = output_path.replace(".mp4", "_h264.mp4")
-    subprocess.run(["ffmpeg", "-y", "-i", output_path, "-vcodec", "libx264", "-acodec", "aac", h264_path], capture_output=True)
-    import shutil
-    shutil.move(h264_path, output_path)
-
-    import numpy as np
-    tc = np.array(team_ball_control)
-    t1 = int(np.sum(tc == 1))
-    t2 = int(np.sum(tc == 2))
-    total = t1 + t2
-    ball_control = {"team1": round(t1/total*100, 1) if total > 0 else 50.0, "team2": round(t2/total*100, 1) if total > 0 else 50.0}
-
-    # BGR → RGB 변환 (OpenCV는 BGR, 프론트는 RGB)
-    team_colors_rgb = {}
-    for team_id, color in team_assigner.team_colors.items():
-        team_colors_rgb[str(team_id)] = [int(color[2]), int(color[1]), int(color[0])]
-
-    if job_id and job_id in jobs:
-        jobs[job_id]["progress_percent"] = 100
-        jobs[job_id]["current_frame"] = total_player_frames
-
-    return events_list, ball_control, subtitle_data, event_data, team_colors_rgb
-
-
-def run_analysis_job(job_id, s3_key):
-    """백그라운드에서 분석 실행"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    input_local_path = f"/tmp/input_{job_id}.mp4"
-    output_local_path = f"/tmp/output_{job_id}.mp4"
 
-    try:
-        jobs[job_id]["status"] = "downloading"
-        print(f"[{job_id}] Downloading video from S3: {s3_key}")
-        s3_client.download_file(S3_BUCKET, s3_key, input_local_path)
-
-        if jobs[job_id]["status"] == "cancelled":
-            print(f"[{job_id}] Cancelled before analysis")
-            return
-
-        jobs[job_id]["status"] = "analyzing"
-        print(f"[{job_id}] Starting analysis...")
-        events, ball_control, subtitles, event_texts, team_colors = analyze_video(input_local_path, output_local_path, job_id)
-
-        jobs[job_id]["status"] = "uploading"
-        output_s3_key = f"outputs/analyzed_{timestamp}_{job_id}.mp4"
-        print(f"[{job_id}] Uploading result to S3: {output_s3_key}")
-        s3_client.upload_file(output_local_path, S3_BUCKET, output_s3_key)
-
-        output_url = s3_client.generate_presigned_url(
-            'get_object',
-            Params={'Bucket': S3_BUCKET, 'Key': output_s3_key},
-            ExpiresIn=604800
-        )
 
-        print(f"[{job_id}] Generating coaching analysis...")
-        coaching = generate_coaching(subtitles, event_texts, ball_control)
-
-        jobs[job_id]["status"] = "done"
-        jobs[job_id]["result"] = {
-            "output_video_url": output_url,
-            "events": events,
-            "team_ball_control": ball_control,
-            "subtitles": subtitles,
-            "event_texts": event_texts,
-            "coaching": coaching,
-            "team_colors": team_colors,
-        }
-        print(f"[{job_id}] Analysis completed successfully")
-
-    except Exception as e:
-        print(f"[{job_id}] Analysis Error: {str(e)}")
-        print(traceback.format_exc())
-        jobs[job_id]["status"] = "error"
-        
-        # 실패 시 어느 프레임에서 실패했는지 포함
-        current_frame = jobs[job_id].get("current_frame", 0)
-        total_frames = jobs[job_id].get("total_frames", 0)
-        progress_stage = jobs[job_id].get("progress_stage", "알 수 없음")
-        
-        error_msg = f"{str(e)}"
-        if total_frames > 0:
-            error_msg += f" (진행: {current_frame}/{total_frames} 프레임, 단계: {progress_stage})"
-        
-        jobs[job_id]["error"] = error_msg
-    finally:
-        for path in [input_local_path, output_local_path]:
-            if os.path.exists(path):
-                os.remove(path)
+def recover_jobs():
+    """재시작 전에 끝나지 않은 작업을 다시 대기열에 넣음 (반복 실패 작업은 에러 처리)"""
+    for job_id, job in jobs.unfinished(UNFINISHED_STATUSES).items():
+        if not reset_for_retry(job, "서버 재시작으로 작업이 반복 중단되었습니다"):
+            continue
+        try:
+            job_queue.submit(job_id, job["s3_key"])
+            print(f"[{job_id}] Re-queued after restart (attempt {job['recovery_count']})")
+        except QueueFullError:
+            job["error"] = "서버 재시작 후 대기열이 가득 차서 작업을 재개하지 못했습니다"
+            job["status"] = "error"
 
 
 @app.get("/")
@@ -453,22 +123,42 @@ async def health_check():
 
 @app.post("/api/analyze")
 async def analyze_endpoint(request: AnalyzeRequest):
-    """분석 요청 → 즉시 jobId 반환 (비동기)"""
+    """분석 요청 → 즉시 jobId 반환 (대기열에서 순서대로 분석)"""
+    if request.output_mode is not None and request.output_mode not in OUTPUT_MODES:
+        raise HTTPException(status_code=400, detail=f"output_mode는 {', '.join(OUTPUT_MODES)} 중 하나여야 합니다")
+    if request.commentary_mode is not None and request.commentary_mode not in COMMENTARY_MODES:
+        raise HTTPException(
+            status_code=400, detail=f"commentary_mode는 {', '.join(COMMENTARY_MODES)} 중 하나여야 합니다"
+        )
+
     job_id = str(uuid.uuid4())
-    jobs[job_id] = {
+    job = {
         "status": "queued",
         "created_at": datetime.now().isoformat(),
         "s3_key": request.video_s3_key,
+        "output_mode": request.output_mode,
+        "commentary_mode": request.commentary_mode,
         "result": None,
         "error": None,
     }
 
-    # 백그라운드 스레드에서 분석 실행
-    thread = threading.Thread(target=run_analysis_job, args=(job_id, request.video_s3_key))
-    thread.daemon = True
-    thread.start()
+    # 대기열에 자리가 있을 때만 작업을 저장 (거절된 작업이 저장소/워커에 보이지 않도록)
+    try:
+        position = job_queue.submit(job_id, request.video_s3_key, job=job)
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"{e}. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": str(int(job_queue.avg_job_seconds))},
+        )
 
-    return {"jobId": job_id, "status": "queued", "message": "분석이 시작되었습니다"}
+    return {
+        "jobId": job_id,
+        "status": "queued",
+        "queue_position": position,
+        "estimated_start_seconds": job_queue.estimated_start_seconds(job_id),
+        "message": "분석이 시작되었습니다" if position == 1 else f"대기열 {position}번째입니다",
+    }
 
 
 @app.get("/api/status/{job_id}")
@@ -506,9 +196,29 @@ async def get_job_status(job_id: str):
             "partial_subtitles": job.get("partial_subtitles", []),
             "live_events": job.get("live_events", []),
         }
+        if job["status"] == "queued":
+            wait_seconds = job_queue.estimated_start_seconds(job_id)
+            progress_info["queue_position"] = job_queue.position(job_id)
+            progress_info["estimated_start_seconds"] = wait_seconds
+            if wait_seconds is not None:
+                progress_info["estimated_start_at"] = datetime.fromtimestamp(
+                    datetime.now().timestamp() + wait_seconds
+                ).isoformat()
         return progress_info
 
 
+@app.get("/api/queue")
+async def get_queue_stats():
+    """분석 대기열 상태 (워커 수, 실행/대기 작업 수, 평균 소요 시간)"""
+    return job_queue.stats()
+
+
+@app.get("/api/models")
+async def get_model_stats():
+    """로드된 모델별 로드 시간/메모리/사용 횟수"""
+    return get_registry().stats()
+
+
 @app.post("/api/cancel/{job_id}")
 async def cancel_job(job_id: str):
     """분석 작업 취소"""
@@ -518,6 +228,7 @@ async def cancel_job(job_id: str):
     if job["status"] in ("done", "error", "cancelled"):
         return {"status": job["status"], "message": "이미 완료된 작업입니다"}
     job["status"] = "cancelled"
+    job_queue.cancel(job_id)
     return {"status": "cancelled", "message": "분석이 중지되었습니다"}
 
 
@@ -684,9 +395,20 @@ def init_chatbot():
 
 @app.on_event("startup")
 async def startup_event():
+    # 한글 폰트가 없으면 자막이 빈 상자로 그려지므로 작업을 받기 전에 서버 시작을 중단
+    if ANALYSIS_MODE != "external" and OVERLAY_ENABLED:
+        check_font(OVERLAY_FONT_PATH)
     # 백그라운드 스레드에서 챗봇 초기화 (서버 시작 차단 방지)
     thread = threading.Thread(target=init_chatbot, daemon=True)
     thread.start()
+    job_queue.start()
+    # external 모드에서는 작업 복구/모델 로드/모델 정리를 워커 프로세스가 담당
+    if ANALYSIS_MODE != "external":
+        recover_jobs()
+        # 분석 모델 미리 로드 + 유휴/메모리 정리
+        if PRELOAD_MODELS:
+            threading.Thread(target=preload_models, daemon=True).start()
+        start_model_janitor()
     # 서버 시작 시 활동 기록
     touch_activity()
 
@@ -721,4 +443,9 @@ async def store_analysis_for_chat(request: dict):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # 분석을 워커 프로세스로 분리한 경우에만 uvicorn 워커를 여러 개 띄울 수 있음
+    api_workers = int(os.getenv("API_WORKERS", "1")) if ANALYSIS_MODE == "external" else 1
+    if api_workers > 1:
+        uvicorn.run("ec2-api:app", host="0.0.0.0", port=8000, workers=api_workers)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,5 @@
+from .ball_assigner import BatchPlayerBallAssigner, BallAssignment
+from .event_engine import (
+    EVENT_TYPES, EVENT_DTYPE, EventRules, EventResult, detect_events, mark_ball_owners, ball_boxes,
+)
+from .commentary_scheduler import CommentaryScheduler
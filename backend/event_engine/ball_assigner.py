@@ -0,0 +1,94 @@
+import numpy as np
+
+
+class BallAssignment:
+    """BatchPlayerBallAssigner 결과 (프레임별)
+
+    - owner: 볼 소유 선수 ID (-1이면 없음)
+    - owner_rows: 소유 선수의 입력 행 번호 (-1)
+    - owner_distance: 소유 선수와 볼 거리 (소유자가 없으면 inf)
+    - candidate_ids / candidate_distances: top_k를 지정한 경우 가까운 순 후보 (num_frames, k),
+      후보가 모자라면 -1 / inf로 채움 (거리 기준을 넘는 선수도 포함)
+    """
+
+    def __init__(self, owner, owner_rows, owner_distance, candidate_ids=None, candidate_distances=None):
+        self.owner = owner
+        self.owner_rows = owner_rows
+        self.owner_distance = owner_distance
+        self.candidate_ids = candidate_ids
+        self.candidate_distances = candidate_distances
+
+
+class BatchPlayerBallAssigner:
+    """영상 전체 프레임의 볼 소유 선수를 한 번에 계산하는 PlayerBallAssigner
+
+    assign_ball_to_player와 같은 기준을 쓴다: 볼 중심과 선수 bbox 아래 왼쪽/오른쪽 끝 중
+    가까운 쪽 거리가 max_player_ball_distance 미만인 선수 중 가장 가까운 선수
+    (같은 거리면 ID가 작은 선수). 선수 행은 프레임 번호로 볼 위치와 짝지어지므로
+    전체 행에 대해 거리를 한 번 계산하고 (프레임, 거리) 정렬 한 번으로 프레임별 순위를 구한다.
+    """
+
+    def __init__(self, max_player_ball_distance=70):
+        self.max_player_ball_distance = max_player_ball_distance
+
+    @staticmethod
+    def foot_points(bbox):
+        """bbox (n, 4) → 발 위치 (n, 2, 2) [아래 왼쪽, 아래 오른쪽]"""
+        bbox = np.asarray(bbox, dtype=np.float64)
+        return np.stack([bbox[:, [0, 3]], bbox[:, [2, 3]]], axis=1)
+
+    @staticmethod
+    def ball_centers(ball_bbox):
+        """볼 bbox (num_frames, 4) → 정수 좌표 중심 (num_frames, 2), 볼이 없으면 NaN"""
+        ball_bbox = np.asarray(ball_bbox, dtype=np.float64)
+        return np.trunc((ball_bbox[:, :2] + ball_bbox[:, 2:4]) / 2)
+
+    def distances(self, player_frames, player_feet, ball_positions):
+        """선수 행별 볼까지 거리 (n,) (볼이 없는 프레임은 NaN)"""
+        ball = np.asarray(ball_positions, dtype=np.float64)[player_frames]
+        return np.linalg.norm(player_feet - ball[:, None, :], axis=2).min(axis=1)
+
+    def assign(self, player_frames, player_ids, player_feet, ball_positions, top_k=0):
+        """프레임별 볼 소유 선수 계산
+
+        player_frames (n,), player_ids (n,), player_feet (n, 2, 2), ball_positions (num_frames, 2)
+        """
+        player_frames = np.asarray(player_frames, dtype=np.int64)
+        player_ids = np.asarray(player_ids, dtype=np.int64)
+        num_frames = len(ball_positions)
+        distance = self.distances(player_frames, player_feet, ball_positions)
+
+        owner = np.full(num_frames, -1, dtype=np.int64)
+        owner_rows = np.full(num_frames, -1, dtype=np.int64)
+        owner_distance = np.full(num_frames, np.inf)
+
+        valid = np.flatnonzero(~np.isnan(distance))
+        order = valid[np.lexsort((player_ids[valid], distance[valid], player_frames[valid]))]
+        frames = player_frames[order]
+        # 프레임 안에서의 순위 (0이 가장 가까운 선수)
+        starts = np.flatnonzero(np.r_[True, frames[1:] != frames[:-1]]) if len(order) else np.zeros(0, int)
+        rank = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+
+        nearest = order[rank == 0]
+        nearest = nearest[distance[nearest] < self.max_player_ball_distance]
+        owner[player_frames[nearest]] = player_ids[nearest]
+        owner_rows[player_frames[nearest]] = nearest
+        owner_distance[player_frames[nearest]] = distance[nearest]
+
+        candidate_ids = candidate_distances = None
+        if top_k:
+            candidate_ids = np.full((num_frames, top_k), -1, dtype=np.int64)
+            candidate_distances = np.full((num_frames, top_k), np.inf)
+            keep = rank < top_k
+            candidate_ids[frames[keep], rank[keep]] = player_ids[order[keep]]
+            candidate_distances[frames[keep], rank[keep]] = distance[order[keep]]
+
+        return BallAssignment(owner, owner_rows, owner_distance, candidate_ids, candidate_distances)
+
+    def assign_tracks(self, players, ball_bbox, top_k=0):
+        """TrackStore의 players(ObjectTracks)와 프레임별 볼 bbox로 계산"""
+        data = players.data
+        return self.assign(
+            data["frame"], data["track_id"], self.foot_points(data["bbox"]),
+            self.ball_centers(ball_bbox), top_k=top_k,
+        )
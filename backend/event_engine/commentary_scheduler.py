@@ -0,0 +1,84 @@
+from bisect import bisect_left, insort
+
+import numpy as np
+
+from .event_engine import EVENT_TYPES
+
+
+class CommentaryScheduler:
+    """이벤트 흐름에서 해설을 붙일 프레임을 고름 (고정 72프레임 간격 대신)
+
+    - weights: 종류별 중요도 (EVENT_TYPES + "possession"=점유 팀 전환), 0이면 해설 후보가 아님
+    - min_gap: 해설 사이 최소 간격(프레임), 가까운 후보끼리는 중요도가 높은 쪽만 남김
+    - max_gap: 이 간격보다 길게 해설이 없으면 조용한 구간에도 해설을 넣음 (0이면 사용 안 함)
+    - budget: 작업당 최대 해설 수 (0이면 제한 없음), 넘치면 중요도가 낮은 후보부터 버리고
+      조용한 구간 채우기는 남은 예산 안에서 가장 긴 공백부터
+    - possession_hold: 바뀐 점유 팀이 이 프레임 이상 유지될 때만 점유 전환으로 봄
+    """
+
+    DEFAULT_WEIGHTS = {"goal": 10, "shot": 6, "tackle": 4, "possession": 3, "pass": 1, "dribble": 0}
+
+    def __init__(self, min_gap=48, max_gap=360, budget=0, weights=None, possession_hold=24):
+        self.min_gap = min_gap
+        self.max_gap = max_gap
+        self.budget = budget
+        self.weights = {**self.DEFAULT_WEIGHTS, **(weights or {})}
+        self.possession_hold = possession_hold
+
+    def possession_swings(self, possession_team):
+        """점유 팀이 다른 팀으로 바뀌고 possession_hold 프레임 이상 유지된 시작 프레임"""
+        team = np.asarray(possession_team)
+        if len(team) < 2:
+            return np.zeros(0, dtype=np.int64)
+        starts = np.flatnonzero(team[1:] != team[:-1]) + 1
+        lengths = np.diff(np.append(starts, len(team)))
+        swing = (team[starts - 1] != 0) & (team[starts] != 0) & (lengths >= self.possession_hold)
+        return starts[swing]
+
+    def candidates(self, result):
+        """{프레임: 중요도} 해설 후보 (같은 프레임의 여러 이벤트는 가장 높은 중요도)"""
+        type_weights = np.array([self.weights.get(name, 0) for name in EVENT_TYPES], dtype=np.float64)
+        frames = result.events["frame"].astype(np.int64)
+        scores = type_weights[result.events["type"]]
+        swings = self.possession_swings(result.possession_team)
+        frames = np.concatenate([frames, swings])
+        scores = np.concatenate([scores, np.full(len(swings), float(self.weights.get("possession", 0)))])
+
+        best = {}
+        for frame, score in zip(frames[scores > 0].tolist(), scores[scores > 0].tolist()):
+            best[frame] = max(score, best.get(frame, 0.0))
+        return best
+
+    def _fits(self, selected, frame):
+        i = bisect_left(selected, frame)
+        if i > 0 and frame - selected[i - 1] < self.min_gap:
+            return False
+        return i == len(selected) or selected[i] - frame >= self.min_gap
+
+    def _quiet_fillers(self, selected, num_frames):
+        """max_gap보다 긴 공백(영상 시작 포함)을 max_gap 간격으로 채울 프레임 [(공백 길이, 프레임)]"""
+        fillers = []
+        bounds = [-self.max_gap] + selected + [num_frames + self.min_gap]
+        for prev, nxt in zip(bounds, bounds[1:]):
+            frame = prev + self.max_gap
+            while frame < num_frames and nxt - frame >= self.min_gap:
+                fillers.append((nxt - prev, frame))
+                frame += self.max_gap
+        return fillers
+
+    def schedule(self, result):
+        """해설을 생성할 프레임 번호 배열 (오름차순)"""
+        num_frames = result.num_frames
+        selected = []
+        for frame, _ in sorted(self.candidates(result).items(), key=lambda item: (-item[1], item[0])):
+            if self.budget and len(selected) >= self.budget:
+                break
+            if self._fits(selected, frame):
+                insort(selected, frame)
+
+        if self.max_gap:
+            for _, frame in sorted(self._quiet_fillers(selected, num_frames), key=lambda item: (-item[0], item[1])):
+                if self.budget and len(selected) >= self.budget:
+                    break
+                insort(selected, frame)
+        return np.array(selected, dtype=np.int64)
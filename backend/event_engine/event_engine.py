@@ -0,0 +1,200 @@
+import numpy as np
+
+from .ball_assigner import BatchPlayerBallAssigner
+
+EVENT_TYPES = ("pass", "dribble", "tackle", "shot", "goal")
+
+# 이벤트 테이블: 프레임별 이벤트 한 줄 (같은 프레임 안에서는 EVENT_TYPES 순서)
+EVENT_DTYPE = np.dtype([
+    ("frame", np.int32),
+    ("type", np.int8),  # EVENT_TYPES 인덱스
+    ("player", np.int32),  # 이벤트 시점의 볼 소유 선수 (-1이면 없음)
+    ("from_player", np.int32),  # 패스를 준 선수 (-1이면 없음)
+    ("team", np.int8),  # 볼 소유 팀 (0이면 없음)
+])
+
+
+class EventRules:
+    """이벤트 판정 규칙 (기본값은 기존 프레임 루프와 동일)
+
+    - max_player_ball_distance: 볼 중심과 선수 발(bbox 아래 양 끝) 거리가 이보다 작으면 소유
+    - dribble_speed: 볼 소유 선수 속도가 이보다 크면 드리블
+    - shot_ball_speed: 볼 속도가 이보다 크면 슛
+    - goal_area: ((x1, y1), (x2, y2)) 볼 bbox 왼쪽 위 꼭짓점이 이 영역 안이면 골
+    - min_ball_confidence: 볼 위치 신뢰도가 이보다 낮은 프레임(보간 구간)은 슛/골로 판정하지 않음
+    - listed_types: 이벤트 목록(events)에 들어가는 종류 (드리블은 자막용 텍스트에만 사용)
+    - texts: 종류별 설명 문구 ({player}, {from_player} 치환)
+    """
+
+    DEFAULT_TEXTS = {
+        "pass": "패스 성공! 플레이어 {from_player} ➡ 플레이어 {player}",
+        "dribble": "플레이어 {player}이 드리블 중입니다.",
+        "tackle": "태클 성공! 상대 팀이 볼을 차단했습니다.",
+        "shot": "슛! 볼이 빠른 속도로 움직입니다.",
+        "goal": "골! 볼이 골대에 들어갔습니다!",
+    }
+
+    def __init__(self, max_player_ball_distance=70, dribble_speed=1.5, shot_ball_speed=8.0,
+                 goal_area=((100, 50), (200, 100)), listed_types=("pass", "tackle", "shot", "goal"),
+                 texts=None, min_ball_confidence=0.0):
+        self.max_player_ball_distance = max_player_ball_distance
+        self.dribble_speed = dribble_speed
+        self.shot_ball_speed = shot_ball_speed
+        self.goal_area = goal_area
+        self.min_ball_confidence = min_ball_confidence
+        self.listed_types = tuple(listed_types)
+        self.texts = {**self.DEFAULT_TEXTS, **(texts or {})}
+
+    def describe(self, event):
+        name = EVENT_TYPES[event["type"]]
+        return self.texts[name].format(player=int(event["player"]), from_player=int(event["from_player"]))
+
+
+def ball_boxes(track_store, ball_id=1):
+    """프레임별 볼 bbox (num_frames, 4), 볼이 없는 프레임은 NaN"""
+    num_frames = track_store["players"].num_frames
+    boxes = np.full((num_frames, 4), np.nan, dtype=np.float64)
+    ball = track_store["ball"]
+    rows = (ball.data["track_id"] == ball_id) & ball.has("bbox") & (ball.data["frame"] < num_frames)
+    boxes[ball.data["frame"][rows]] = ball.data["bbox"][rows]
+    return boxes
+
+
+def ball_speeds(track_store, ball_id=1):
+    """프레임별 볼 속도 (속도가 없으면 0)"""
+    num_frames = track_store["players"].num_frames
+    speeds = np.zeros(num_frames, dtype=np.float64)
+    ball = track_store["ball"]
+    rows = (ball.data["track_id"] == ball_id) & ball.has("speed") & (ball.data["frame"] < num_frames)
+    speeds[ball.data["frame"][rows]] = np.nan_to_num(ball.data["speed"][rows])
+    return speeds
+
+
+class EventResult:
+    """detect_events 결과
+
+    - owner / owner_team / owner_speed: 프레임별 볼 소유 선수 ID(-1), 소유 선수 팀(0), 소유 선수 속도(0)
+    - owner_rows: 프레임별 소유 선수의 players 행 번호 (-1)
+    - possession_team: 마지막으로 볼을 가진 팀 (소유자가 없으면 이전 팀 유지, 처음엔 0)
+    - ball_speed: 프레임별 볼 속도
+    - events: EVENT_DTYPE 이벤트 테이블
+    - assignment: BallAssignment (top_k 후보 포함)
+    """
+
+    def __init__(self, assignment, owner_team, owner_speed, possession_team, ball_speed, events, rules):
+        self.assignment = assignment
+        self.owner = assignment.owner
+        self.owner_rows = assignment.owner_rows
+        self.owner_team = owner_team
+        self.owner_speed = owner_speed
+        self.possession_team = possession_team
+        self.ball_speed = ball_speed
+        self.events = events
+        self.rules = rules
+
+    @property
+    def num_frames(self):
+        return len(self.owner)
+
+    @property
+    def team_ball_control(self):
+        """볼 소유자가 있는 프레임의 팀 리스트 (기존 team_ball_control과 동일)"""
+        return self.owner_team[self.owner != -1].tolist()
+
+    def frame_texts(self):
+        """프레임별 이벤트 문구를 줄바꿈으로 이은 리스트 (기존 event_data와 동일)"""
+        texts = [[] for _ in range(self.num_frames)]
+        for event in self.events:
+            texts[event["frame"]].append(self.rules.describe(event))
+        return ["\n".join(t) for t in texts]
+
+    def listed_events(self, frame_to_time, until=None):
+        """이벤트 목록 [{"frame", "time", "type", "description"}] (until 프레임까지)"""
+        listed = [EVENT_TYPES.index(name) for name in self.rules.listed_types]
+        events = self.events[np.isin(self.events["type"], listed)]
+        if until is not None:
+            events = events[events["frame"] <= until]
+        return [
+            {
+                "frame": int(event["frame"]),
+                "time": frame_to_time(int(event["frame"])),
+                "type": EVENT_TYPES[event["type"]],
+                "description": self.rules.describe(event),
+            }
+            for event in events
+        ]
+
+
+def _shift(values, fill):
+    shifted = np.empty_like(values)
+    shifted[0:1] = fill
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def detect_events(track_store, rules=None, top_k=0, ball_confidence=None):
+    """전체 프레임의 볼 소유/이벤트를 배열 연산으로 계산 (기존 프레임 루프와 같은 결과)
+
+    top_k를 지정하면 프레임별 볼에 가까운 선수 후보도 함께 계산한다 (result.assignment).
+    ball_confidence(프레임별 0~1, BallTrajectory.confidence)가 있으면 rules.min_ball_confidence 미만
+    프레임은 슛/골에서 제외한다.
+    """
+    rules = rules or EventRules()
+    players = track_store["players"]
+    num_frames = players.num_frames
+    data = players.data
+
+    ball_bbox = ball_boxes(track_store)
+    ball_speed = ball_speeds(track_store)
+    assigner = BatchPlayerBallAssigner(rules.max_player_ball_distance)
+    assignment = assigner.assign_tracks(players, ball_bbox, top_k=top_k)
+    owner, owner_rows = assignment.owner, assignment.owner_rows
+    owned = owner_rows != -1
+
+    owner_team = np.zeros(num_frames, dtype=np.int64)
+    owner_speed = np.zeros(num_frames, dtype=np.float64)
+    owner_team[owned] = np.where(players.has("team"), data["team"], 0)[owner_rows[owned]]
+    owner_speed[owned] = np.nan_to_num(np.where(players.has("speed"), data["speed"], 0))[owner_rows[owned]]
+
+    # 소유자가 없는 프레임은 직전 소유 팀 유지
+    last_owned = np.maximum.accumulate(np.where(owned, np.arange(num_frames), -1)) if num_frames else owner
+    possession_team = np.where(last_owned >= 0, owner_team[np.maximum(last_owned, 0)], 0)
+
+    prev_owner = _shift(owner, -1)
+    prev_team = _shift(possession_team, 0)
+    changed_owner = (prev_owner != -1) & (owner != prev_owner)
+
+    x, y = ball_bbox[:, 0], ball_bbox[:, 1]
+    ball_reliable = np.ones(num_frames, dtype=bool)
+    if ball_confidence is not None:
+        ball_reliable = np.asarray(ball_confidence)[:num_frames] >= rules.min_ball_confidence
+    (gx1, gy1), (gx2, gy2) = rules.goal_area
+    masks = {
+        "pass": changed_owner & owned,
+        "dribble": ~changed_owner & owned & (owner_speed > rules.dribble_speed),
+        "tackle": (prev_team != 0) & (possession_team != prev_team),
+        "shot": (ball_speed > rules.shot_ball_speed) & ball_reliable,
+        "goal": (gx1 < x) & (x < gx2) & (gy1 < y) & (y < gy2) & ball_reliable,
+    }
+
+    parts = []
+    for type_index, name in enumerate(EVENT_TYPES):
+        frames = np.flatnonzero(masks[name])
+        part = np.zeros(len(frames), dtype=EVENT_DTYPE)
+        part["frame"] = frames
+        part["type"] = type_index
+        part["player"] = owner[frames]
+        part["from_player"] = prev_owner[frames] if name == "pass" else -1
+        part["team"] = possession_team[frames]
+        parts.append(part)
+    events = np.concatenate(parts)
+    events = events[np.lexsort((events["type"], events["frame"]))]
+
+    return EventResult(assignment, owner_team, owner_speed, possession_team, ball_speed, events, rules)
+
+
+def mark_ball_owners(track_store, result):
+    """소유 선수 행에 has_ball=True 기록 (기존 루프의 tracks[...]['has_ball'] = True)"""
+    rows = result.owner_rows[result.owner_rows != -1]
+    if len(rows):
+        track_store["players"].set_column("has_ball", True, rows)
@@ -0,0 +1,28 @@
+import sys
+
+# Tracker(model_path, model=...)로 이미 로드된 모델을 넘길 수 있게 패치
+# (detectors.create_tracker가 공유 YOLO/CPU 감지기를 넘겨서 best.pt를 작업마다 다시 읽지 않음)
+# fix_tracker_gpu.py와 순서에 상관없이 적용 가능
+path = sys.argv[1] if len(sys.argv) > 1 else '/home/ubuntu/football-analysis/trackers/tracker.py'
+with open(path, 'r') as f:
+    content = f.read()
+
+if 'model=None' in content:
+    print("already patched")
+    sys.exit(0)
+
+old_signature = 'def __init__(self, model_path):'
+old = 'self.model = YOLO(model_path)'
+if old_signature not in content or old not in content:
+    sys.exit(f"Tracker.__init__ not found in {path}")
+
+new = '''if model is not None:
+            self.model = model
+        else:
+            self.model = YOLO(model_path)'''
+
+content = content.replace(old_signature, 'def __init__(self, model_path, model=None):', 1)
+content = content.replace(old, new, 1)
+with open(path, 'w') as f:
+    f.write(content)
+print("done")
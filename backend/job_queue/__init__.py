@@ -0,0 +1,2 @@
+from .job_queue import JobQueue, QueueFullError
+from .store_queue import StoreJobQueue
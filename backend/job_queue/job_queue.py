@@ -0,0 +1,121 @@
+import heapq
+import threading
+import time
+import traceback
+from collections import deque
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 차서 작업을 받을 수 없음"""
+
+
+class JobQueue:
+    """제한된 크기의 작업 대기열 + 고정 개수 워커 스레드
+
+    동시에 실행되는 분석은 workers 개로 제한하고, 대기 작업이 max_queued를 넘으면
+    submit()이 QueueFullError를 던진다. 완료된 작업 소요 시간의 이동 평균으로
+    대기 작업의 예상 시작 시간을 계산한다.
+    table(jobs)을 주면 submit(job=...)으로 새 작업 레코드를 받아서 대기열에 자리가 있을 때만 저장한다.
+    """
+
+    def __init__(self, handler, workers=1, max_queued=10, initial_job_seconds=300.0, table=None):
+        self.handler = handler
+        self.table = table
+        self.workers = workers
+        self.max_queued = max_queued
+        self.avg_job_seconds = initial_job_seconds
+        self._pending = deque()
+        self._running = {}
+        self._cond = threading.Condition()
+        self._threads = []
+
+    def start(self):
+        with self._cond:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"analysis-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, job_id, *args, job=None):
+        """작업 추가 → 대기 순번 (1부터)
+
+        job(새 작업 레코드)을 주면 자리를 확인한 뒤 table에 저장하고 대기열에 넣는다
+        (가득 차면 저장하지 않고 QueueFullError).
+        """
+        with self._cond:
+            if len(self._pending) >= self.max_queued:
+                raise QueueFullError(f"대기열이 가득 찼습니다 ({self.max_queued}개)")
+            if job is not None:
+                self.table[job_id] = job
+            self._pending.append((job_id, args))
+            self._cond.notify()
+            return len(self._pending)
+
+    def cancel(self, job_id):
+        """아직 시작 안 한 작업을 대기열에서 제거"""
+        with self._cond:
+            for item in self._pending:
+                if item[0] == job_id:
+                    self._pending.remove(item)
+                    return True
+        return False
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                job_id, args = self._pending.popleft()
+                self._running[job_id] = time.time()
+
+            started = time.time()
+            try:
+                self.handler(job_id, *args)
+            except Exception:
+                print(f"[QUEUE] job {job_id} crashed")
+                print(traceback.format_exc())
+            finally:
+                elapsed = time.time() - started
+                with self._cond:
+                    self._running.pop(job_id, None)
+                    # 최근 작업에 가중치를 둔 이동 평균
+                    self.avg_job_seconds = 0.7 * self.avg_job_seconds + 0.3 * elapsed
+
+    def position(self, job_id):
+        """대기 순번 (1부터), 대기 중이 아니면 None"""
+        with self._cond:
+            for i, (pending_id, _) in enumerate(self._pending):
+                if pending_id == job_id:
+                    return i + 1
+        return None
+
+    def estimated_start_seconds(self, job_id):
+        """대기 작업이 시작되기까지 예상 시간(초), 대기 중이 아니면 None"""
+        with self._cond:
+            ids = [pending_id for pending_id, _ in self._pending]
+            if job_id not in ids:
+                return None
+            now = time.time()
+            avg = self.avg_job_seconds
+            # 각 워커가 비는 시점을 힙에 넣고 앞 순번 작업부터 배정
+            free_at = [max(avg - (now - started), 0.0) for started in self._running.values()]
+            free_at += [0.0] * (self.workers - len(free_at))
+            heapq.heapify(free_at)
+            for pending_id in ids:
+                start = heapq.heappop(free_at)
+                if pending_id == job_id:
+                    return round(start, 1)
+                heapq.heappush(free_at, start + avg)
+        return None
+
+    def stats(self):
+        with self._cond:
+            return {
+                "workers": self.workers,
+                "running": len(self._running),
+                "queued": len(self._pending),
+                "max_queued": self.max_queued,
+                "avg_job_seconds": round(self.avg_job_seconds, 1),
+            }
@@ -0,0 +1,91 @@
+import heapq
+import time
+
+from .job_queue import QueueFullError
+
+
+class StoreJobQueue:
+    """작업 저장소를 대기열로 쓰는 JobQueue (분석은 별도 워커 프로세스에서 실행)
+
+    API 서버는 status="queued"로 저장된 작업의 순번/예상 시작 시간만 계산하고,
+    워커 프로세스가 저장소에서 queued 작업을 하나씩 가져가서(claim) 실행한다.
+    JobQueue와 같은 인터페이스라서 엔드포인트 코드는 그대로 쓴다.
+    """
+
+    def __init__(self, table, workers=1, max_queued=10, initial_job_seconds=300.0,
+                 running_statuses=("downloading", "analyzing", "uploading")):
+        self.table = table
+        self.workers = workers
+        self.max_queued = max_queued
+        self.initial_job_seconds = initial_job_seconds
+        self.running_statuses = running_statuses
+
+    def start(self):
+        """워커는 별도 프로세스에서 실행되므로 할 일 없음"""
+
+    def _queued_ids(self):
+        return list(self.table.store.list_by_status(("queued",)))
+
+    def submit(self, job_id, *args, job=None):
+        """작업의 대기 순번 (1부터), 대기열 초과 시 QueueFullError
+
+        job(status="queued"인 새 작업 레코드)을 주면 대기 작업 수 확인과 저장을 저장소에서 한 번에 처리해서,
+        거절된 작업이 잠깐 저장됐다가 워커에게 배정되거나 동시 요청으로 대기열이 넘치는 일이 없다.
+        주지 않으면 이미 queued로 저장된 작업(재시작 복구)의 순번만 확인한다.
+        """
+        if job is not None:
+            position = self.table.insert(job_id, job, max_count=self.max_queued)
+            if position is None:
+                raise QueueFullError(f"대기열이 가득 찼습니다 ({self.max_queued}개)")
+            return position
+        ids = self._queued_ids()
+        position = ids.index(job_id) + 1 if job_id in ids else len(ids) + 1
+        if position > self.max_queued:
+            raise QueueFullError(f"대기열이 가득 찼습니다 ({self.max_queued}개)")
+        return position
+
+    def cancel(self, job_id):
+        """취소 상태로 저장된 작업은 워커가 가져가지 않으므로 따로 제거할 필요 없음"""
+        return False
+
+    def position(self, job_id):
+        ids = self._queued_ids()
+        return ids.index(job_id) + 1 if job_id in ids else None
+
+    @property
+    def avg_job_seconds(self):
+        durations = self.table.store.recent_durations()
+        if not durations:
+            return self.initial_job_seconds
+        # JobQueue와 같은 가중치의 이동 평균
+        avg = self.initial_job_seconds
+        for elapsed in durations:
+            avg = 0.7 * avg + 0.3 * elapsed
+        return avg
+
+    def estimated_start_seconds(self, job_id):
+        ids = self._queued_ids()
+        if job_id not in ids:
+            return None
+        now = time.time()
+        avg = self.avg_job_seconds
+        running = self.table.store.list_by_status(self.running_statuses)
+        free_at = [max(avg - (now - job.get("started_at", now)), 0.0) for job in running.values()]
+        free_at = free_at[:self.workers]
+        free_at += [0.0] * (self.workers - len(free_at))
+        heapq.heapify(free_at)
+        for pending_id in ids:
+            start = heapq.heappop(free_at)
+            if pending_id == job_id:
+                return round(start, 1)
+            heapq.heappush(free_at, start + avg)
+        return None
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "running": len(self.table.store.list_by_status(self.running_statuses)),
+            "queued": len(self._queued_ids()),
+            "max_queued": self.max_queued,
+            "avg_job_seconds": round(self.avg_job_seconds, 1),
+        }
@@ -0,0 +1,2 @@
+from .job_store import JobStore, MemoryJobStore, SQLiteJobStore, create_job_store
+from .job_table import JobTable, JobRecord
@@ -0,0 +1,247 @@
+import json
+import sqlite3
+import threading
+import time
+
+
+def _json_default(value):
+    # numpy 정수/실수 등은 파이썬 기본 타입으로 변환
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+class JobStore:
+    """작업 저장소 인터페이스 (작업 메타데이터, 진행률, 결과 포인터)"""
+
+    def save(self, job_id, data):
+        raise NotImplementedError
+
+    def insert(self, job_id, data, max_count=None):
+        """새 작업 저장 → 같은 상태 작업 중 순번 (1부터)
+
+        max_count를 주면 같은 상태(data["status"]) 작업이 이미 max_count개 이상일 때 저장하지 않고
+        None을 반환한다. 개수 확인과 저장은 한 번에 처리되므로 여러 API 프로세스가 동시에 넣어도 넘치지 않는다.
+        """
+        raise NotImplementedError
+
+    def get(self, job_id):
+        raise NotImplementedError
+
+    def delete(self, job_id):
+        raise NotImplementedError
+
+    def update(self, job_id, fields):
+        """기존 작업에 필드만 병합 (다른 프로세스가 바꾼 나머지 필드는 유지)"""
+        raise NotImplementedError
+
+    def claim(self, fields, status="queued"):
+        """status 상태인 가장 오래된 작업에 fields를 병합하고 job_id 반환 (없으면 None)
+
+        여러 워커 프로세스가 동시에 호출해도 한 작업은 한 워커에게만 배정된다.
+        """
+        raise NotImplementedError
+
+    def list_by_status(self, statuses):
+        """지정 상태인 작업 {job_id: data} (생성 순서)"""
+        raise NotImplementedError
+
+    def recent_durations(self, limit=20):
+        """최근 완료된 작업의 소요 시간(finished_at - started_at) 리스트"""
+        raise NotImplementedError
+
+
+class MemoryJobStore(JobStore):
+    """프로세스 메모리 저장소 (재시작 시 사라짐, 테스트/로컬용)"""
+
+    def __init__(self):
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def save(self, job_id, data):
+        snapshot = json.loads(json.dumps(data, default=_json_default))
+        with self._lock:
+            self._jobs[job_id] = snapshot
+
+    def insert(self, job_id, data, max_count=None):
+        snapshot = json.loads(json.dumps(data, default=_json_default))
+        with self._lock:
+            count = sum(1 for other in self._jobs.values() if other.get("status") == snapshot.get("status"))
+            if max_count is not None and count >= max_count:
+                return None
+            self._jobs[job_id] = snapshot
+        return count + 1
+
+    def get(self, job_id):
+        with self._lock:
+            data = self._jobs.get(job_id)
+        return dict(data) if data is not None else None
+
+    def delete(self, job_id):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def update(self, job_id, fields):
+        snapshot = json.loads(json.dumps(fields, default=_json_default))
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(snapshot)
+
+    def claim(self, fields, status="queued"):
+        snapshot = json.loads(json.dumps(fields, default=_json_default))
+        with self._lock:
+            for job_id, data in self._jobs.items():
+                if data.get("status") == status:
+                    data.update(snapshot)
+                    return job_id
+        return None
+
+    def list_by_status(self, statuses):
+        with self._lock:
+            return {
+                job_id: dict(data) for job_id, data in self._jobs.items()
+                if data.get("status") in statuses
+            }
+
+    def recent_durations(self, limit=20):
+        with self._lock:
+            finished = [
+                data for data in self._jobs.values()
+                if data.get("status") == "done" and data.get("started_at") and data.get("finished_at")
+            ]
+        finished.sort(key=lambda data: data["finished_at"])
+        return [data["finished_at"] - data["started_at"] for data in finished[-limit:]]
+
+
+class SQLiteJobStore(JobStore):
+    """SQLite 저장소 (기본값)
+
+    WAL 모드라서 상태 조회(읽기)가 분석 스레드의 쓰기를 막지 않고,
+    연결은 스레드별로 따로 연다. 같은 파일을 API 서버와 분석 워커 프로세스가
+    함께 쓰므로 필드 병합/작업 배정은 BEGIN IMMEDIATE 트랜잭션 안에서 처리한다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " job_id TEXT PRIMARY KEY,"
+            " status TEXT,"
+            " updated_at REAL,"
+            " data TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
+        conn.commit()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def save(self, job_id, data):
+        conn = self._conn()
+        conn.execute(
+            "INSERT INTO jobs (job_id, status, updated_at, data) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(job_id) DO UPDATE SET"
+            " status = excluded.status, updated_at = excluded.updated_at, data = excluded.data",
+            (job_id, data.get("status"), time.time(), json.dumps(data, ensure_ascii=False, default=_json_default)),
+        )
+        conn.commit()
+
+    def insert(self, job_id, data, max_count=None):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            (count,) = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (data.get("status"),)).fetchone()
+            if max_count is not None and count >= max_count:
+                conn.rollback()
+                return None
+            conn.execute(
+                "INSERT INTO jobs (job_id, status, updated_at, data) VALUES (?, ?, ?, ?)",
+                (job_id, data.get("status"), time.time(), json.dumps(data, ensure_ascii=False, default=_json_default)),
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return count + 1
+
+    def _write(self, conn, job_id, data):
+        conn.execute(
+            "UPDATE jobs SET status = ?, updated_at = ?, data = ? WHERE job_id = ?",
+            (data.get("status"), time.time(), json.dumps(data, ensure_ascii=False, default=_json_default), job_id),
+        )
+
+    def update(self, job_id, fields):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is not None:
+                data = json.loads(row[0])
+                data.update(fields)
+                self._write(conn, job_id, data)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def claim(self, fields, status="queued"):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT job_id, data FROM jobs WHERE status = ? ORDER BY rowid LIMIT 1", (status,)
+            ).fetchone()
+            if row is not None:
+                data = json.loads(row[1])
+                data.update(fields)
+                self._write(conn, row[0], data)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return row[0] if row is not None else None
+
+    def get(self, job_id):
+        row = self._conn().execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, job_id):
+        conn = self._conn()
+        conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        conn.commit()
+
+    def list_by_status(self, statuses):
+        placeholders = ",".join("?" * len(statuses))
+        rows = self._conn().execute(
+            f"SELECT job_id, data FROM jobs WHERE status IN ({placeholders}) ORDER BY rowid",
+            list(statuses),
+        ).fetchall()
+        return {job_id: json.loads(data) for job_id, data in rows}
+
+    def recent_durations(self, limit=20):
+        rows = self._conn().execute(
+            "SELECT json_extract(data, '$.started_at'), json_extract(data, '$.finished_at') FROM jobs"
+            " WHERE status = 'done' AND json_extract(data, '$.finished_at') IS NOT NULL"
+            " ORDER BY updated_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return [finished - started for started, finished in reversed(rows) if started]
+
+
+def create_job_store(url):
+    """URL로 저장소 생성: "sqlite:///jobs.db" 또는 "memory://" """
+    if url.startswith("sqlite:///"):
+        return SQLiteJobStore(url[len("sqlite:///"):])
+    if url.startswith("memory://"):
+        return MemoryJobStore()
+    raise ValueError(f"지원하지 않는 작업 저장소: {url}")
@@ -0,0 +1,140 @@
+import threading
+import time
+
+# 바뀌면 바로 저장하는 필드 (나머지 진행률 필드는 flush_interval마다 저장)
+IMMEDIATE_FIELDS = {"status", "result", "error", "output_s3_key"}
+
+
+class JobRecord(dict):
+    """값이 바뀌면 JobTable에 알려서 저장소에 기록되는 작업 dict"""
+
+    def __init__(self, table, job_id, data):
+        super().__init__(data)
+        self._table = table
+        self._job_id = job_id
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._table._changed(self._job_id, key, value)
+
+
+class JobTable:
+    """기존 jobs dict 자리에 쓰는 write-through 작업 테이블
+
+    분석 스레드는 지금처럼 jobs[job_id]["..."] = ... 로 갱신하고, 상태/결과는 즉시,
+    진행률은 flush_interval 간격으로 저장소에 기록된다. 상태 조회는 메모리의 레코드를
+    먼저 읽고, 재시작 등으로 메모리에 없으면 저장소에서 불러온다.
+
+    저장할 때는 바뀐 필드만 병합하므로 API 서버와 분석 워커가 서로 다른 프로세스에서
+    같은 작업을 갱신해도(예: 취소 요청과 진행률) 서로의 값을 덮어쓰지 않는다.
+    max_age를 지정하면 그보다 오래된 메모리 레코드는 저장소에서 다시 읽는다
+    (0이면 매번, None이면 다시 읽지 않음). 아직 저장 안 된 필드는 다시 읽은 값 위에 유지된다.
+    """
+
+    def __init__(self, store, flush_interval=1.0, max_age=None):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.max_age = max_age
+        self._records = {}
+        self._loaded_at = {}
+        self._dirty = {}
+        self._last_flush = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, job_id):
+        return self._load(job_id) is not None
+
+    def __getitem__(self, job_id):
+        record = self._load(job_id)
+        if record is None:
+            raise KeyError(job_id)
+        return record
+
+    def __setitem__(self, job_id, data):
+        record = self._remember(job_id, data)
+        try:
+            self.store.save(job_id, dict(record))
+        except Exception as e:
+            print(f"[JOB STORE] save failed for {job_id}: {e}")
+
+    def insert(self, job_id, data, max_count=None):
+        """새 작업 저장 → 같은 상태 작업 중 순번, 같은 상태 작업이 max_count개 이상이면 저장하지 않고 None
+
+        확인과 저장이 저장소에서 한 번에 처리되므로 거절된 작업은 잠깐이라도 저장소에 나타나지 않는다.
+        """
+        position = self.store.insert(job_id, dict(data), max_count)
+        if position is not None:
+            self._remember(job_id, data)
+        return position
+
+    def _remember(self, job_id, data):
+        record = JobRecord(self, job_id, data)
+        with self._lock:
+            self._records[job_id] = record
+            self._loaded_at[job_id] = time.time()
+            self._dirty.pop(job_id, None)
+            self._last_flush[job_id] = time.time()
+        return record
+
+    def __delitem__(self, job_id):
+        self._forget(job_id)
+        self.store.delete(job_id)
+
+    def _forget(self, job_id):
+        with self._lock:
+            self._records.pop(job_id, None)
+            self._loaded_at.pop(job_id, None)
+            self._dirty.pop(job_id, None)
+            self._last_flush.pop(job_id, None)
+
+    def _is_fresh(self, job_id):
+        if self.max_age is None:
+            return True
+        return time.time() - self._loaded_at.get(job_id, 0) < self.max_age
+
+    def _load(self, job_id):
+        record = self._records.get(job_id)
+        if record is not None and self._is_fresh(job_id):
+            return record
+        data = self.store.get(job_id)
+        if data is None:
+            return None
+        with self._lock:
+            data.update(self._dirty.get(job_id, {}))
+            record = JobRecord(self, job_id, data)
+            self._records[job_id] = record
+            self._loaded_at[job_id] = time.time()
+            return record
+
+    def _changed(self, job_id, key, value):
+        with self._lock:
+            self._dirty.setdefault(job_id, {})[key] = value
+        if key in IMMEDIATE_FIELDS or time.time() - self._last_flush.get(job_id, 0) >= self.flush_interval:
+            self.flush(job_id)
+
+    def flush(self, job_id):
+        with self._lock:
+            fields = self._dirty.pop(job_id, None)
+            self._last_flush[job_id] = time.time()
+        if not fields:
+            return
+        try:
+            self.store.update(job_id, fields)
+        except Exception as e:
+            print(f"[JOB STORE] save failed for {job_id}: {e}")
+            # 다음 저장 때 다시 시도
+            with self._lock:
+                pending = self._dirty.setdefault(job_id, {})
+                for key, value in fields.items():
+                    pending.setdefault(key, value)
+
+    def claim(self, **fields):
+        """대기 중인 가장 오래된 작업을 가져와서 fields를 기록하고 job_id 반환 (없으면 None)"""
+        job_id = self.store.claim(fields)
+        if job_id is not None:
+            self._forget(job_id)
+        return job_id
+
+    def unfinished(self, statuses):
+        """지정 상태인 작업 {job_id: record} (재시작 복구용)"""
+        return {job_id: self[job_id] for job_id in self.store.list_by_status(statuses)}
@@ -0,0 +1,2 @@
+from .view_transform import BatchViewTransformer
+from .speed_distance import BatchSpeedAndDistanceEstimator
@@ -0,0 +1,107 @@
+import numpy as np
+
+
+class BatchSpeedAndDistanceEstimator:
+    """SpeedAndDistance_Estimator의 배열 버전
+
+    기존과 같이 frame_window 프레임 간격 구간마다 시작/끝 프레임의 position_transformed 거리로
+    속도(km/h)와 누적 이동 거리(m)를 구해 구간 안의 행에 기록한다. 다만 24fps 고정 대신 실제
+    frame_rate를 쓰고, 시작과 끝이 같은 마지막 구간(기존의 0 나누기)은 건너뛴다.
+    모든 구간을 (구간 시작 프레임, 트랙 ID) 키 검색 한 번으로 짝지어 계산한다.
+    """
+
+    def __init__(self, frame_rate=24.0, frame_window=5, sprint_speed=25.0, skip_kinds=("ball", "referees")):
+        self.frame_rate = float(frame_rate) if frame_rate and frame_rate > 0 else 24.0
+        self.frame_window = frame_window
+        self.sprint_speed = sprint_speed
+        self.skip_kinds = skip_kinds
+
+    def window_speeds(self, objects):
+        """구간별 (트랙 ID, 시작 프레임, 끝 프레임, 속도 km/h, 누적 거리 m) — 트랙 ID, 프레임 순 정렬"""
+        data = objects.data
+        num_frames = objects.num_frames
+        frames = data["frame"].astype(np.int64)
+        ids = data["track_id"].astype(np.int64)
+        key_base = int(ids.max()) + 1 if len(ids) else 1
+        keys = frames * key_base + ids  # 행이 (frame, track_id) 순이므로 정렬된 키
+
+        starts = np.flatnonzero(frames % self.frame_window == 0)
+        last = np.minimum(frames[starts] + self.frame_window, num_frames - 1)
+        ends = np.clip(np.searchsorted(keys, last * key_base + ids[starts]), 0, max(len(keys) - 1, 0))
+        start_pos = data["position_transformed"][starts].astype(np.float64)
+        end_pos = data["position_transformed"][ends].astype(np.float64)
+        valid = (
+            (keys[ends] == last * key_base + ids[starts])
+            & (last > frames[starts])
+            & ~np.isnan(start_pos).any(axis=1)
+            & ~np.isnan(end_pos).any(axis=1)
+        )
+        starts, last = starts[valid], last[valid]
+        distance = np.linalg.norm(end_pos[valid] - start_pos[valid], axis=1)
+        speed = distance / ((last - frames[starts]) / self.frame_rate) * 3.6
+
+        # 트랙별 누적 거리: (트랙 ID, 프레임) 순으로 정렬 후 그룹별 누적합
+        order = np.lexsort((frames[starts], ids[starts]))
+        starts, last, distance, speed = starts[order], last[order], distance[order], speed[order]
+        track_ids = ids[starts]
+        cumulative = np.cumsum(distance)
+        group_start = np.r_[True, track_ids[1:] != track_ids[:-1]] if len(track_ids) else np.zeros(0, bool)
+        offsets = (cumulative - distance)[group_start]
+        cumulative -= np.repeat(offsets, np.diff(np.r_[np.flatnonzero(group_start), len(track_ids)]))
+        return track_ids, frames[starts], last, speed, cumulative
+
+    def add_speed_and_distance(self, track_store):
+        """speed/distance 컬럼 기록 후 선수별 합계 [{"id", "team", "max_speed", "total_distance", "sprint_count"}] 반환"""
+        stats = []
+        for kind, objects in track_store.items():
+            data = objects.data
+            if kind in self.skip_kinds or len(data) == 0:
+                continue
+            track_ids, start_frames, last, speed, cumulative = self.window_speeds(objects)
+
+            # 각 행이 속한 구간 (구간 시작 프레임, 트랙 ID)을 찾아 [시작, 끝) 프레임 안이면 값 기록
+            frames = data["frame"].astype(np.int64)
+            ids = data["track_id"].astype(np.int64)
+            window_keys = track_ids * (objects.num_frames + 1) + start_frames
+            order = np.argsort(window_keys)
+            row_keys = ids * (objects.num_frames + 1) + (frames - frames % self.frame_window)
+            pos = np.clip(np.searchsorted(window_keys[order], row_keys), 0, max(len(order) - 1, 0))
+            if len(order):
+                window = order[pos]
+                hit = (window_keys[window] == row_keys) & (frames < last[window])
+                objects.set_column("speed", speed[window[hit]], hit)
+                objects.set_column("distance", cumulative[window[hit]], hit)
+
+            stats.extend(self.player_totals(objects, track_ids, speed, cumulative))
+        return stats
+
+    def player_totals(self, objects, track_ids, speed, cumulative):
+        """구간 결과(트랙 ID, 프레임 순)로 선수별 총 이동 거리, 최고 속도, 스프린트 횟수 계산"""
+        if len(track_ids) == 0:
+            return []
+        group_start = np.flatnonzero(np.r_[True, track_ids[1:] != track_ids[:-1]])
+        group_end = np.r_[group_start[1:], len(track_ids)] - 1
+        sprinting = speed >= self.sprint_speed
+        # 스프린트 구간이 새로 시작된 횟수 (같은 트랙의 직전 구간이 스프린트가 아니었던 경우)
+        entered = sprinting & ~np.r_[False, sprinting[:-1] & (track_ids[1:] == track_ids[:-1])]
+        sprint_count = np.add.reduceat(entered.astype(np.int64), group_start)
+        max_speed = np.maximum.reduceat(speed, group_start)
+
+        data = objects.data
+        teams = {}
+        if objects.has("team").any():
+            rows = objects.has("team") & (data["team"] > 0)
+            # 트랙별 마지막 팀 판정
+            teams = dict(zip(data["track_id"][rows].tolist(), data["team"][rows].tolist()))
+        return [
+            {
+                "id": int(track_id),
+                "team": int(teams.get(int(track_id), 0)),
+                "max_speed": round(float(top), 2),
+                "total_distance": round(float(total), 2),
+                "sprint_count": int(count),
+            }
+            for track_id, top, total, count in zip(
+                track_ids[group_start].tolist(), max_speed, cumulative[group_end], sprint_count
+            )
+        ]
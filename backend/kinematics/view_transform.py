@@ -0,0 +1,46 @@
+import cv2
+import numpy as np
+
+# ViewTransformer와 같은 경기장 기준점 (픽셀 사각형 → 68m x 23.32m 구간)
+PIXEL_VERTICES = ((110, 1035), (265, 275), (910, 260), (1640, 915))
+COURT_WIDTH = 68
+COURT_LENGTH = 23.32
+
+
+class BatchViewTransformer:
+    """ViewTransformer의 배열 버전: 전체 (프레임 x 트랙) 좌표에 원근 변환을 한 번에 적용
+
+    ViewTransformer.transform_point와 같이 정수로 자른 좌표가 기준 사각형 밖이면 변환하지 않는다 (NaN/None).
+    """
+
+    def __init__(self, pixel_vertices=PIXEL_VERTICES, court_width=COURT_WIDTH, court_length=COURT_LENGTH):
+        self.pixel_vertices = np.asarray(pixel_vertices, dtype=np.float32)
+        self.target_vertices = np.array(
+            [[0, court_width], [0, 0], [court_length, 0], [court_length, court_width]], dtype=np.float32
+        )
+        self.perspective_transformer = cv2.getPerspectiveTransform(self.pixel_vertices, self.target_vertices)
+
+    def inside(self, points):
+        """좌표 (n, 2)가 기준 사각형 안(경계 포함)인지 (cv2.pointPolygonTest >= 0과 동일, 볼록 사각형 가정)"""
+        points = np.trunc(np.asarray(points, dtype=np.float64))
+        vertices = self.pixel_vertices.astype(np.float64)
+        edges = np.roll(vertices, -1, axis=0) - vertices
+        relative = points[:, None, :] - vertices[None]
+        cross = edges[None, :, 0] * relative[..., 1] - edges[None, :, 1] * relative[..., 0]
+        return (cross >= 0).all(axis=1) | (cross <= 0).all(axis=1)
+
+    def transform(self, points):
+        """픽셀 좌표 (n, 2) → 경기장 좌표(m) (n, 2), 사각형 밖이거나 좌표가 없으면 NaN"""
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+        result = np.full(points.shape, np.nan, dtype=np.float32)
+        valid = ~np.isnan(points).any(axis=1)
+        valid[valid] = self.inside(points[valid])
+        if valid.any():
+            result[valid] = cv2.perspectiveTransform(points[valid][:, None, :], self.perspective_transformer)[:, 0]
+        return result
+
+    def add_transformed_positions(self, track_store):
+        """position_adjusted가 있는 모든 행에 position_transformed 기록 (밖이면 None)"""
+        for objects in track_store.objects.values():
+            mask = objects.has("position_adjusted")
+            objects.set_column("position_transformed", self.transform(objects.data["position_adjusted"][mask]), mask)
@@ -0,0 +1 @@
+from .model_registry import ModelRegistry, get_registry
@@ -0,0 +1,198 @@
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+def _rss_mb():
+    """현재 프로세스 RSS (MB), 측정 불가 시 0"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+class _Entry:
+    def __init__(self, loader):
+        self.loader = loader
+        self.model = None
+        self.lock = threading.Lock()
+        self.load_time = 0.0
+        self.memory_mb = 0.0
+        self.loaded_at = None
+        self.last_used = None
+        self.uses = 0
+        self.leases = set()
+
+
+class ModelRegistry:
+    """프로세스 전역 모델 레지스트리
+
+    모델을 처음 사용할 때(또는 preload 시) 한 번만 로드해서 모든 작업이 공유한다.
+    로드 시간/메모리 증가량을 기록하고, 오래 안 쓴 모델이나 메모리 한도를 넘을 때
+    가장 오래 안 쓴 모델부터 내려서 다음 사용 시 다시 로드한다.
+    작업 중인 모델은 언로드하지 않도록 작업마다 lease()로 감싸고, 작업이 진행되는 동안
+    가져간 모델은 그 작업이 끝날 때까지 유휴/메모리 정리 대상에서 빠진다.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._active = set()
+        self._lease_ids = itertools.count(1)
+
+    def register(self, name, loader):
+        """이름에 로더를 등록 (이미 있으면 기존 항목 유지)"""
+        with self._lock:
+            if name not in self._entries:
+                self._entries[name] = _Entry(loader)
+            return self._entries[name]
+
+    def get(self, name, loader=None):
+        """모델 반환 (로드 안 됐으면 로드). loader를 주면 미등록 이름도 바로 등록"""
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is None:
+            if loader is None:
+                raise KeyError(f"등록되지 않은 모델: {name}")
+            entry = self.register(name, loader)
+
+        # 같은 모델을 여러 작업이 동시에 요청해도 로드는 한 번만
+        with entry.lock:
+            if entry.model is None:
+                rss_before = _rss_mb()
+                t0 = time.perf_counter()
+                entry.model = entry.loader()
+                entry.load_time = time.perf_counter() - t0
+                entry.memory_mb = max(_rss_mb() - rss_before, 0.0)
+                entry.loaded_at = time.time()
+                print(f"[REGISTRY] loaded {name} in {entry.load_time:.2f}s (+{entry.memory_mb:.0f}MB)")
+            entry.last_used = time.time()
+            entry.uses += 1
+            # 작업 스레드가 아닌 곳(해설 스레드 풀 등)에서 가져가도 진행 중인 작업이 끝날 때까지 유지
+            with self._lock:
+                entry.leases |= self._active
+            return entry.model
+
+    def acquire(self):
+        """작업 시작: 이 작업이 끝날 때(release)까지 사용한 모델을 언로드하지 않음 → lease 번호"""
+        with self._lock:
+            lease_id = next(self._lease_ids)
+            self._active.add(lease_id)
+        return lease_id
+
+    def release(self, lease_id):
+        """작업 종료: lease 해제, 유휴 시간은 이 시점부터 계산"""
+        now = time.time()
+        with self._lock:
+            self._active.discard(lease_id)
+            for entry in self._entries.values():
+                if lease_id in entry.leases:
+                    entry.leases.discard(lease_id)
+                    entry.last_used = now
+
+    @contextmanager
+    def lease(self):
+        lease_id = self.acquire()
+        try:
+            yield lease_id
+        finally:
+            self.release(lease_id)
+
+    def _evictable(self, entry):
+        return entry.model is not None and not entry.leases
+
+    def preload(self, names):
+        for name in names:
+            try:
+                self.get(name)
+            except Exception as e:
+                print(f"[REGISTRY] preload failed: {name}: {e}")
+
+    def unload(self, name):
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is None:
+            return False
+        with entry.lock:
+            with self._lock:
+                if not self._evictable(entry):
+                    return False
+            entry.model = None
+        print(f"[REGISTRY] unloaded {name}")
+        return True
+
+    def evict_idle(self, max_idle_seconds):
+        """max_idle_seconds 동안 사용하지 않은 모델 언로드 (작업 중인 모델 제외) → 언로드한 이름 목록"""
+        now = time.time()
+        with self._lock:
+            idle = [
+                name for name, entry in self._entries.items()
+                if self._evictable(entry) and now - entry.last_used > max_idle_seconds
+            ]
+        return [name for name in idle if self.unload(name)]
+
+    def trim(self, max_rss_mb, min_freed_mb=1.0):
+        """RSS가 max_rss_mb를 넘으면 가장 오래 안 쓴 모델부터 언로드 (작업 중인 모델 제외)
+
+        RSS가 프레임 버퍼/트랙 데이터 때문에 큰 경우 모델을 내려도 줄지 않으므로,
+        언로드해도 min_freed_mb 이상 줄지 않으면 더 내리지 않고 멈춘다.
+        """
+        import gc
+
+        evicted = []
+        while True:
+            rss = _rss_mb()
+            if rss <= max_rss_mb:
+                break
+            with self._lock:
+                loaded = [(e.last_used, n) for n, e in self._entries.items() if self._evictable(e)]
+            if not loaded:
+                break
+            _, name = min(loaded)
+            if not self.unload(name):
+                continue
+            evicted.append(name)
+            gc.collect()
+            if rss - _rss_mb() < min_freed_mb:
+                print(f"[REGISTRY] unloading {name} freed no memory, trim stopped")
+                break
+        return evicted
+
+    def stats(self):
+        with self._lock:
+            items = list(self._entries.items())
+        return {
+            name: {
+                "loaded": entry.model is not None,
+                "load_time_sec": round(entry.load_time, 3),
+                "memory_mb": round(entry.memory_mb, 1),
+                "uses": entry.uses,
+                "last_used": entry.last_used,
+            }
+            for name, entry in items
+        }
+
+    def start_janitor(self, interval=60, max_idle_seconds=None, max_rss_mb=None):
+        """백그라운드에서 주기적으로 유휴 모델/메모리 한도 정리"""
+        def run():
+            while True:
+                time.sleep(interval)
+                if max_idle_seconds:
+                    self.evict_idle(max_idle_seconds)
+                if max_rss_mb:
+                    self.trim(max_rss_mb)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+
+_registry = ModelRegistry()
+
+
+def get_registry():
+    return _registry
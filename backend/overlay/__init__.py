@@ -0,0 +1,4 @@
+from .sprites import Sprite, SpriteCache, blend
+from .compositor import OverlayCompositor, OverlayTimeline, check_font
+from .overlay_data import build_overlay_data, write_overlay_data
+from .webvtt import subtitles_to_vtt, events_to_vtt
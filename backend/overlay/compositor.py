@@ -0,0 +1,160 @@
+import os
+
+import numpy as np
+
+from .sprites import Sprite, SpriteCache, blend
+
+
+def check_font(font_path):
+    """오버레이 한글 폰트 확인 (없으면 FileNotFoundError)
+
+    PIL 기본 폰트에는 한글 글리프가 없어 자막이 빈 상자로 그려지므로 대체 폰트로 넘어가지 않는다.
+    """
+    if not os.path.isfile(font_path):
+        raise FileNotFoundError(
+            f"오버레이 한글 폰트가 없습니다: {os.path.abspath(font_path)} "
+            "(OVERLAY_FONT_PATH로 지정하거나 OVERLAY_ENABLED=0으로 오버레이를 끄세요)"
+        )
+
+
+class OverlayCompositor:
+    """한글 해설/이벤트 자막과 볼 점유율 패널을 캐시된 스프라이트로 합성
+
+    문구와 패널은 내용이 처음 나올 때 PIL로 한 번만 RGBA 스프라이트로 그리고(BGR 변환 포함),
+    이후 프레임에서는 LRU 캐시의 스프라이트를 NumPy 알파 합성으로 제자리에 덮어쓴다.
+    프레임 번호별 표시 내용은 OverlayTimeline이 정한다.
+    """
+
+    def __init__(self, font_path="fonts/NanumGothic.ttf", cache_size=256):
+        check_font(font_path)
+        self.font_path = font_path
+        self.cache = SpriteCache(cache_size)
+        self._fonts = {}
+
+    def font(self, size):
+        if size not in self._fonts:
+            from PIL import ImageFont
+            self._fonts[size] = ImageFont.truetype(self.font_path, size)
+        return self._fonts[size]
+
+    def _wrap(self, text, font, max_width):
+        """max_width(px)를 넘지 않도록 단어 단위 줄바꿈 (단어가 너무 길면 글자 단위)"""
+        lines = []
+        for paragraph in text.split("\n"):
+            line = ""
+            for word in paragraph.split(" "):
+                candidate = f"{line} {word}" if line else word
+                if font.getlength(candidate) <= max_width:
+                    line = candidate
+                    continue
+                if line:
+                    lines.append(line)
+                line = ""
+                for char in word:
+                    if line and font.getlength(line + char) > max_width:
+                        lines.append(line)
+                        line = ""
+                    line += char
+            lines.append(line)
+        return lines
+
+    def _render(self, lines, size, color, background, padding, align):
+        from PIL import Image, ImageDraw
+
+        font = self.font(size)
+        spacing = size // 4
+        widths = [int(np.ceil(font.getlength(line))) for line in lines]
+        width = max(widths, default=0) + 2 * padding
+        height = len(lines) * size + (len(lines) - 1) * spacing + 2 * padding + size // 4
+        image = Image.new("RGBA", (max(width, 1), max(height, 1)), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        if background is not None:
+            b, g, r, a = background
+            draw.rounded_rectangle((0, 0, width - 1, height - 1), radius=size // 3, fill=(r, g, b, a))
+        b, g, r = color
+        for i, (line, line_width) in enumerate(zip(lines, widths)):
+            x = padding + ((width - 2 * padding - line_width) // 2 if align == "center" else 0)
+            draw.text((x, padding + i * (size + spacing)), line, font=font, fill=(r, g, b, 255))
+        rgba = np.asarray(image)
+        return Sprite(rgba[..., [2, 1, 0, 3]])
+
+    def text_sprite(self, text, size, color=(255, 255, 255), background=(0, 0, 0, 150), max_width=None,
+                    padding=None, align="center"):
+        """문구 스프라이트 (색은 BGR, background는 BGRA 또는 None)"""
+        padding = size // 2 if padding is None else padding
+        key = ("text", text, size, color, background, max_width, padding, align)
+
+        def build():
+            lines = self._wrap(text, self.font(size), max_width - 2 * padding) if max_width else text.split("\n")
+            return self._render(lines, size, color, background, padding, align)
+
+        return self.cache.get(key, build)
+
+    def compose(self, frame, timeline, frame_num):
+        """frame(BGR)에 frame_num 시점의 점유율 패널/해설/이벤트 자막을 합성"""
+        height, width = frame.shape[:2]
+        margin = height // 30
+        text_width = int(width * 0.6)
+        center_x = int(width * 0.36)
+        bottom = height - margin
+
+        event_text = timeline.event_text(frame_num)
+        if event_text:
+            sprite = self.text_sprite(event_text, height // 32, color=(0, 255, 255), max_width=text_width)
+            bottom -= sprite.height
+            blend(frame, sprite, center_x - sprite.width // 2, bottom)
+            bottom -= margin // 3
+
+        commentary = timeline.commentary(frame_num)
+        if commentary:
+            sprite = self.text_sprite(commentary, height // 28, max_width=text_width)
+            blend(frame, sprite, center_x - sprite.width // 2, bottom - sprite.height)
+
+        if timeline.has_possession:
+            team1, team2 = timeline.possession(frame_num)
+            sprite = self.text_sprite(
+                f"팀1 점유율: {team1}%\n팀2 점유율: {team2}%", height // 30,
+                color=(0, 0, 0), background=(255, 255, 255, 110), align="left",
+            )
+            blend(frame, sprite, width - margin - sprite.width, height - margin - sprite.height)
+        return frame
+
+
+class OverlayTimeline:
+    """프레임 번호 → 표시할 해설/이벤트 문구/점유율 (배열로 미리 계산)
+
+    - subtitles: [{"frame", "text"}] 해설 (다음 해설이 나올 때까지 유지)
+    - event_texts: 프레임별 이벤트 문구 (event_hold_frames 동안 유지)
+    - owner_team: 프레임별 볼 소유 팀 (0이면 없음), 정수 퍼센트 누적 점유율로 표시
+    """
+
+    def __init__(self, num_frames, subtitles=(), event_texts=None, owner_team=None, event_hold_frames=48):
+        frames = np.arange(num_frames)
+        subtitles = sorted(subtitles, key=lambda s: s["frame"])
+        self.subtitle_texts = [s["text"] for s in subtitles]
+        self.subtitle_index = np.searchsorted([s["frame"] for s in subtitles], frames, side="right") - 1
+
+        self.event_texts = (list(event_texts or []) + [""] * num_frames)[:num_frames]
+        has_event = np.fromiter((bool(text) for text in self.event_texts), dtype=bool, count=num_frames)
+        last_event = np.maximum.accumulate(np.where(has_event, frames, -1)) if num_frames else frames
+        self.event_index = np.where((last_event >= 0) & (frames - last_event <= event_hold_frames), last_event, -1)
+
+        self.has_possession = owner_team is not None
+        if self.has_possession:
+            owner_team = np.asarray(owner_team)[:num_frames]
+            team1, team2 = np.cumsum(owner_team == 1), np.cumsum(owner_team == 2)
+            total = team1 + team2
+            share = np.where(total > 0, team1 / np.maximum(total, 1), 0.5)
+            self.team1_percent = np.rint(share * 100).astype(int)
+
+    def commentary(self, frame_num):
+        index = self.subtitle_index[frame_num]
+        return self.subtitle_texts[index] if index >= 0 else ""
+
+    def event_text(self, frame_num):
+        index = self.event_index[frame_num]
+        return self.event_texts[index] if index >= 0 else ""
+
+    def possession(self, frame_num):
+        team1 = int(self.team1_percent[frame_num])
+        return team1, 100 - team1
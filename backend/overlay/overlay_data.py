@@ -0,0 +1,68 @@
+import gzip
+import json
+
+import numpy as np
+
+from .compositor import OverlayTimeline
+
+OVERLAY_DATA_VERSION = 1
+
+
+def _runs(values):
+    """프레임별 값 → 값이 바뀌는 지점만 [[시작 프레임, 값], ...]"""
+    values = np.asarray(values)
+    if not len(values):
+        return []
+    starts = np.concatenate([[0], np.flatnonzero(values[1:] != values[:-1]) + 1])
+    return [[int(start), int(values[start])] for start in starts]
+
+
+def _object_columns(objects, with_ids=True, with_team=False):
+    """ObjectTracks → 프레임 오프셋 + 행별 컬럼 (bbox는 정수 픽셀 x1,y1,x2,y2를 일렬로)"""
+    data = objects.data
+    bbox = data["bbox"]
+    valid = ~np.isnan(bbox).any(axis=1)
+    frames = data["frame"][valid]
+    columns = {
+        "offsets": np.searchsorted(frames, np.arange(objects.num_frames + 1)).tolist(),
+        "bbox": np.rint(bbox[valid]).astype(np.int32).ravel().tolist(),
+    }
+    if with_ids:
+        columns["id"] = data["track_id"][valid].tolist()
+    if with_team:
+        columns["team"] = data["team"][valid].tolist()
+        columns["has_ball"] = np.flatnonzero(data["has_ball"][valid]).tolist()
+    return columns
+
+
+def build_overlay_data(track_store, team_colors, owner_team, fps, width, height):
+    """프론트엔드가 원본 영상 위에 직접 그릴 프레임별 주석 데이터 (JSON 직렬화 가능한 dict)
+
+    draw_annotations 대신 브라우저가 같은 내용을 그리도록 컬럼형으로 압축해서 내보낸다.
+    - players/referees/ball: offsets[f]:offsets[f + 1]이 f번 프레임의 행 범위,
+      bbox는 행마다 정수 4개, players는 팀 번호와 볼 소유 행 번호(has_ball)를 함께 기록
+    - possession: 누적 팀1 점유율(정수 %)이 바뀌는 지점만 [[프레임, 팀1 %], ...]
+    - team_colors: {"1": [r, g, b]}, 좌표는 width x height(분석 해상도) 기준
+    """
+    num_frames = track_store.num_frames
+    possession = []
+    if owner_team is not None:
+        possession = _runs(OverlayTimeline(num_frames, owner_team=owner_team).team1_percent)
+    return {
+        "version": OVERLAY_DATA_VERSION,
+        "fps": float(fps),
+        "num_frames": int(num_frames),
+        "width": int(width),
+        "height": int(height),
+        "team_colors": team_colors,
+        "players": _object_columns(track_store["players"], with_team=True),
+        "referees": _object_columns(track_store["referees"]),
+        "ball": _object_columns(track_store["ball"], with_ids=False),
+        "possession": possession,
+    }
+
+
+def write_overlay_data(path, overlay_data):
+    """gzip 압축 JSON으로 저장 (S3에 Content-Encoding: gzip으로 올리면 브라우저가 바로 풀어서 읽음)"""
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(overlay_data, f, separators=(",", ":"))
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class Sprite:
+    """미리 래스터화한 BGRA 오버레이 조각
+
+    알파가 0인 가장자리는 잘라내고, 합성에 쓰는 (색 x 알파)와 (255 - 알파)를 미리 계산해 둔다.
+    """
+
+    __slots__ = ("premultiplied", "inverse_alpha", "height", "width")
+
+    def __init__(self, bgra):
+        bgra = np.asarray(bgra, dtype=np.uint8)
+        alpha = bgra[..., 3]
+        rows, cols = np.flatnonzero(alpha.any(axis=1)), np.flatnonzero(alpha.any(axis=0))
+        if len(rows):
+            bgra = bgra[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+        else:
+            bgra = bgra[:0, :0]
+        alpha = bgra[..., 3:].astype(np.uint32)
+        self.premultiplied = bgra[..., :3].astype(np.uint32) * alpha
+        self.inverse_alpha = 255 - alpha
+        self.height, self.width = bgra.shape[:2]
+
+    @property
+    def nbytes(self):
+        return self.premultiplied.nbytes + self.inverse_alpha.nbytes
+
+
+def blend(frame, sprite, x, y):
+    """frame(BGR uint8)의 (x, y) 위치에 sprite를 제자리에서 알파 합성 (프레임 밖은 잘라냄)"""
+    height, width = frame.shape[:2]
+    x0, y0 = max(int(x), 0), max(int(y), 0)
+    x1, y1 = min(int(x) + sprite.width, width), min(int(y) + sprite.height, height)
+    if x0 >= x1 or y0 >= y1:
+        return frame
+    sx, sy = x0 - int(x), y0 - int(y)
+    roi = frame[y0:y1, x0:x1]
+    inverse = sprite.inverse_alpha[sy:sy + y1 - y0, sx:sx + x1 - x0]
+    premultiplied = sprite.premultiplied[sy:sy + y1 - y0, sx:sx + x1 - x0]
+    roi[:] = (roi * inverse + premultiplied + 127) // 255
+    return frame
+
+
+class SpriteCache:
+    """키별 Sprite LRU 캐시 (같은 문구/패널은 한 번만 래스터화)"""
+
+    def __init__(self, max_items=256):
+        self.max_items = max_items
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        sprite = self._items.get(key)
+        if sprite is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return sprite
+        self.misses += 1
+        sprite = build()
+        self._items[key] = sprite
+        if len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+        return sprite
+
+    def __len__(self):
+        return len(self._items)
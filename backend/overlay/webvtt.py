@@ -0,0 +1,55 @@
+import numpy as np
+
+from .compositor import OverlayTimeline
+
+
+def vtt_timestamp(seconds):
+    """초 → WebVTT 시각 (HH:MM:SS.mmm)"""
+    millis = int(round(max(seconds, 0.0) * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
+
+def _cues(index, texts, fps):
+    """프레임별 문구 번호 배열(-1이면 없음) → [(시작 초, 끝 초, 문구)]
+
+    같은 번호가 이어지는 구간, 그리고 같은 문구가 끊김 없이 이어지는 구간은 큐 하나로 합친다.
+    """
+    index = np.asarray(index)
+    if not len(index):
+        return []
+    starts = np.concatenate([[0], np.flatnonzero(index[1:] != index[:-1]) + 1])
+    ends = np.concatenate([starts[1:], [len(index)]])
+    runs = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if index[start] < 0 or not texts[index[start]]:
+            continue
+        text = texts[index[start]]
+        if runs and runs[-1][1] == start and runs[-1][2] == text:
+            runs[-1][1] = end
+        else:
+            runs.append([start, end, text])
+    return [(start / fps, end / fps, text) for start, end, text in runs]
+
+
+def _to_vtt(cues):
+    blocks = ["WEBVTT"]
+    for i, (start, end, text) in enumerate(cues, 1):
+        # 빈 줄은 큐의 끝을 뜻하므로 문구 안의 빈 줄은 제거
+        text = "\n".join(line for line in text.splitlines() if line.strip())
+        blocks.append(f"{i}\n{vtt_timestamp(start)} --> {vtt_timestamp(end)}\n{text}")
+    return "\n\n".join(blocks) + "\n"
+
+
+def subtitles_to_vtt(subtitle_data, num_frames, fps):
+    """해설 [{"frame", "text"}] → WebVTT (다음 해설이 나올 때까지 표시, 영상 오버레이와 같은 규칙)"""
+    timeline = OverlayTimeline(num_frames, subtitle_data)
+    return _to_vtt(_cues(timeline.subtitle_index, timeline.subtitle_texts, fps))
+
+
+def events_to_vtt(event_texts, num_frames, fps, event_hold_frames=48):
+    """프레임별 이벤트 문구 → WebVTT (마지막 이벤트 후 event_hold_frames 동안 표시)"""
+    timeline = OverlayTimeline(num_frames, event_texts=event_texts, event_hold_frames=event_hold_frames)
+    return _to_vtt(_cues(timeline.event_index, timeline.event_texts, fps))
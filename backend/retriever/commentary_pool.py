@@ -0,0 +1,141 @@
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
+
+from .generate_commentary import generate_commentary, generate_commentary_batch, get_bedrock_client
+from .template_commentary import TemplateCommentary
+
+
+class CommentaryPool:
+    """해설 생성(FAISS 검색 + Bedrock 호출)을 스레드 풀에서 동시에 실행
+
+    이벤트 루프는 구간별 질의를 submit()으로 넘기고 바로 다음 구간으로 진행하며,
+    결과는 프레임 번호별로 모아서 completed()/results()에서 프레임 순서대로 돌려준다.
+    - max_in_flight: 동시에 진행하는 해설 요청 수 (Bedrock 동시 호출 제한)
+    - timeout: 요청 하나의 연결/응답 대기 제한(초), 넘으면 템플릿 해설로 대체
+    - batch_size: 2 이상이면 구간을 이만큼 모아서 한 번의 호출로 생성 (generate_commentary_batch),
+      배치 요청은 출력이 길어서 대기 제한을 구간 4개마다 timeout만큼 늘림
+    - mode: llm(Bedrock) / fast(TemplateCommentary만 사용, 외부 호출 없음)
+    - llm_budget: 풀을 만든 뒤 이 시간(초)이 지나도 끝나지 않은 구간은 템플릿 해설로 채움 (None이면 제한 없음)
+    """
+
+    def __init__(self, vector_store_path, max_in_flight=4, timeout=None, batch_size=1, mode="llm",
+                 llm_budget=None):
+        self.vector_store_path = vector_store_path
+        self.timeout = timeout
+        self.batch_size = max(batch_size, 1)
+        self.batch_timeout = timeout * math.ceil(self.batch_size / 4) if timeout else timeout
+        self.mode = mode
+        self.deadline = time.monotonic() + llm_budget if llm_budget else None
+        self.templates = TemplateCommentary()
+        self._executor = None
+        if mode == "llm":
+            # 클라이언트 생성은 스레드 안전하지 않으므로 워커 스레드가 쓰기 전에 미리 만들어 둠
+            get_bedrock_client(timeout)
+            get_bedrock_client(self.batch_timeout)
+            self._executor = ThreadPoolExecutor(max_workers=max(max_in_flight, 1), thread_name_prefix="commentary")
+        self._futures = []
+        self._pending = []
+        self._times = {}
+        self._fallbacks = {}
+        self._done = {}
+        self._expired = False
+        self._lock = threading.Lock()
+
+    def _store(self, frame_num, text):
+        with self._lock:
+            # 예산 초과로 템플릿을 채운 뒤 늦게 도착한 결과는 버림
+            if not self._expired:
+                self._done[frame_num] = {"frame": frame_num, "time": self._times[frame_num], "text": text}
+
+    def _generate(self, frame_num, query):
+        text = generate_commentary(
+            query, self.vector_store_path, timeout=self.timeout, fallback=self._fallbacks[frame_num],
+        )
+        self._store(frame_num, text)
+
+    def _generate_batch(self, segments):
+        results = generate_commentary_batch(
+            segments, self.vector_store_path, timeout=self.batch_timeout, single_timeout=self.timeout,
+            fallbacks={frame_num: self._fallbacks[frame_num] for frame_num, _ in segments},
+        )
+        for frame_num, text in results.items():
+            self._store(frame_num, text)
+
+    def _flush(self):
+        if not self._pending:
+            return
+        segments, self._pending = self._pending, []
+        if len(segments) == 1:
+            self._futures.append(self._executor.submit(self._generate, *segments[0]))
+        else:
+            self._futures.append(self._executor.submit(self._generate_batch, segments))
+
+    def _over_budget(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def submit(self, frame_num, time_text, query, situation=None):
+        """frame_num 구간 해설 요청 (결과는 {"frame", "time", "text"}, 배치가 차면 바로 전송)
+
+        situation은 TemplateCommentary 입력이며, fast 모드/호출 실패/예산 초과 시 이 템플릿 해설을 쓴다.
+        """
+        self._times[frame_num] = time_text
+        self._fallbacks[frame_num] = self.templates.generate(situation or {})
+        if self.mode != "llm" or self._over_budget():
+            self._store(frame_num, self._fallbacks[frame_num])
+            return
+        self._pending.append((frame_num, query))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+
+    def completed(self):
+        """지금까지 끝난 해설 (프레임 순)"""
+        with self._lock:
+            return [self._done[frame_num] for frame_num in sorted(self._done)]
+
+    def _expire(self):
+        """예산 초과: 끝나지 않은 구간을 템플릿 해설로 채우고 이후 결과는 무시"""
+        with self._lock:
+            missing = [frame_num for frame_num in self._times if frame_num not in self._done]
+            for frame_num in missing:
+                self._done[frame_num] = {
+                    "frame": frame_num, "time": self._times[frame_num], "text": self._fallbacks[frame_num],
+                }
+            self._expired = True
+        print(f"[COMMENTARY] LLM budget exceeded, {len(missing)} segments use template commentary")
+
+    def results(self, on_progress=None):
+        """남은 구간을 보내고 모든 해설이 끝날 때까지(최대 LLM 예산까지) 기다려서 프레임 순으로 반환
+
+        on_progress(done, total, completed)는 요청(단건/배치)이 하나 끝날 때마다 호출한 스레드에서 불린다
+        (done/total은 구간 수).
+        """
+        if self._over_budget():
+            for frame_num, _ in self._pending:
+                self._store(frame_num, self._fallbacks[frame_num])
+            self._pending = []
+        else:
+            self._flush()
+        total = len(self._times)
+        remaining = None if self.deadline is None else max(self.deadline - time.monotonic(), 0)
+        try:
+            for future in as_completed(self._futures, timeout=remaining):
+                future.result()
+                completed = self.completed()
+                if on_progress:
+                    on_progress(len(completed), total, completed)
+        except FutureTimeoutError:
+            self._expire()
+        return self.completed()
+
+    def close(self):
+        if self._executor is not None:
+            # 오류/예산 초과로 빠져나가는 경우 아직 시작하지 않은 요청은 취소 (예산 초과면 진행 중인 호출도 기다리지 않음)
+            self._executor.shutdown(wait=not self._expired, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
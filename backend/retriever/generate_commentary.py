@@ -5,57 +5,178 @@ import faiss
 from sentence_transformers import SentenceTransformer
 import boto3
 import json
+from functools import lru_cache
+
+from botocore.config import Config
+
+from model_registry import get_registry
+
+from .vector_store import (
+    INDEX_FILE, CommentaryDocs, check_embedding_dimension, load_embedding_model, read_index, read_meta, resolve_model,
+)
 
 # Bedrock 클라이언트 설정
 bedrock = boto3.client("bedrock-runtime", region_name=os.getenv("AWS_REGION", "us-east-1"))
 COMMENTARY_MODEL_ID = os.getenv("COMMENTARY_MODEL_ID", "us.anthropic.claude-opus-4-5-20251101-v1:0")
 
+COMMENTARY_SYSTEM_PROMPT = (
+    "당신은 축구 경기 실시간 해설가입니다. "
+    "주어진 경기 상황 데이터를 바탕으로 자연스럽고 생동감 있는 한국어 해설을 1~2문장으로 작성하세요. "
+    "참고 해설 예시를 톤 참고용으로 활용하되, 그대로 복사하지 마세요. "
+    "해설은 간결하고 흥미롭게 작성하세요."
+)
+
+@lru_cache(maxsize=None)
+def get_bedrock_client(timeout=None):
+    """Bedrock 클라이언트 (timeout 초를 주면 연결/응답 대기를 제한하고 재시도하지 않는 클라이언트)
+
+    boto3 클라이언트 생성은 스레드 안전하지 않으므로 여러 스레드에서 쓰기 전에 메인 스레드에서 먼저 호출한다.
+    """
+    if timeout is None:
+        return bedrock
+    return boto3.client(
+        "bedrock-runtime",
+        region_name=os.getenv("AWS_REGION", "us-east-1"),
+        config=Config(connect_timeout=timeout, read_timeout=timeout, retries={"max_attempts": 1}),
+    )
+
+def load_vector_store(vector_store_path):
+    """(index, docs, model) 벡터 스토어를 레지스트리에서 한 번만 로드해서 공유
+
+    디렉터리면 mmap 형식(retriever.vector_store: 인덱스/문장은 매핑, 임베딩 모델은 이름으로 로드해서
+    같은 모델을 쓰는 스토어끼리 공유), 파일이면 기존 pickle 형식.
+    """
+    registry = get_registry()
+    if os.path.isdir(vector_store_path):
+        def load():
+            meta = read_meta(vector_store_path)
+            model_name = resolve_model(vector_store_path, meta["model"])
+            index = read_index(os.path.join(vector_store_path, INDEX_FILE))
+            docs = CommentaryDocs.load(vector_store_path)
+            model = registry.get(f"embedding:{model_name}", lambda: load_embedding_model(model_name))
+            check_embedding_dimension(model, index, model_name)
+            return index, docs, model
+    else:
+        def load():
+            with open(vector_store_path, "rb") as f:
+                index, docs, model = pickle.load(f)
+            check_embedding_dimension(model, index, vector_store_path)
+            return index, docs, model
+    return registry.get(f"commentary:{vector_store_path}", load)
+
 def search_similar_commentary(query, vector_store_path, top_k=3):
-    with open(vector_store_path, "rb") as f:
-        index, docs, model = pickle.load(f)
+    index, docs, model = load_vector_store(vector_store_path)
     query_embedding = model.encode([query])
     query_embedding = np.array(query_embedding).astype("float32")
     distances, indices = index.search(query_embedding, top_k)
     top_sentences = [docs[i] for i in indices[0]]
     return top_sentences
 
-def generate_commentary(query, vector_store_path):
+def search_similar_commentary_batch(queries, vector_store_path, top_k=3):
+    """여러 질의를 한 번에 임베딩/검색 (질의마다 참고 해설 리스트)"""
+    index, docs, model = load_vector_store(vector_store_path)
+    query_embeddings = np.array(model.encode(list(queries))).astype("float32")
+    distances, indices = index.search(query_embeddings, top_k)
+    return [[docs[i] for i in row] for row in indices]
+
+def invoke_commentary_model(user_message, max_tokens=200, timeout=None):
+    """해설 모델 호출 → 응답 텍스트"""
+    request_body = {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": max_tokens,
+        "temperature": 0.8,
+        "system": COMMENTARY_SYSTEM_PROMPT,
+        "messages": [
+            {
+                "role": "user",
+                "content": user_message
+            }
+        ]
+    }
+    response = get_bedrock_client(timeout).invoke_model(
+        modelId=COMMENTARY_MODEL_ID,
+        body=json.dumps(request_body)
+    )
+    response_body = json.loads(response["body"].read())
+    return response_body["content"][0]["text"].strip()
+
+def generate_commentary(query, vector_store_path, timeout=None, fallback=None):
+    """검색한 참고 해설로 Bedrock 해설 생성
+
+    실패/시간 초과 시 fallback(예: 템플릿 해설)을, 없으면 가장 비슷한 참고 해설을 반환한다.
+    """
     similar_sentences = search_similar_commentary(query, vector_store_path)
     context = "\n".join(similar_sentences[:3])
     
     try:
-        system_prompt = (
-            "당신은 축구 경기 실시간 해설가입니다. "
-            "주어진 경기 상황 데이터를 바탕으로 자연스럽고 생동감 있는 한국어 해설을 1~2문장으로 작성하세요. "
-            "참고 해설 예시를 톤 참고용으로 활용하되, 그대로 복사하지 마세요. "
-            "해설은 간결하고 흥미롭게 작성하세요."
-        )
-        
         user_message = f"경기 상황:\n{query}\n\n참고 해설 예시:\n{context}"
-        
-        request_body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 200,
-            "temperature": 0.8,
-            "system": system_prompt,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": user_message
-                }
-            ]
-        }
-        
-        response = bedrock.invoke_model(
-            modelId=COMMENTARY_MODEL_ID,
-            body=json.dumps(request_body)
-        )
-        
-        response_body = json.loads(response["body"].read())
-        return response_body["content"][0]["text"].strip()
+        return invoke_commentary_model(user_message, timeout=timeout)
         
     except Exception as e:
         print(f"[BEDROCK ERROR] {e}")
+        if fallback:
+            return fallback
         if similar_sentences:
             return similar_sentences[0]
         return "해설을 생성할 수 없습니다."
+
+def parse_batch_commentary(text):
+    """[{"frame": n, "text": "..."}] JSON 배열 응답 → {frame: 해설} (앞뒤 설명/코드 블록은 무시)"""
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        items = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+    results = {}
+    for item in items if isinstance(items, list) else []:
+        if isinstance(item, dict) and str(item.get("text") or "").strip():
+            try:
+                results[int(item["frame"])] = str(item["text"]).strip()
+            except (KeyError, TypeError, ValueError):
+                continue
+    return results
+
+def generate_commentary_batch(segments, vector_store_path, timeout=None, single_timeout=None, fallbacks=None):
+    """여러 구간 [(frame, query)]의 해설을 한 번의 모델 호출로 생성 → {frame: 해설}
+
+    구간별 경기 상황과 참고 해설을 한 요청에 묶고 frame을 키로 한 JSON 배열로 받는다.
+    응답에서 빠졌거나 형식이 잘못된 구간만 generate_commentary 단건 호출로 다시 생성한다.
+    fallbacks({frame: 해설})가 있으면 배치 호출 자체가 실패/시간 초과일 때 단건 재시도 없이 그 해설을 쓴다.
+    """
+    fallbacks = fallbacks or {}
+    segments = list(segments)
+    if not segments:
+        return {}
+    references = search_similar_commentary_batch([query for _, query in segments], vector_store_path)
+    blocks = [
+        f"[구간 frame={frame}]\n경기 상황:\n{query}\n\n참고 해설 예시:\n" + "\n".join(similar[:3])
+        for (frame, query), similar in zip(segments, references)
+    ]
+    user_message = (
+        f"아래 {len(segments)}개 구간은 같은 경기의 연속된 장면입니다. 구간마다 해설을 작성하고, "
+        "앞뒤 구간과 같은 표현이 반복되지 않게 하세요.\n"
+        '다른 설명 없이 JSON 배열만 출력하세요: [{"frame": 구간 frame 번호, "text": "해설"}, ...]\n\n'
+        + "\n\n".join(blocks)
+    )
+
+    results = {}
+    try:
+        text = invoke_commentary_model(user_message, max_tokens=120 * len(segments) + 100, timeout=timeout)
+        results = parse_batch_commentary(text)
+    except Exception as e:
+        print(f"[BEDROCK ERROR] batch of {len(segments)}: {e}")
+        if all(frame in fallbacks for frame, _ in segments):
+            return {frame: fallbacks[frame] for frame, _ in segments}
+
+    wanted = {frame for frame, _ in segments}
+    results = {frame: text for frame, text in results.items() if frame in wanted}
+    missing = [(frame, query) for frame, query in segments if frame not in results]
+    if missing:
+        print(f"[COMMENTARY] batch fallback to single calls for {len(missing)}/{len(segments)} segments")
+    for frame, query in missing:
+        results[frame] = generate_commentary(
+            query, vector_store_path, timeout=single_timeout, fallback=fallbacks.get(frame),
+        )
+    return results
@@ -0,0 +1,105 @@
+import random
+
+
+class TemplateCommentary:
+    """구조화된 경기 상황 → 한국어 템플릿 해설 (외부 호출 없음)
+
+    situation은 {"player", "team", "speed", "ball_speed", "possession", "events"}
+    - player: 볼 소유 선수 ID (-1이면 없음), team: 볼 소유 팀 (없으면 None)
+    - speed: 소유 선수 속도(km/h), ball_speed: 볼 속도
+    - possession: 최근 점유율 (팀1 %, 팀2 %) 또는 None
+    - events: 직전 해설 이후 이벤트 종류 리스트 ("pass", "tackle", "shot", "goal")
+    가장 중요한 상황 하나로 문장을 고르고, 점유율이 한쪽으로 기울면 한 문장을 덧붙인다.
+    같은 종류의 문장이 연달아 나오지 않도록 직전에 쓴 템플릿은 건너뛴다.
+    """
+
+    TEMPLATES = {
+        "goal": [
+            "골! 팀{team}이 마침내 골망을 흔듭니다!",
+            "들어갔습니다! 팀{team}의 득점, 경기장이 뜨거워집니다!",
+            "골입니다! 팀{team}이 결정적인 한 방을 터뜨립니다!",
+        ],
+        "shot": [
+            "슈팅! 팀{team}이 골문을 향해 강하게 때립니다!",
+            "과감한 슈팅! 골키퍼가 긴장하는 순간입니다.",
+            "팀{team}의 날카로운 슈팅, 골문을 위협합니다!",
+        ],
+        "tackle": [
+            "깔끔한 태클! 팀{team}이 볼을 빼앗아 옵니다.",
+            "태클 성공! 공격의 흐름이 순식간에 끊깁니다.",
+            "과감한 수비, 팀{team}이 볼을 되찾습니다!",
+        ],
+        "passes": [
+            "팀{team}이 {count}번의 패스를 주고받으며 공격을 풀어갑니다.",
+            "짧은 패스 {count}번, 팀{team}이 차분하게 빌드업합니다.",
+            "팀{team}의 패스 플레이가 매끄럽게 이어집니다.",
+        ],
+        "pass": [
+            "패스 연결! 플레이어 {player}이 볼을 이어받습니다.",
+            "정확한 패스가 플레이어 {player}에게 향합니다.",
+            "팀{team}, 패스로 공간을 만들어 갑니다.",
+        ],
+        "sprint": [
+            "플레이어 {player}, 시속 {speed:.0f}km로 빠르게 치고 나갑니다!",
+            "엄청난 스피드! 플레이어 {player}이 측면을 돌파합니다!",
+            "플레이어 {player}이 속도를 붙여 전진합니다!",
+        ],
+        "owner": [
+            "팀{team}의 플레이어 {player}이 볼을 잡고 기회를 엿봅니다.",
+            "플레이어 {player}, 침착하게 볼을 지키며 동료를 찾습니다.",
+            "팀{team}이 볼을 소유한 채 공격 방향을 살핍니다.",
+        ],
+        "loose": [
+            "볼이 어느 쪽에도 확실히 잡히지 않습니다. 치열한 경합입니다.",
+            "주인 없는 볼을 두고 양 팀이 달려듭니다!",
+            "중원에서 볼 다툼이 이어지고 있습니다.",
+        ],
+        "dominant": [
+            "최근 점유율은 팀{leader}이 {share}%로 주도하고 있습니다.",
+            "팀{leader}이 {share}%의 점유율로 경기를 쥐고 있습니다.",
+        ],
+    }
+
+    def __init__(self, sprint_speed=20.0, dominant_share=65, seed=None):
+        self.sprint_speed = sprint_speed
+        self.dominant_share = dominant_share
+        self._random = random.Random(seed)
+        self._last = {}
+
+    def _pick(self, kind, **values):
+        templates = self.TEMPLATES[kind]
+        choices = [i for i in range(len(templates)) if i != self._last.get(kind)] or [0]
+        index = self._random.choice(choices)
+        self._last[kind] = index
+        return templates[index].format(**values)
+
+    def generate(self, situation):
+        player = situation.get("player", -1)
+        team = situation.get("team") or "?"
+        speed = situation.get("speed") or 0.0
+        events = list(situation.get("events") or [])
+        values = {"player": player, "team": team, "speed": speed}
+
+        if "goal" in events:
+            text = self._pick("goal", **values)
+        elif "shot" in events:
+            text = self._pick("shot", **values)
+        elif "tackle" in events:
+            text = self._pick("tackle", **values)
+        elif events.count("pass") >= 3:
+            text = self._pick("passes", count=events.count("pass"), **values)
+        elif "pass" in events and player is not None and player >= 0:
+            text = self._pick("pass", **values)
+        elif player is not None and player >= 0 and speed >= self.sprint_speed:
+            text = self._pick("sprint", **values)
+        elif player is not None and player >= 0:
+            text = self._pick("owner", **values)
+        else:
+            text = self._pick("loose", **values)
+
+        possession = situation.get("possession")
+        if possession:
+            leader, share = (1, possession[0]) if possession[0] >= possession[1] else (2, possession[1])
+            if share >= self.dominant_share:
+                text = f"{text} {self._pick('dominant', leader=leader, share=share)}"
+        return text
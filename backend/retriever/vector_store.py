@@ -0,0 +1,175 @@
+"""해설 검색용 벡터 스토어 (디렉터리 형식)
+
+    vector_store/
+        index.faiss        FAISS 인덱스 (메모리 매핑으로 로드)
+        docs_offsets.npy   문장별 시작 위치 int64 (문장 수 + 1개)
+        docs.bin           UTF-8 문장을 이어 붙인 blob
+        meta.json          {"version", "model", "count", "dim"} (model은 임베딩 모델 이름 또는 경로)
+
+인덱스와 문장 파일은 읽기 전용으로 mmap해서 같은 서버의 여러 분석 워커가 페이지 캐시를 공유하고,
+임베딩 모델은 이름으로 따로 로드해서 프로세스 안에서 하나만 쓴다.
+기존 vector_store.pkl((index, docs, model) pickle)은 아래 명령(build_vector_store)으로 변환한다.
+
+사용 예:
+    python -m retriever.vector_store commentary_ai/generator/vector_store.pkl commentary_ai/generator/vector_store
+    python -m retriever.vector_store vector_store.pkl vector_store --model <임베딩 모델 이름 또는 경로>
+"""
+import argparse
+import json
+import os
+import pickle
+
+import numpy as np
+
+VECTOR_STORE_VERSION = 1
+INDEX_FILE = "index.faiss"
+OFFSETS_FILE = "docs_offsets.npy"
+DOCS_FILE = "docs.bin"
+META_FILE = "meta.json"
+
+
+class CommentaryDocs:
+    """오프셋 + UTF-8 blob 문장 목록 (docs[i]로 필요한 문장만 디코딩)"""
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    @classmethod
+    def load(cls, store_dir):
+        offsets = np.load(os.path.join(store_dir, OFFSETS_FILE), mmap_mode="r")
+        blob_path = os.path.join(store_dir, DOCS_FILE)
+        # 빈 파일은 mmap할 수 없음
+        if os.path.getsize(blob_path):
+            blob = np.memmap(blob_path, dtype=np.uint8, mode="r")
+        else:
+            blob = np.zeros(0, dtype=np.uint8)
+        return cls(offsets, blob)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"문장 번호 범위 초과: {i}")
+        start, end = int(self.offsets[i]), int(self.offsets[i + 1])
+        return self.blob[start:end].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+def write_docs(store_dir, docs):
+    """문장 리스트 → docs_offsets.npy + docs.bin"""
+    encoded = [str(doc).encode("utf-8") for doc in docs]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+    np.save(os.path.join(store_dir, OFFSETS_FILE), offsets)
+    with open(os.path.join(store_dir, DOCS_FILE), "wb") as f:
+        for data in encoded:
+            f.write(data)
+
+
+def read_index(path):
+    """FAISS 인덱스를 읽기 전용 mmap으로 로드 (지원하지 않는 인덱스 종류/버전이면 일반 로드)
+
+    IO_FLAG_MMAP_IFC가 있는 faiss는 Flat 계열 벡터까지 파일을 그대로 매핑하고,
+    IO_FLAG_MMAP은 IVF 역색인 리스트를 매핑한다.
+    """
+    import faiss
+
+    flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY | getattr(faiss, "IO_FLAG_MMAP_IFC", 0)
+    try:
+        return faiss.read_index(path, flags)
+    except RuntimeError as e:
+        print(f"[VECTOR_STORE] mmap load failed ({e}), reading {path} into memory")
+        return faiss.read_index(path)
+
+
+def read_meta(store_dir):
+    with open(os.path.join(store_dir, META_FILE), encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("version") != VECTOR_STORE_VERSION:
+        raise ValueError(f"지원하지 않는 벡터 스토어 버전: {meta.get('version')} ({store_dir})")
+    return meta
+
+
+def resolve_model(store_dir, model):
+    """meta.json의 model이 스토어 디렉터리 기준 상대 경로로 존재하면 그 경로, 아니면 모델 이름 그대로"""
+    local = os.path.join(store_dir, model)
+    return os.path.abspath(local) if os.path.exists(local) else model
+
+
+def load_embedding_model(model):
+    """SentenceTransformer를 이름/경로로 로드 (CPU 추론)"""
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model, device="cpu")
+
+
+def save_vector_store(store_dir, index, docs, model):
+    """인덱스/문장/메타데이터를 디렉터리 형식으로 저장 (model은 임베딩 모델 이름 또는 경로)"""
+    import faiss
+
+    if index.ntotal != len(docs):
+        raise ValueError(f"인덱스 벡터 수({index.ntotal})와 문장 수({len(docs)})가 다릅니다")
+    os.makedirs(store_dir, exist_ok=True)
+    faiss.write_index(index, os.path.join(store_dir, INDEX_FILE))
+    write_docs(store_dir, docs)
+    meta = {"version": VECTOR_STORE_VERSION, "model": model, "count": len(docs), "dim": index.d}
+    with open(os.path.join(store_dir, META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    return meta
+
+
+def embedding_dimension(model):
+    """임베딩 모델의 출력 차원 (모델이 알려주지 않으면 한 문장을 인코딩해서 확인)"""
+    dim = model.get_sentence_embedding_dimension()
+    if dim is None:
+        dim = np.asarray(model.encode(["차원 확인"])).shape[1]
+    return int(dim)
+
+
+def check_embedding_dimension(model, index, model_name):
+    """임베딩 모델 차원과 인덱스 차원이 다르면 ValueError (다른 모델로 검색하는 것을 막기 위해)"""
+    dim = embedding_dimension(model)
+    if dim != index.d:
+        raise ValueError(f"임베딩 모델 {model_name} 차원({dim})이 인덱스 차원({index.d})과 다릅니다")
+
+
+def build_vector_store(pickle_path, store_dir, model=None):
+    """기존 (index, docs, model) pickle → 디렉터리 형식 변환
+
+    model을 주지 않으면 pickle 안의 모델을 store_dir/model에 저장하고 상대 경로로 참조한다.
+    (파인튜닝된 모델은 model_card_data.base_model/토크나이저 이름이 부모 체크포인트를 가리키므로
+    이름으로 다시 받으면 다른 가중치가 로드될 수 있음)
+    """
+    with open(pickle_path, "rb") as f:
+        index, docs, embedding_model = pickle.load(f)
+
+    if model is None:
+        model = "model"
+        embedding_model.save(os.path.join(store_dir, model))
+    else:
+        embedding_model = load_embedding_model(resolve_model(store_dir, model))
+    check_embedding_dimension(embedding_model, index, model)
+
+    meta = save_vector_store(store_dir, index, list(docs), model)
+    print(f"[VECTOR_STORE] {pickle_path} → {store_dir}: {meta['count']} docs, dim {meta['dim']}, model {model}")
+    return meta
+
+
+def main():
+    parser = argparse.ArgumentParser(description="해설 벡터 스토어 pickle을 mmap 디렉터리 형식으로 변환")
+    parser.add_argument("pickle_path", help="기존 vector_store.pkl")
+    parser.add_argument("store_dir", help="출력 디렉터리")
+    parser.add_argument("--model", default=None, help="임베딩 모델 이름/경로 (기본: pickle 안의 모델을 store_dir/model에 저장)")
+    args = parser.parse_args()
+    build_vector_store(args.pickle_path, args.store_dir, args.model)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+from .team_classifier import TeamClassifier
@@ -0,0 +1,211 @@
+import cv2
+import numpy as np
+
+
+def kmeans2(features, n_init=10, max_iter=50, seed=0):
+    """2개 군집 k-means (k-means++ 초기화, n_init번 중 관성이 가장 작은 결과) → (centers, labels)"""
+    rng = np.random.default_rng(seed)
+    features = np.asarray(features, dtype=np.float32)
+    best = None
+    for _ in range(n_init):
+        first = features[rng.integers(len(features))]
+        distance = ((features - first) ** 2).sum(axis=1)
+        total = distance.sum()
+        second = features[rng.choice(len(features), p=distance / total)] if total > 0 else first
+        centers = np.stack([first, second])
+        for _ in range(max_iter):
+            labels = ((features[:, None, :] - centers[None]) ** 2).sum(axis=2).argmin(axis=1)
+            updated = np.stack([
+                features[labels == k].mean(axis=0) if (labels == k).any() else centers[k] for k in range(2)
+            ])
+            if np.allclose(updated, centers):
+                break
+            centers = updated
+        inertia = ((features - centers[labels]) ** 2).sum()
+        if best is None or inertia < best[0]:
+            best = (inertia, centers, labels)
+    return best[1], best[2]
+
+
+class TeamClassifier:
+    """HSV 히스토그램 기반 팀 분류기 (TeamAssigner 대체)
+
+    - 특징: bbox 윗몸 가운데 영역을 작은 패치로 줄이고, 여러 선수의 패치를 한 장으로 이어 붙여
+      HSV 변환/히스토그램을 한 번에 계산한다. 잔디색 픽셀은 빼고, 채도가 낮은 픽셀(흰/검은 유니폼)은
+      명도 구간으로 센다.
+    - 팀 모델: 여러 프레임에서 모은 선수 특징으로 2개 군집 k-means(kmeans2)를 한 번만 학습하고,
+      이후에는 두 중심까지의 거리로 판정 (선수별 KMeans 없음).
+    - 캐시: 트랙 ID별 판정 투표를 저장하고 revalidate_interval 프레임마다 다시 판정해서 투표를 더한다.
+      처음 판정이 잘못돼도 이후 투표로 바로잡힌다.
+
+    TeamAssigner와 같이 team_colors({1: BGR, 2: BGR}), assign_team_color(), get_player_team()을 제공한다.
+    """
+
+    def __init__(self, hue_bins=16, sat_bins=4, value_bins=4, patch_size=16, min_saturation=40,
+                 grass_hue=(35, 85), fit_frames=8, revalidate_interval=120):
+        self.hue_bins = hue_bins
+        self.sat_bins = sat_bins
+        self.value_bins = value_bins
+        self.patch_size = patch_size
+        self.min_saturation = min_saturation
+        self.grass_hue = grass_hue
+        self.fit_frames = fit_frames
+        self.revalidate_interval = revalidate_interval
+
+        self.centers = None
+        self.team_colors = {}
+        self.votes = {}
+        self.last_checked = {}
+
+    @property
+    def fitted(self):
+        return self.centers is not None
+
+    @property
+    def num_bins(self):
+        return self.hue_bins * self.sat_bins + self.value_bins
+
+    def crop_patches(self, frame, bboxes):
+        """bbox별 윗몸 가운데 영역 → (n, patch, patch, 3) BGR 패치"""
+        size = self.patch_size
+        patches = np.zeros((len(bboxes), size, size, 3), dtype=np.uint8)
+        h, w = frame.shape[:2]
+        for i, (x1, y1, x2, y2) in enumerate(np.asarray(bboxes, dtype=np.float64)):
+            bw, bh = x2 - x1, y2 - y1
+            # 머리/다리/배경이 덜 섞이도록 높이 10~50%, 폭 가운데 60%만 사용
+            top, bottom = int(max(y1 + 0.1 * bh, 0)), int(min(y1 + 0.5 * bh, h))
+            left, right = int(max(x1 + 0.2 * bw, 0)), int(min(x2 - 0.2 * bw, w))
+            if bottom > top and right > left:
+                patches[i] = cv2.resize(frame[top:bottom, left:right], (size, size), interpolation=cv2.INTER_AREA)
+        return patches
+
+    def extract_features(self, patches):
+        """패치들 → (히스토그램 특징 (n, D), 유니폼 대표색 BGR (n, 3))"""
+        n, size = len(patches), self.patch_size
+        if n == 0:
+            return np.zeros((0, self.num_bins), dtype=np.float32), np.zeros((0, 3), dtype=np.float32)
+        # 패치를 세로로 이어 붙여서 색 공간 변환은 한 번만
+        hsv = cv2.cvtColor(patches.reshape(n * size, size, 3), cv2.COLOR_BGR2HSV).reshape(n, -1, 3)
+        hue, sat, val = (hsv[..., i].astype(np.int64) for i in range(3))
+
+        grass = (hue >= self.grass_hue[0]) & (hue <= self.grass_hue[1]) & (sat >= self.min_saturation)
+        weight = (~grass).astype(np.float32)
+        # 잔디뿐인 패치는 전체 픽셀 사용
+        weight[weight.sum(axis=1) == 0] = 1.0
+
+        chromatic = sat >= self.min_saturation
+        bins = np.where(
+            chromatic,
+            (hue * self.hue_bins // 180) * self.sat_bins + sat * self.sat_bins // 256,
+            self.hue_bins * self.sat_bins + val * self.value_bins // 256,
+        )
+        offsets = np.arange(n)[:, None] * self.num_bins
+        hist = np.bincount((bins + offsets).ravel(), weights=weight.ravel(), minlength=n * self.num_bins)
+        hist = hist.reshape(n, self.num_bins)
+        # 제곱근(Hellinger) 정규화로 유클리드 거리가 히스토그램 유사도를 반영하도록
+        hist = np.sqrt(hist / hist.sum(axis=1, keepdims=True)).astype(np.float32)
+
+        pixels = patches.reshape(n, -1, 3).astype(np.float32)
+        colors = (pixels * weight[..., None]).sum(axis=1) / weight.sum(axis=1, keepdims=True)
+        return hist, colors
+
+    def frame_features(self, frame, bboxes):
+        return self.extract_features(self.crop_patches(frame, bboxes))
+
+    def fit(self, samples):
+        """samples: [(frame, bboxes), ...] 여러 프레임의 선수 bbox로 팀 모델 학습"""
+        features = [self.frame_features(frame, bboxes) for frame, bboxes in samples if len(bboxes)]
+        if not features:
+            return False
+        return self.fit_features(
+            np.concatenate([hist for hist, _ in features]), np.concatenate([colors for _, colors in features])
+        )
+
+    def fit_features(self, features, colors):
+        """미리 계산한 특징/대표색으로 팀 모델 학습
+
+        선수가 2명 미만이거나 특징이 모두 같아서 한쪽 군집이 비면 학습하지 않고 False
+        (팀 색이 NaN이 되지 않도록, 다음 프레임 묶음에서 다시 학습).
+        """
+        if len(features) < 2:
+            return False
+        centers, labels = kmeans2(features)
+        if not ((labels == 0).any() and (labels == 1).any()):
+            print(f"[TEAM] {len(features)} players fall into one cluster, fit skipped")
+            return False
+        self.centers = centers
+        for team in (1, 2):
+            self.team_colors[team] = colors[labels == team - 1].mean(axis=0).astype(np.float64)
+        print(f"[TEAM] fitted on {len(features)} players")
+        return True
+
+    def sample_indices(self, num_frames):
+        """학습용 프레임 번호 (구간 전체에 고르게)"""
+        count = min(self.fit_frames, num_frames)
+        return sorted(set(np.linspace(0, num_frames - 1, count).astype(int).tolist())) if count else []
+
+    def predict(self, features):
+        """특징 (n, D) → 팀 (n,) (1 또는 2)"""
+        distance = np.linalg.norm(features[:, None, :] - self.centers[None], axis=2)
+        return distance.argmin(axis=1) + 1
+
+    def decision(self, track_id):
+        votes = self.votes.get(track_id)
+        return int(np.argmax(votes)) + 1 if votes is not None else 0
+
+    def pending(self, track_ids, frame_num):
+        """판정이 없거나 재판정 시점이 된 트랙의 인덱스"""
+        return [
+            i for i, track_id in enumerate(track_ids)
+            if track_id not in self.votes or frame_num - self.last_checked[track_id] >= self.revalidate_interval
+        ]
+
+    def vote(self, track_ids, features, frame_num):
+        """특징으로 판정한 팀을 트랙별 투표에 더함"""
+        for track_id, team in zip(track_ids, self.predict(features).tolist()):
+            votes = self.votes.setdefault(track_id, np.zeros(2, dtype=np.int64))
+            votes[team - 1] += 1
+            self.last_checked[track_id] = frame_num
+
+    def classify(self, frame, track_ids, bboxes, frame_num):
+        """한 프레임의 선수들 팀 판정 (캐시가 없거나 재판정 시점인 트랙만 특징 계산)"""
+        track_ids = [int(t) for t in track_ids]
+        need = self.pending(track_ids, frame_num)
+        if need:
+            hist, _ = self.frame_features(frame, np.asarray(bboxes)[need])
+            self.vote([track_ids[i] for i in need], hist, frame_num)
+        return np.array([self.decision(track_id) for track_id in track_ids], dtype=np.int8)
+
+    def color_table(self):
+        """팀 번호 → BGR 색 배열 (0번은 미판정)"""
+        table = np.zeros((3, 3), dtype=np.float32)
+        for team, color in self.team_colors.items():
+            table[team] = color
+        return table
+
+    def assign_tracks(self, frames, players, frame_offset=0):
+        """프레임 묶음과 같은 구간의 players(ObjectTracks)에 team/team_color 컬럼 기록
+
+        아직 학습 전이면 이 프레임들에서 고르게 뽑은 프레임으로 먼저 학습한다.
+        """
+        data = players.data
+        if not self.fitted:
+            self.fit([(frames[i], data["bbox"][players.frame_rows(i)]) for i in self.sample_indices(len(frames))])
+        if not self.fitted or len(data) == 0:
+            return
+
+        teams = np.zeros(len(data), dtype=np.int8)
+        for frame_num, frame in enumerate(frames):
+            rows = players.frame_rows(frame_num)
+            if rows.stop > rows.start:
+                teams[rows] = self.classify(frame, data["track_id"][rows], data["bbox"][rows], frame_offset + frame_num)
+        assigned = teams > 0
+        players.set_column("team", teams[assigned], assigned)
+        players.set_column("team_color", self.color_table()[teams[assigned]], assigned)
+
+    # TeamAssigner 호환 인터페이스
+    def assign_team_color(self, frame, player_detections):
+        self.fit([(frame, [p["bbox"] for p in player_detections.values()])])
+
+    def get_player_team(self, frame, player_bbox, player_id, frame_num=0):
+        return int(self.classify(frame, [player_id], [player_bbox], frame_num)[0])
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# backend/ 패키지(detectors, video_io, trackers 등)를 테스트에서 바로 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
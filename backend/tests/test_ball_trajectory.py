@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from ball_trajectory import interpolate_ball
+
+
+def box(cx, cy, half=4.0):
+    return [cx - half, cy - half, cx + half, cy + half]
+
+
+def random_boxes(seed, num_frames=200, missing=0.6):
+    rng = np.random.default_rng(seed)
+    centers = np.cumsum(rng.normal(0, 3, (num_frames, 2)), axis=0) + 500
+    boxes = np.array([box(x, y, rng.uniform(3, 6)) for x, y in centers])
+    boxes[rng.random(num_frames) < missing] = np.nan
+    # 앞뒤 끝 구간도 비어 있도록
+    boxes[:7] = np.nan
+    boxes[-5:] = np.nan
+    return boxes
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_pandas_interpolate_bfill(seed):
+    pd = pytest.importorskip("pandas")
+    boxes = random_boxes(seed)
+    # tracker.interpolate_ball_positions
+    expected = pd.DataFrame(boxes, columns=["x1", "y1", "x2", "y2"]).interpolate().bfill().to_numpy()
+    np.testing.assert_allclose(interpolate_ball(boxes, max_speed=0).bbox, expected)
+
+
+def test_linear_fill_between_and_beyond_detections():
+    boxes = np.full((7, 4), np.nan)
+    boxes[2] = box(10, 10)
+    boxes[5] = box(40, 10)
+    bbox = interpolate_ball(boxes, max_speed=0).bbox
+    centers = (bbox[:, :2] + bbox[:, 2:]) / 2
+    assert centers[:, 0].tolist() == [10, 10, 10, 20, 30, 40, 40]
+
+
+def test_single_spike_is_rejected_and_interpolated():
+    boxes = np.array([box(100 + 2 * f, 100) for f in range(10)])
+    boxes[5] = box(600, 400)
+    trajectory = interpolate_ball(boxes, max_speed=80)
+    assert np.flatnonzero(trajectory.outlier).tolist() == [5]
+    assert trajectory.detected.all()
+    np.testing.assert_allclose(trajectory.bbox[5], box(110, 100))
+
+
+def test_sustained_jump_and_endpoints_are_kept():
+    # 이후 감지가 새 위치에서 이어지면 (다른 공/카메라 전환) 튀는 값이 아님
+    boxes = np.array([box(100, 100)] * 5 + [box(600, 100)] * 5)
+    assert not interpolate_ball(boxes, max_speed=80).outlier.any()
+    # 양 끝 감지는 판단하지 않음
+    boxes = np.array([box(600, 400)] + [box(100 + f, 100) for f in range(1, 9)] + [box(900, 900)])
+    assert not interpolate_ball(boxes, max_speed=80).outlier.any()
+
+
+def test_spike_threshold_uses_speed_per_frame():
+    # 감지 사이 간격이 길면 같은 거리도 느린 이동
+    boxes = np.full((41, 4), np.nan)
+    boxes[0], boxes[20], boxes[40] = box(0, 0), box(1000, 0), box(0, 0)
+    assert not interpolate_ball(boxes, max_speed=80).outlier.any()
+
+
+def test_confidence_halves_every_half_life_from_nearest_kept_detection():
+    boxes = np.full((21, 4), np.nan)
+    boxes[0] = box(10, 10)
+    boxes[20] = box(30, 10)
+    confidence = interpolate_ball(boxes, confidence_half_life=5).confidence
+    gap = np.minimum(np.arange(21), 20 - np.arange(21))
+    np.testing.assert_allclose(confidence, 0.5 ** (gap / 5))
+    assert confidence[0] == confidence[20] == 1.0
+    assert confidence[5] == pytest.approx(0.5)
+    assert confidence[10] == pytest.approx(0.25)
+
+
+def test_rejected_spike_gets_interpolated_confidence():
+    boxes = np.array([box(100 + 2 * f, 100) for f in range(10)])
+    boxes[5] = box(600, 400)
+    confidence = interpolate_ball(boxes, max_speed=80, confidence_half_life=5).confidence
+    assert confidence[5] == pytest.approx(0.5 ** (1 / 5))
+    assert (np.delete(confidence, 5) == 1.0).all()
+
+
+def test_no_detections():
+    trajectory = interpolate_ball(np.full((4, 4), np.nan))
+    assert np.isnan(trajectory.bbox).all()
+    assert (trajectory.confidence == 0).all()
+    assert len(trajectory.to_objects().data) == 0
@@ -0,0 +1,116 @@
+"""BatchedDetector 전처리/후처리 (가중치 없이 합성 출력으로 검사)"""
+import numpy as np
+import pytest
+
+from detectors.batched_detector import BatchedDetector, letterbox
+
+NAMES = {0: "ball", 1: "goalkeeper", 2: "player", 3: "referee"}
+
+
+class FakeDetector(BatchedDetector):
+    """입력 배치를 기록하고, 각 이미지에서 흰 사각형을 찾아 xywh + 클래스 점수로 내보내는 감지기"""
+
+    def __init__(self, **kwargs):
+        super().__init__(NAMES, **kwargs)
+        self.batches = []
+
+    def _infer(self, batch):
+        self.batches.append(batch.copy())
+        out = np.zeros((len(batch), 4 + len(NAMES), 1), dtype=np.float32)
+        for i, image in enumerate(batch):
+            ys, xs = np.nonzero(image.min(axis=0) > 0.99)
+            if len(xs):
+                x1, y1, x2, y2 = xs.min(), ys.min(), xs.max() + 1, ys.max() + 1
+                out[i, :4, 0] = [(x1 + x2) / 2, (y1 + y2) / 2, x2 - x1, y2 - y1]
+                out[i, 4 + 2, 0] = 0.9
+        return out
+
+
+def frame_with_box(h, w, box):
+    frame = np.zeros((h, w, 3), dtype=np.uint8)
+    x1, y1, x2, y2 = box
+    frame[y1:y2, x1:x2] = 255
+    return frame
+
+
+def raw_prediction(boxes, classes, scores, nc=len(NAMES)):
+    """xyxy 박스 목록 → (4 + nc, N) 원시 출력"""
+    boxes = np.asarray(boxes, dtype=np.float32)
+    pred = np.zeros((4 + nc, len(boxes)), dtype=np.float32)
+    pred[0] = (boxes[:, 0] + boxes[:, 2]) / 2
+    pred[1] = (boxes[:, 1] + boxes[:, 3]) / 2
+    pred[2] = boxes[:, 2] - boxes[:, 0]
+    pred[3] = boxes[:, 3] - boxes[:, 1]
+    pred[4 + np.asarray(classes), np.arange(len(boxes))] = scores
+    return pred
+
+
+@pytest.mark.parametrize("shape", [(480, 640), (640, 480), (360, 1280), (640, 640)])
+def test_letterbox_keeps_ratio_and_centers(shape):
+    h, w = shape
+    image, ratio, (left, top) = letterbox(np.zeros((h, w, 3), dtype=np.uint8), 640)
+    assert image.shape == (640, 640, 3)
+    assert ratio == min(640 / h, 640 / w)
+    assert abs(left - (640 - round(w * ratio)) / 2) <= 0.5
+    assert abs(top - (640 - round(h * ratio)) / 2) <= 0.5
+    assert (image[:top] == 114).all() and (image[top + round(h * ratio):] == 114).all()
+
+
+@pytest.mark.parametrize(
+    "shape, box",
+    [((480, 640), (100, 50, 180, 210)), ((360, 1280), (900, 20, 1000, 300)), ((720, 405), (10, 600, 120, 700))],
+)
+def test_detect_maps_boxes_back_to_frame_coordinates(shape, box):
+    detector = FakeDetector(batch_size=2)
+    (detections,) = detector.detect([frame_with_box(*shape, box)])
+    assert detections.shape == (1, 6)
+    # 리사이즈 반올림 오차(원본 기준 1~2픽셀) 이내로 복원
+    np.testing.assert_allclose(detections[0, :4], box, atol=2.5)
+    assert detections[0, 4] == pytest.approx(0.9)
+    assert detections[0, 5] == 2
+
+
+def test_postprocess_inverts_letterbox_and_clips():
+    detector = FakeDetector()
+    ratio, pad, shape = 0.5, (0, 140), (720, 1280)
+    # letterbox 좌표의 박스 → (x - pad) / ratio
+    pred = raw_prediction([[10, 150, 60, 200], [600, 480, 700, 520]], [2, 0], [0.8, 0.6])
+    detections = detector._postprocess(pred, ratio, pad, shape, conf=0.1)
+    np.testing.assert_allclose(detections[0, :4], [20, 20, 120, 120])
+    # 프레임 밖으로 나간 부분은 잘라냄
+    np.testing.assert_allclose(detections[1, :4], [1200, 680, 1280, 720])
+
+
+def test_nms_is_class_aware():
+    detector = FakeDetector(iou=0.5)
+    boxes = [[100, 100, 200, 200], [105, 105, 205, 205], [102, 102, 202, 202], [400, 400, 420, 420]]
+    pred = raw_prediction(boxes, [2, 2, 3, 0], [0.9, 0.8, 0.7, 0.05])
+    detections = detector._postprocess(pred, 1.0, (0, 0), (640, 640), conf=0.1)
+    # 같은 클래스의 겹치는 박스만 제거되고, 다른 클래스는 겹쳐도 남음; conf 미만은 제외
+    assert detections[:, 5].tolist() == [2, 3]
+    np.testing.assert_allclose(detections[:, 4], [0.9, 0.7])
+    np.testing.assert_allclose(detections[:, :4], [boxes[0], boxes[2]])
+
+
+def test_max_det_and_empty_output():
+    detector = FakeDetector(max_det=2)
+    boxes = [[i * 50, 0, i * 50 + 40, 40] for i in range(5)]
+    pred = raw_prediction(boxes, [2] * 5, [0.5, 0.9, 0.7, 0.3, 0.8])
+    detections = detector._postprocess(pred, 1.0, (0, 0), (640, 640), conf=0.1)
+    np.testing.assert_allclose(detections[:, 4], [0.9, 0.8])
+    empty = detector._postprocess(pred, 1.0, (0, 0), (640, 640), conf=0.95)
+    assert empty.shape == (0, 6)
+
+
+def test_last_batch_is_zero_padded():
+    detector = FakeDetector(batch_size=4)
+    frames = [frame_with_box(480, 640, (10 * i, 10, 10 * i + 30, 40)) for i in range(6)]
+    results = detector.detect(frames)
+    assert len(results) == 6
+    assert [batch.shape for batch in detector.batches] == [(4, 3, 640, 640)] * 2
+    last = detector.batches[1]
+    assert last[:2].any(axis=(1, 2, 3)).all()
+    assert not last[2:].any()
+    # 채운 자리의 출력은 결과에 섞이지 않음
+    for i, detections in enumerate(results):
+        np.testing.assert_allclose(detections[:, :4], [[10 * i, 10, 10 * i + 30, 40]], atol=2.5)
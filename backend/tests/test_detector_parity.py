@@ -0,0 +1,43 @@
+"""CPU 감지기 백엔드(ONNX/OpenVINO)와 PyTorch(best.pt) 경로의 정합성
+
+내보낸 모델과 샘플 영상이 있을 때만 실행한다 (없으면 skip).
+    PARITY_VIDEO=sample.mp4 PARITY_MODEL=models/best.onnx python -m pytest tests/test_detector_parity.py
+"""
+import os
+
+import pytest
+
+WEIGHTS = os.getenv("PARITY_WEIGHTS", os.path.join("models", "best.pt"))
+BACKEND = os.getenv("PARITY_BACKEND", "onnx")
+MODEL = os.getenv("PARITY_MODEL", os.path.join("models", "best.onnx" if BACKEND == "onnx" else "best_openvino_model"))
+VIDEO = os.getenv("PARITY_VIDEO", "")
+FRAMES = int(os.getenv("PARITY_FRAMES", "24"))
+
+
+@pytest.fixture(scope="module")
+def parity():
+    for path, what in ((WEIGHTS, "PyTorch 가중치"), (MODEL, "내보낸 모델"), (VIDEO, "샘플 영상(PARITY_VIDEO)")):
+        if not path or not os.path.exists(path):
+            pytest.skip(f"{what} 없음: {path!r}")
+    pytest.importorskip("ultralytics")
+    pytest.importorskip("onnxruntime" if BACKEND == "onnx" else "openvino")
+
+    from detectors.parity import run_parity
+
+    return run_parity(VIDEO, WEIGHTS, BACKEND, MODEL, num_frames=FRAMES)
+
+
+def test_detection_match_rate(parity):
+    assert parity["match_rate"] >= 0.95
+
+
+@pytest.mark.parametrize("key", ["players", "referees", "ball"])
+def test_track_counts_per_frame(parity, key):
+    tracks = parity["tracks"][key]
+    assert tracks["frames"][0] == tracks["frames"][1]
+    assert tracks["max_count_diff"] <= 2
+
+
+@pytest.mark.parametrize("key", ["players", "referees", "ball"])
+def test_track_id_overlap(parity, key):
+    assert parity["tracks"][key]["id_match"] >= 0.9
@@ -0,0 +1,139 @@
+"""event_engine.detect_events와 기존 프레임 루프(analyze_video 이벤트 감지)의 동등성"""
+import math
+
+import numpy as np
+import pytest
+
+from event_engine import EventRules, detect_events, mark_ball_owners
+from track_store import TrackStore
+
+
+def frame_to_time(f, fps=24):
+    m, s = divmod(int(f / fps), 60)
+    return f"{m}:{s:02d}"
+
+
+def assign_ball_to_player(players, ball_bbox, max_player_ball_distance=70):
+    """PlayerBallAssigner.assign_ball_to_player (기존 구현)"""
+    ball_position = (int((ball_bbox[0] + ball_bbox[2]) / 2), int((ball_bbox[1] + ball_bbox[3]) / 2))
+    minimum_distance = 99999
+    assigned_player = -1
+    for player_id, player in players.items():
+        bbox = player["bbox"]
+        distance_left = math.dist((bbox[0], bbox[-1]), ball_position)
+        distance_right = math.dist((bbox[2], bbox[-1]), ball_position)
+        distance = min(distance_left, distance_right)
+        if distance < max_player_ball_distance and distance < minimum_distance:
+            minimum_distance = distance
+            assigned_player = player_id
+    return assigned_player
+
+
+def reference_events(tracks):
+    """user-011 이전 analyze_video의 프레임 루프 (해설/진행률 부분 제외)
+
+    볼 속도는 볼 트랙의 speed를 읽는다 (기존 루프는 프레임 딕셔너리에서 읽어 항상 0이었음).
+    """
+    team_ball_control = []
+    previous_player_with_ball = -1
+    previous_team_with_ball = None
+    event_data = []
+    events_list = []
+    owners = []
+
+    for frame_num, player_track in enumerate(tracks["players"]):
+        ball_bbox = tracks["ball"][frame_num][1]["bbox"]
+        ball_speed = tracks["ball"][frame_num][1].get("speed", 0)
+        assigned_player = assign_ball_to_player(player_track, ball_bbox)
+        owners.append(assigned_player)
+
+        if assigned_player != -1:
+            current_team_with_ball = tracks["players"][frame_num][assigned_player]["team"]
+            team_ball_control.append(current_team_with_ball)
+        else:
+            current_team_with_ball = previous_team_with_ball
+
+        event_texts = []
+
+        if previous_player_with_ball != -1 and assigned_player != previous_player_with_ball:
+            if assigned_player != -1:
+                event_text = f"패스 성공! 플레이어 {previous_player_with_ball} ➡ 플레이어 {assigned_player}"
+                event_texts.append(event_text)
+                events_list.append({"frame": frame_num, "time": frame_to_time(frame_num), "type": "pass", "description": event_text})
+        elif assigned_player != -1:
+            speed = tracks["players"][frame_num][assigned_player].get("speed", 0)
+            if speed > 1.5:
+                event_texts.append(f"플레이어 {assigned_player}이 드리블 중입니다.")
+
+        if previous_team_with_ball is not None and current_team_with_ball != previous_team_with_ball:
+            event_text = "태클 성공! 상대 팀이 볼을 차단했습니다."
+            event_texts.append(event_text)
+            events_list.append({"frame": frame_num, "time": frame_to_time(frame_num), "type": "tackle", "description": event_text})
+
+        if ball_speed > 8:
+            event_text = "슛! 볼이 빠른 속도로 움직입니다."
+            event_texts.append(event_text)
+            events_list.append({"frame": frame_num, "time": frame_to_time(frame_num), "type": "shot", "description": event_text})
+
+        goal_area = ((100, 50), (200, 100))
+        if goal_area[0][0] < ball_bbox[0] < goal_area[1][0] and goal_area[0][1] < ball_bbox[1] < goal_area[1][1]:
+            event_text = "골! 볼이 골대에 들어갔습니다!"
+            event_texts.append(event_text)
+            events_list.append({"frame": frame_num, "time": frame_to_time(frame_num), "type": "goal", "description": event_text})
+
+        event_data.append("\n".join(event_texts))
+        previous_player_with_ball = assigned_player
+        previous_team_with_ball = current_team_with_ball
+
+    return {"events": events_list, "event_data": event_data, "team_ball_control": team_ball_control, "owners": owners}
+
+
+def random_tracks(seed, num_frames=300, num_players=8):
+    """선수들이 움직이고 볼이 선수 사이를 오가는 무작위 트랙 (좌표는 정수라 같은 거리도 생김)"""
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 400, (num_players, 2))
+    teams = rng.integers(1, 3, num_players)
+    ball = rng.uniform(0, 400, 2)
+    players, balls = [], []
+    for _ in range(num_frames):
+        positions = np.clip(positions + rng.normal(0, 6, positions.shape), 0, 400)
+        if rng.random() < 0.1:
+            ball = positions[rng.integers(num_players)] + rng.normal(0, 30, 2)
+        ball = ball + rng.normal(0, 5, 2)
+        frame = {}
+        for player_id in sorted(rng.choice(np.arange(1, num_players + 1), rng.integers(3, num_players + 1), replace=False)):
+            x, y = np.round(positions[player_id - 1])
+            frame[int(player_id)] = {
+                "bbox": [float(x - 10), float(y - 40), float(x + 10), float(y)],
+                "team": int(teams[player_id - 1]),
+                "speed": float(rng.choice([0.0, 1.0, 3.0])),
+            }
+        players.append(frame)
+        bx, by = np.round(ball)
+        balls.append({1: {"bbox": [float(bx - 3), float(by - 3), float(bx + 3), float(by + 3)],
+                          "speed": float(rng.choice([0.0, 4.0, 10.0], p=[0.8, 0.15, 0.05]))}})
+    return {"players": players, "referees": [{} for _ in range(num_frames)], "ball": balls}
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_detect_events_matches_frame_loop(seed):
+    tracks = random_tracks(seed)
+    expected = reference_events(tracks)
+
+    track_store = TrackStore.from_tracks(tracks)
+    result = detect_events(track_store, EventRules())
+    mark_ball_owners(track_store, result)
+
+    assert result.owner.tolist() == expected["owners"]
+    assert result.listed_events(frame_to_time) == expected["events"]
+    assert result.frame_texts() == expected["event_data"]
+    assert result.team_ball_control == expected["team_ball_control"]
+    # 소유 선수 행에만 has_ball
+    for frame_num, frame in enumerate(track_store["players"].to_frames()):
+        owned = [player_id for player_id, info in frame.items() if info.get("has_ball")]
+        assert owned == ([expected["owners"][frame_num]] if expected["owners"][frame_num] != -1 else [])
+
+
+def test_random_tracks_cover_every_event_type():
+    events = [e["type"] for seed in range(10) for e in reference_events(random_tracks(seed))["events"]]
+    assert {"pass", "tackle", "shot", "goal"} <= set(events)
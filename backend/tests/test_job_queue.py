@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+
+from job_queue import JobQueue, QueueFullError, StoreJobQueue
+from job_store import JobTable, MemoryJobStore, SQLiteJobStore
+
+
+def new_job(s3_key="videos/a.mp4"):
+    return {"status": "queued", "s3_key": s3_key, "result": None, "error": None}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def table(request, tmp_path):
+    store = MemoryJobStore() if request.param == "memory" else SQLiteJobStore(str(tmp_path / "jobs.db"))
+    return JobTable(store)
+
+
+def test_store_queue_rejects_without_saving(table):
+    queue = StoreJobQueue(table, max_queued=2)
+    assert queue.submit("a", job=new_job()) == 1
+    assert queue.submit("b", job=new_job()) == 2
+    with pytest.raises(QueueFullError):
+        queue.submit("c", job=new_job())
+    assert "c" not in table
+    assert list(table.store.list_by_status(("queued",))) == ["a", "b"]
+    # 진행 중 작업은 대기 수에 들어가지 않음
+    table["a"]["status"] = "analyzing"
+    assert queue.submit("c", job=new_job()) == 2
+
+
+def test_store_queue_concurrent_submits_do_not_overflow(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    # API 프로세스마다 따로 여는 저장소를 스레드로 흉내
+    queues = [StoreJobQueue(JobTable(SQLiteJobStore(path)), max_queued=5) for _ in range(4)]
+    accepted = []
+
+    def submit(queue, worker):
+        for i in range(5):
+            try:
+                queue.submit(f"{worker}-{i}", job=new_job())
+                accepted.append(f"{worker}-{i}")
+            except QueueFullError:
+                pass
+
+    threads = [threading.Thread(target=submit, args=(queue, n)) for n, queue in enumerate(queues)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(accepted) == 5
+    assert sorted(SQLiteJobStore(path).list_by_status(("queued",))) == sorted(accepted)
+
+
+def test_store_queue_position_of_recovered_job(table):
+    queue = StoreJobQueue(table, max_queued=2)
+    table["a"] = new_job()
+    assert queue.submit("a") == 1
+
+
+def test_job_queue_saves_only_accepted_jobs():
+    table = JobTable(MemoryJobStore())
+    queue = JobQueue(lambda job_id, s3_key: None, max_queued=1, table=table)
+    assert queue.submit("a", "videos/a.mp4", job=new_job()) == 1
+    assert table["a"]["s3_key"] == "videos/a.mp4"
+    with pytest.raises(QueueFullError):
+        queue.submit("b", "videos/b.mp4", job=new_job())
+    assert "b" not in table
@@ -0,0 +1,133 @@
+"""kinematics 배열 버전과 기존 ViewTransformer / SpeedAndDistance_Estimator 루프의 동등성"""
+import math
+
+import cv2
+import numpy as np
+import pytest
+
+from kinematics import BatchViewTransformer, BatchSpeedAndDistanceEstimator
+from kinematics.view_transform import PIXEL_VERTICES, COURT_WIDTH, COURT_LENGTH
+from track_store import TrackStore
+
+
+class ViewTransformer:
+    """기존 ViewTransformer (점 하나씩 변환)"""
+
+    def __init__(self):
+        self.pixel_vertices = np.array(PIXEL_VERTICES).astype(np.float32)
+        target_vertices = np.array(
+            [[0, COURT_WIDTH], [0, 0], [COURT_LENGTH, 0], [COURT_LENGTH, COURT_WIDTH]]
+        ).astype(np.float32)
+        self.perspective_transformer = cv2.getPerspectiveTransform(self.pixel_vertices, target_vertices)
+
+    def transform_point(self, point):
+        p = (int(point[0]), int(point[1]))
+        if cv2.pointPolygonTest(self.pixel_vertices, p, False) < 0:
+            return None
+        reshaped_point = point.reshape(-1, 1, 2).astype(np.float32)
+        return cv2.perspectiveTransform(reshaped_point, self.perspective_transformer).reshape(-1, 2)
+
+    def add_transformed_position_to_tracks(self, tracks):
+        for object_tracks in tracks.values():
+            for frame in object_tracks:
+                for track_info in frame.values():
+                    transformed = self.transform_point(np.array(track_info["position_adjusted"]))
+                    track_info["position_transformed"] = None if transformed is None else transformed.squeeze().tolist()
+
+
+def add_speed_and_distance_to_tracks(tracks, frame_rate=24, frame_window=5):
+    """기존 SpeedAndDistance_Estimator.add_speed_and_distance_to_tracks (fix_speed_estimator.py 적용)"""
+    total_distance = {}
+    for kind, object_tracks in tracks.items():
+        if kind in ("ball", "referees"):
+            continue
+        number_of_frames = len(object_tracks)
+        for frame_num in range(0, number_of_frames, frame_window):
+            last_frame = min(frame_num + frame_window, number_of_frames - 1)
+            for track_id in object_tracks[frame_num]:
+                if track_id not in object_tracks[last_frame]:
+                    continue
+                start_position = object_tracks[frame_num][track_id]["position_transformed"]
+                end_position = object_tracks[last_frame][track_id]["position_transformed"]
+                if start_position is None or end_position is None:
+                    continue
+                distance_covered = math.dist(start_position, end_position)
+                time_elapsed = (last_frame - frame_num) / frame_rate
+                speed_km_per_hour = (distance_covered / time_elapsed if time_elapsed > 0 else 0) * 3.6
+                total_distance.setdefault(kind, {}).setdefault(track_id, 0)
+                total_distance[kind][track_id] += distance_covered
+                for frame_num_batch in range(frame_num, last_frame):
+                    if track_id not in tracks[kind][frame_num_batch]:
+                        continue
+                    tracks[kind][frame_num_batch][track_id]["speed"] = speed_km_per_hour
+                    tracks[kind][frame_num_batch][track_id]["distance"] = total_distance[kind][track_id]
+
+
+def random_tracks(seed, num_frames=103, num_players=12):
+    """기준 사각형 안팎을 오가며 가끔 사라지는 선수 트랙 (마지막 구간 길이 0 포함)"""
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform([0, 200], [1800, 1100], (num_players, 2))
+    tracks = {"players": [], "referees": [], "ball": []}
+    for _ in range(num_frames):
+        positions += rng.normal(0, 8, positions.shape)
+        visible = rng.random(num_players) > 0.1
+        tracks["players"].append({
+            player_id + 1: {"position_adjusted": (float(x), float(y))}
+            for player_id, (x, y) in enumerate(positions) if visible[player_id]
+        })
+        tracks["referees"].append({})
+        tracks["ball"].append({1: {"position_adjusted": tuple(map(float, positions[0]))}})
+    return tracks
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_view_transformer_matches_point_loop(seed):
+    track_store = TrackStore.from_tracks(random_tracks(seed))
+    expected = track_store.to_tracks()
+    ViewTransformer().add_transformed_position_to_tracks(expected)
+    BatchViewTransformer().add_transformed_positions(track_store)
+    actual = track_store.to_tracks()
+
+    inside = 0
+    for kind in expected:
+        for expected_frame, actual_frame in zip(expected[kind], actual[kind]):
+            assert expected_frame.keys() == actual_frame.keys()
+            for track_id, info in expected_frame.items():
+                got = actual_frame[track_id]["position_transformed"]
+                if info["position_transformed"] is None:
+                    assert got is None
+                else:
+                    inside += 1
+                    np.testing.assert_allclose(got, info["position_transformed"], rtol=1e-5, atol=1e-4)
+    assert inside > 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_speed_and_distance_matches_window_loop(seed):
+    track_store = TrackStore.from_tracks(random_tracks(seed))
+    BatchViewTransformer().add_transformed_positions(track_store)
+    expected = track_store.to_tracks()
+    add_speed_and_distance_to_tracks(expected, frame_rate=24)
+    stats = BatchSpeedAndDistanceEstimator(frame_rate=24).add_speed_and_distance(track_store)
+    actual = track_store.to_tracks()
+
+    assigned = 0
+    for expected_frame, actual_frame in zip(expected["players"], actual["players"]):
+        for track_id, info in expected_frame.items():
+            got = actual_frame[track_id]
+            assert ("speed" in info) == ("speed" in got)
+            if "speed" in info:
+                assigned += 1
+                assert got["speed"] == pytest.approx(info["speed"], rel=1e-9)
+                assert got["distance"] == pytest.approx(info["distance"], rel=1e-9)
+    assert assigned > 0
+    assert all("speed" not in info for frame in actual["ball"] for info in frame.values())
+
+    # 선수별 총 거리 = 트랙의 마지막 누적 거리
+    last_distance = {}
+    for frame in expected["players"]:
+        for track_id, info in frame.items():
+            if "distance" in info:
+                last_distance[track_id] = info["distance"]
+    totals = {s["id"]: s["total_distance"] for s in stats}
+    assert totals == {track_id: round(d, 2) for track_id, d in last_distance.items()}
@@ -0,0 +1,43 @@
+import threading
+
+import model_registry.model_registry as registry_module
+from model_registry import ModelRegistry
+
+
+def test_leased_model_is_not_evicted_until_release():
+    registry = ModelRegistry()
+    with registry.lease():
+        model = registry.get("yolo", object)
+        assert registry.evict_idle(-1) == []
+        assert registry.get("yolo") is model
+    assert registry.evict_idle(-1) == ["yolo"]
+
+
+def test_model_fetched_from_another_thread_during_job_is_leased():
+    registry = ModelRegistry()
+    lease_id = registry.acquire()
+    thread = threading.Thread(target=registry.get, args=("commentary", object))
+    thread.start()
+    thread.join()
+    assert registry.evict_idle(-1) == []
+    registry.release(lease_id)
+    assert registry.evict_idle(-1) == ["commentary"]
+
+
+def test_trim_stops_when_unloading_frees_no_memory(monkeypatch):
+    registry = ModelRegistry()
+    for name in ("a", "b", "c"):
+        registry.get(name, object)
+    # RSS가 모델이 아닌 다른 메모리 때문에 큰 경우
+    monkeypatch.setattr(registry_module, "_rss_mb", lambda: 4096.0)
+    assert len(registry.trim(1024)) == 1
+    assert sum(stat["loaded"] for stat in registry.stats().values()) == 2
+
+
+def test_trim_unloads_until_under_limit(monkeypatch):
+    registry = ModelRegistry()
+    for name in ("a", "b", "c"):
+        registry.get(name, object)
+    loaded = lambda: sum(stat["loaded"] for stat in registry.stats().values())
+    monkeypatch.setattr(registry_module, "_rss_mb", lambda: 1000.0 + 100 * loaded())
+    assert registry.trim(1150) == ["a", "b"]
@@ -0,0 +1,11 @@
+import pytest
+
+from overlay import OverlayCompositor, check_font
+
+
+def test_missing_font_fails_instead_of_falling_back(tmp_path):
+    missing = tmp_path / "NanumGothic.ttf"
+    with pytest.raises(FileNotFoundError, match="OVERLAY_FONT_PATH"):
+        check_font(str(missing))
+    with pytest.raises(FileNotFoundError):
+        OverlayCompositor(str(missing))
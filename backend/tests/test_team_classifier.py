@@ -0,0 +1,22 @@
+import numpy as np
+
+from team_classifier import TeamClassifier
+
+
+def test_fit_features_identical_players_is_not_fitted():
+    classifier = TeamClassifier()
+    assert classifier.fit_features(np.ones((3, classifier.num_bins)), np.ones((3, 3))) is False
+    assert not classifier.fitted
+    assert classifier.team_colors == {}
+
+
+def test_fit_features_two_teams():
+    classifier = TeamClassifier()
+    rng = np.random.default_rng(0)
+    features = np.concatenate([rng.normal(0, 0.01, (5, 8)), rng.normal(1, 0.01, (5, 8))])
+    colors = np.concatenate([np.tile([255, 0, 0], (5, 1)), np.tile([0, 0, 255], (5, 1))]).astype(np.float32)
+    assert classifier.fit_features(features, colors)
+    assert all(np.isfinite(color).all() for color in classifier.team_colors.values())
+    teams = classifier.predict(features)
+    assert len(set(teams[:5].tolist())) == 1 and len(set(teams[5:].tolist())) == 1
+    assert teams[0] != teams[5]
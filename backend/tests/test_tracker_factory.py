@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+from detectors import create_drawing_tracker, create_tracker, draw_window_annotations
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# fix_tracker_model.py 패치 전 upstream trackers/tracker.py의 Tracker.__init__
+UPSTREAM_TRACKER = """
+loaded = []
+
+
+def YOLO(model_path):
+    loaded.append(model_path)
+    return "yolo:" + model_path
+
+
+class Tracker:
+    def __init__(self, model_path):
+        self.model = YOLO(model_path)
+        self.tracker = object()
+"""
+
+
+class FakeTracker:
+    """upstream Tracker처럼 윈도우 안 순번을 점유율 박스 프레임 번호로 넘기는 Tracker"""
+
+    def __init__(self):
+        self.frame_nums = []
+
+    def draw_team_ball_control(self, frame, frame_num, team_ball_control):
+        self.frame_nums.append(frame_num)
+        return frame
+
+    def draw_annotations(self, frames, tracks, team_ball_control):
+        return [self.draw_team_ball_control(frame, i, team_ball_control) for i, frame in enumerate(frames)]
+
+
+def test_draw_window_annotations_passes_absolute_frame_numbers():
+    tracker = FakeTracker()
+    for start in (0, 3, 6):
+        draw_window_annotations(tracker, [None] * 3, {}, [], start)
+    assert tracker.frame_nums == list(range(9))
+    assert "draw_team_ball_control" not in vars(tracker)
+
+
+def test_draw_window_annotations_keeps_instance_override():
+    tracker = FakeTracker()
+    calls = []
+    override = lambda frame, frame_num, team_ball_control: calls.append(frame_num) or frame
+    tracker.draw_team_ball_control = override
+    draw_window_annotations(tracker, [None] * 2, {}, [], 10)
+    assert calls == [10, 11]
+    assert tracker.draw_team_ball_control is override
+
+
+def install_trackers(monkeypatch, tmp_path, patched):
+    path = tmp_path / "tracker.py"
+    path.write_text(UPSTREAM_TRACKER)
+    if patched:
+        subprocess.run([sys.executable, os.path.join(BACKEND_DIR, "fix_tracker_model.py"), str(path)], check=True)
+    module = types.ModuleType("trackers")
+    exec(compile(path.read_text(), str(path), "exec"), module.__dict__)
+    monkeypatch.setitem(sys.modules, "trackers", module)
+    return module
+
+
+def test_patched_tracker_takes_model_without_loading_weights(monkeypatch, tmp_path):
+    module = install_trackers(monkeypatch, tmp_path, patched=True)
+    tracker = create_drawing_tracker("best.pt")
+    assert module.loaded == []
+    assert tracker.model.to("cuda") is tracker.model
+    # 패치해도 model을 주지 않으면 기존처럼 로드
+    assert module.Tracker("best.pt").model == "yolo:best.pt"
+
+
+def test_unpatched_tracker_falls_back_to_assigning_model(monkeypatch, tmp_path):
+    module = install_trackers(monkeypatch, tmp_path, patched=False)
+    tracker = create_drawing_tracker("best.pt")
+    assert module.loaded == ["best.pt"]
+    assert tracker.model.to("cuda") is tracker.model
+
+
+def test_pytorch_trackers_share_one_model_with_separate_state(monkeypatch, tmp_path):
+    install_trackers(monkeypatch, tmp_path, patched=True)
+    loaded = []
+    ultralytics = types.ModuleType("ultralytics")
+    ultralytics.YOLO = lambda path: loaded.append(path) or types.SimpleNamespace(predict=lambda *a, **k: [])
+    monkeypatch.setitem(sys.modules, "ultralytics", ultralytics)
+    model_path = str(tmp_path / "shared.pt")
+    first, second = create_tracker(model_path), create_tracker(model_path)
+    assert loaded == [model_path]
+    assert first.model is second.model
+    assert first.tracker is not second.tracker
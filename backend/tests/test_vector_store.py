@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from retriever.vector_store import CommentaryDocs, check_embedding_dimension, write_docs
+
+
+class FakeIndex:
+    def __init__(self, d):
+        self.d = d
+
+
+class FakeModel:
+    def __init__(self, dim, reports_dim=True):
+        self.dim = dim
+        self.reports_dim = reports_dim
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim if self.reports_dim else None
+
+    def encode(self, sentences):
+        return np.zeros((len(sentences), self.dim), dtype=np.float32)
+
+
+@pytest.mark.parametrize("reports_dim", [True, False])
+def test_embedding_dimension_mismatch_fails(reports_dim):
+    check_embedding_dimension(FakeModel(384, reports_dim), FakeIndex(384), "m")
+    with pytest.raises(ValueError, match="768"):
+        check_embedding_dimension(FakeModel(768, reports_dim), FakeIndex(384), "m")
+
+
+def test_docs_roundtrip(tmp_path):
+    docs = ["손흥민의 슈팅!", "", "골키퍼 선방", "Kick-off"]
+    write_docs(tmp_path, docs)
+    loaded = CommentaryDocs.load(tmp_path)
+    assert list(loaded) == docs
+    assert loaded[-1] == "Kick-off"
+    with pytest.raises(IndexError):
+        loaded[len(docs)]
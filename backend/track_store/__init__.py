@@ -0,0 +1,2 @@
+from .track_store import TrackStore, ObjectTracks, TRACK_DTYPE
+from .views import TracksView, FramesView
@@ -0,0 +1,266 @@
+import numpy as np
+
+# 트랙 한 개(프레임, 트랙 ID)의 값. 딕셔너리 트랙의 필드를 그대로 컬럼으로 옮긴 구조이며,
+# _set 비트마스크로 필드가 설정됐는지를 따로 기록한다 (값이 None인 것과 키가 없는 것을 구분).
+TRACK_DTYPE = np.dtype([
+    ("frame", np.int32),
+    ("track_id", np.int32),
+    ("_set", np.uint16),
+    ("bbox", np.float32, 4),
+    ("position", np.float32, 2),
+    ("position_adjusted", np.float32, 2),
+    ("position_transformed", np.float32, 2),
+    ("team", np.int8),
+    ("team_color", np.float32, 3),
+    ("speed", np.float64),
+    ("distance", np.float64),
+    ("has_ball", np.bool_),
+])
+
+FIELDS = (
+    "bbox", "position", "position_adjusted", "position_transformed",
+    "team", "team_color", "speed", "distance", "has_ball",
+)
+FIELD_BITS = {name: 1 << i for i, name in enumerate(FIELDS)}
+
+DEFAULT_KINDS = ("players", "referees", "ball")
+
+
+def _empty(size=0):
+    data = np.zeros(size, dtype=TRACK_DTYPE)
+    for name in FIELDS:
+        if data.dtype[name].base.kind == "f":
+            data[name] = np.nan
+    return data
+
+
+def encode_field(data, index, name, value):
+    """딕셔너리 값 → 컬럼 (None은 NaN/0으로 기록하고 설정 비트는 켬)"""
+    if value is None:
+        data[name][index] = np.nan if data.dtype[name].base.kind == "f" else 0
+    else:
+        data[name][index] = value
+    data["_set"][index] |= FIELD_BITS[name]
+
+
+def decode_field(row, name):
+    """컬럼 → 기존 딕셔너리 트랙과 같은 타입의 값"""
+    value = row[name]
+    if name == "bbox":
+        return value.tolist()
+    if name == "position":
+        return None if np.isnan(value[0]) else (int(value[0]), int(value[1]))
+    if name == "position_adjusted":
+        return None if np.isnan(value[0]) else tuple(value.tolist())
+    if name == "position_transformed":
+        return None if np.isnan(value[0]) else value.tolist()
+    if name == "team_color":
+        return None if np.isnan(value[0]) else value.astype(np.float64)
+    if name == "team":
+        return int(value) or None
+    if name == "has_ball":
+        return bool(value)
+    return None if np.isnan(value) else float(value)
+
+
+class ObjectTracks:
+    """한 종류(players/referees/ball) 트랙의 컬럼형 저장소
+
+    data는 (frame, track_id) 순으로 정렬된 구조화 배열이고, offsets[f]:offsets[f + 1]이
+    f번 프레임의 행 범위다. TRACK_DTYPE에 없는 필드는 extras[(frame, track_id)]에 보관한다.
+    """
+
+    def __init__(self, data=None, num_frames=0, extras=None, sort=True):
+        data = _empty() if data is None else data
+        if sort and len(data):
+            data = data[np.lexsort((data["track_id"], data["frame"]))]
+        self.data = data
+        self.num_frames = int(num_frames)
+        self.extras = extras or {}
+        self.offsets = np.searchsorted(data["frame"], np.arange(self.num_frames + 1)).astype(np.int64)
+
+    @classmethod
+    def from_frames(cls, frames):
+        """[{track_id: {필드: 값}}] → ObjectTracks"""
+        data = _empty(sum(len(frame) for frame in frames))
+        extras = {}
+        i = 0
+        for frame_num, frame in enumerate(frames):
+            for track_id, info in frame.items():
+                data["frame"][i] = frame_num
+                data["track_id"][i] = track_id
+                for name, value in info.items():
+                    if name in FIELD_BITS:
+                        encode_field(data, i, name, value)
+                    else:
+                        extras.setdefault((frame_num, int(track_id)), {})[name] = value
+                i += 1
+        return cls(data, len(frames), extras)
+
+    @classmethod
+    def from_columns(cls, frame, track_id, num_frames, **columns):
+        """컬럼 배열로 바로 생성 (columns: 필드 이름 → 행별 값, 지정한 필드는 설정 비트를 켬)"""
+        data = _empty(len(frame))
+        data["frame"] = frame
+        data["track_id"] = track_id
+        for name, values in columns.items():
+            data[name] = values
+            data["_set"] |= FIELD_BITS[name]
+        return cls(data, num_frames)
+
+    def to_frames(self):
+        """ObjectTracks → [{track_id: {필드: 값}}] (기존 형식 복원)"""
+        frames = [{} for _ in range(self.num_frames)]
+        for row in self.data:
+            frame_num, track_id = int(row["frame"]), int(row["track_id"])
+            info = {name: decode_field(row, name) for name in FIELDS if row["_set"] & FIELD_BITS[name]}
+            info.update(self.extras.get((frame_num, track_id), {}))
+            frames[frame_num][track_id] = info
+        return frames
+
+    def __len__(self):
+        return len(self.data)
+
+    def frame_rows(self, frame_num):
+        return slice(int(self.offsets[frame_num]), int(self.offsets[frame_num + 1]))
+
+    def row_index(self, frame_num, track_id):
+        """(frame, track_id) 행 번호, 없으면 None"""
+        rows = self.frame_rows(frame_num)
+        ids = self.data["track_id"][rows]
+        i = int(np.searchsorted(ids, track_id))
+        if i < len(ids) and ids[i] == track_id:
+            return rows.start + i
+        return None
+
+    def has(self, name):
+        """필드가 설정된 행 마스크"""
+        return (self.data["_set"] & FIELD_BITS[name]) != 0
+
+    def set_column(self, name, values, mask=None):
+        """필드를 배열로 한 번에 설정 (mask가 있으면 해당 행만)"""
+        if mask is None:
+            self.data[name] = values
+            self.data["_set"] |= FIELD_BITS[name]
+        else:
+            self.data[name][mask] = values
+            self.data["_set"][mask] |= FIELD_BITS[name]
+
+    def slice_frames(self, start, end=None):
+        """[start, end) 프레임만 잘라서 프레임 번호를 0부터 다시 매긴 ObjectTracks"""
+        end = self.num_frames if end is None else min(end, self.num_frames)
+        start = min(start, end)
+        data = self.data[self.offsets[start]:self.offsets[end]].copy()
+        data["frame"] -= start
+        extras = {(f - start, tid): v for (f, tid), v in self.extras.items() if start <= f < end}
+        return ObjectTracks(data, end - start, extras, sort=False)
+
+    def relabel(self, mapping):
+        """트랙 ID 변경 ({old_id: new_id}, 없는 ID는 그대로)"""
+        if not mapping:
+            return self
+        old = np.fromiter(mapping.keys(), dtype=np.int64)
+        new = np.fromiter(mapping.values(), dtype=np.int64)
+        order = np.argsort(old)
+        old, new = old[order], new[order]
+        ids = self.data["track_id"].astype(np.int64)
+        pos = np.clip(np.searchsorted(old, ids), 0, len(old) - 1)
+        hit = old[pos] == ids
+        data = self.data.copy()
+        data["track_id"][hit] = new[pos[hit]]
+        extras = {(f, mapping.get(tid, tid)): v for (f, tid), v in self.extras.items()}
+        return ObjectTracks(data, self.num_frames, extras)
+
+    @classmethod
+    def concat(cls, parts):
+        """시간 순서대로 이어 붙임 (뒤 조각의 프레임 번호를 앞 조각 길이만큼 밀어줌)"""
+        datas, extras, offset = [], {}, 0
+        for part in parts:
+            data = part.data.copy()
+            data["frame"] += offset
+            datas.append(data)
+            extras.update({(f + offset, tid): v for (f, tid), v in part.extras.items()})
+            offset += part.num_frames
+        data = np.concatenate(datas) if datas else _empty()
+        return cls(data, offset, extras, sort=False)
+
+    def add_positions(self, center=False):
+        """bbox 기준 위치: 공은 중심, 사람은 발 위치 (Tracker.add_positions_to_tracks와 동일하게 정수 좌표)"""
+        mask = self.has("bbox")
+        bbox = self.data["bbox"][mask]
+        x = np.trunc((bbox[:, 0] + bbox[:, 2]) / 2)
+        y = np.trunc((bbox[:, 1] + bbox[:, 3]) / 2) if center else np.trunc(bbox[:, 3])
+        self.set_column("position", np.stack([x, y], axis=1), mask)
+
+    def adjust_positions(self, camera_movement):
+        """프레임별 카메라 이동량(num_frames, 2)을 빼서 position_adjusted 설정"""
+        movement = np.asarray(camera_movement, dtype=np.float32).reshape(-1, 2)
+        mask = self.has("position")
+        adjusted = self.data["position"][mask] - movement[self.data["frame"][mask]]
+        self.set_column("position_adjusted", adjusted, mask)
+
+
+class TrackStore:
+    """tracks 딕셔너리({'players': [...], 'referees': [...], 'ball': [...]})의 컬럼형 버전
+
+    프레임마다 딕셔너리를 만드는 대신 종류별 구조화 배열 하나에 모든 트랙을 담아서
+    메모리를 줄이고, 위치/카메라 보정 같은 단계를 배열 연산으로 처리한다.
+    기존 코드(Tracker, ViewTransformer 등)에는 view()로 같은 인터페이스를 제공한다.
+    """
+
+    def __init__(self, objects=None):
+        self.objects = dict(objects or {})
+
+    @classmethod
+    def from_tracks(cls, tracks):
+        return cls({kind: ObjectTracks.from_frames(frames) for kind, frames in tracks.items()})
+
+    @classmethod
+    def empty(cls, kinds=DEFAULT_KINDS):
+        return cls({kind: ObjectTracks() for kind in kinds})
+
+    def to_tracks(self):
+        return {kind: objects.to_frames() for kind, objects in self.objects.items()}
+
+    def view(self):
+        """기존 tracks 딕셔너리처럼 읽고 쓸 수 있는 뷰 (쓰기는 배열에 바로 반영)"""
+        from .views import TracksView
+        return TracksView(self)
+
+    def __getitem__(self, kind):
+        return self.objects[kind]
+
+    def __setitem__(self, kind, objects):
+        self.objects[kind] = objects
+
+    def __contains__(self, kind):
+        return kind in self.objects
+
+    def items(self):
+        return self.objects.items()
+
+    @property
+    def num_frames(self):
+        return max((objects.num_frames for objects in self.objects.values()), default=0)
+
+    @property
+    def nbytes(self):
+        return sum(objects.data.nbytes for objects in self.objects.values())
+
+    def slice_frames(self, start, end=None):
+        return TrackStore({kind: objects.slice_frames(start, end) for kind, objects in self.objects.items()})
+
+    @classmethod
+    def concat(cls, stores):
+        stores = list(stores)
+        if not stores:
+            return cls.empty()
+        return cls({kind: ObjectTracks.concat([s[kind] for s in stores]) for kind in stores[0].objects})
+
+    def add_positions(self, center_kinds=("ball",)):
+        for kind, objects in self.objects.items():
+            objects.add_positions(center=kind in center_kinds)
+
+    def adjust_positions(self, camera_movement):
+        for objects in self.objects.values():
+            objects.adjust_positions(camera_movement)
@@ -0,0 +1,178 @@
+from collections.abc import Mapping, MutableMapping, Sequence
+
+import numpy as np
+
+from .track_store import FIELD_BITS, ObjectTracks, decode_field, encode_field
+
+
+class TrackView(MutableMapping):
+    """트랙 한 개({'bbox': ..., 'team': ...})를 흉내 내는 뷰 (값은 배열에서 읽고 씀)"""
+
+    __slots__ = ("_objects", "_frame", "_track_id")
+
+    def __init__(self, objects, frame_num, track_id):
+        self._objects = objects
+        self._frame = frame_num
+        self._track_id = track_id
+
+    def _row(self):
+        index = self._objects.row_index(self._frame, self._track_id)
+        if index is None:
+            raise KeyError(self._track_id)
+        return index
+
+    def _extras(self, create=False):
+        key = (self._frame, self._track_id)
+        if create:
+            return self._objects.extras.setdefault(key, {})
+        return self._objects.extras.get(key, {})
+
+    def __getitem__(self, name):
+        if name in FIELD_BITS:
+            row = self._objects.data[self._row()]
+            if not row["_set"] & FIELD_BITS[name]:
+                raise KeyError(name)
+            return decode_field(row, name)
+        return self._extras()[name]
+
+    def __setitem__(self, name, value):
+        if name in FIELD_BITS:
+            encode_field(self._objects.data, self._row(), name, value)
+        else:
+            self._extras(create=True)[name] = value
+
+    def __delitem__(self, name):
+        if name in FIELD_BITS:
+            index = self._row()
+            if not self._objects.data["_set"][index] & FIELD_BITS[name]:
+                raise KeyError(name)
+            self._objects.data["_set"][index] &= ~np.uint16(FIELD_BITS[name])
+        else:
+            del self._extras()[name]
+
+    def __iter__(self):
+        set_bits = self._objects.data["_set"][self._row()]
+        yield from (name for name, bit in FIELD_BITS.items() if set_bits & bit)
+        yield from self._extras()
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class FrameView(MutableMapping):
+    """한 프레임의 {track_id: 트랙} 뷰"""
+
+    __slots__ = ("_objects", "_frame")
+
+    def __init__(self, objects, frame_num):
+        self._objects = objects
+        self._frame = frame_num
+
+    def _ids(self):
+        return self._objects.data["track_id"][self._objects.frame_rows(self._frame)]
+
+    def __getitem__(self, track_id):
+        if not isinstance(track_id, (int, np.integer)) or self._objects.row_index(self._frame, track_id) is None:
+            raise KeyError(track_id)
+        return TrackView(self._objects, self._frame, int(track_id))
+
+    def __contains__(self, track_id):
+        return isinstance(track_id, (int, np.integer)) and self._objects.row_index(self._frame, track_id) is not None
+
+    def __setitem__(self, track_id, info):
+        # 새 트랙 추가는 배열을 다시 만들어야 하므로 느린 경로 (기존 단계에서는 쓰지 않음)
+        if track_id in self:
+            view = self[track_id]
+            for name in list(view):
+                del view[name]
+            view.update(info)
+            return
+        frames = self._objects.to_frames()
+        frames[self._frame][int(track_id)] = dict(info)
+        _replace(self._objects, ObjectTracks.from_frames(frames))
+
+    def __delitem__(self, track_id):
+        index = self._objects.row_index(self._frame, track_id)
+        if index is None:
+            raise KeyError(track_id)
+        objects = self._objects
+        objects.extras.pop((self._frame, int(track_id)), None)
+        _replace(objects, ObjectTracks(np.delete(objects.data, index), objects.num_frames, objects.extras, sort=False))
+
+    def __iter__(self):
+        return iter(self._ids().tolist())
+
+    def __len__(self):
+        rows = self._objects.frame_rows(self._frame)
+        return rows.stop - rows.start
+
+    def __repr__(self):
+        return repr({track_id: dict(track) for track_id, track in self.items()})
+
+
+def _replace(objects, new):
+    """ObjectTracks 내용을 제자리에서 교체 (기존 뷰가 계속 유효하도록)"""
+    objects.data, objects.num_frames = new.data, new.num_frames
+    objects.extras, objects.offsets = new.extras, new.offsets
+
+
+class FramesView(Sequence):
+    """tracks['players'] 같은 프레임 리스트 뷰"""
+
+    __slots__ = ("objects",)
+
+    def __init__(self, objects):
+        self.objects = objects
+
+    def __len__(self):
+        return self.objects.num_frames
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [FrameView(self.objects, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return FrameView(self.objects, index)
+
+
+class TracksView(MutableMapping):
+    """TrackStore를 기존 tracks 딕셔너리처럼 쓰는 호환 뷰
+
+    tracks['players'][frame][track_id]['speed'] = ... 같은 기존 코드의 쓰기가 배열에 바로 반영되고,
+    tracks['ball'] = [...]처럼 프레임 리스트를 통째로 바꾸면 다시 배열로 변환해서 저장한다.
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def __getitem__(self, kind):
+        return FramesView(self.store[kind])
+
+    def __setitem__(self, kind, frames):
+        if isinstance(frames, FramesView):
+            self.store[kind] = frames.objects
+        elif kind in self.store:
+            _replace(self.store[kind], ObjectTracks.from_frames(_as_dicts(frames)))
+        else:
+            self.store[kind] = ObjectTracks.from_frames(_as_dicts(frames))
+
+    def __delitem__(self, kind):
+        del self.store.objects[kind]
+
+    def __iter__(self):
+        return iter(self.store.objects)
+
+    def __len__(self):
+        return len(self.store.objects)
+
+
+def _as_dicts(frames):
+    return [
+        {track_id: dict(info) if isinstance(info, Mapping) else info for track_id, info in frame.items()}
+        for frame in frames
+    ]
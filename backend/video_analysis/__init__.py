@@ -0,0 +1,3 @@
+# pipeline/runner는 분석 모델을 불러오므로 필요한 곳(분석 스레드/워커)에서 직접 import
+from .coaching import generate_coaching
+from .jobs import jobs, reset_for_retry, UNFINISHED_STATUSES, RUNNING_STATUSES
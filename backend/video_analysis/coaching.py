@@ -0,0 +1,59 @@
+import os
+
+from openai import OpenAI
+
+coaching_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+def generate_coaching(subtitle_data, event_data, ball_control, my_team=None):
+    commentary_text = "\n".join([s["text"] if isinstance(s, dict) else s for s in subtitle_data if s])
+    events_text = "\n".join([e for e in event_data if e and e.strip()])
+    ball_info = f"팀1 점유율: {ball_control.get('team1', 0)}%, 팀2 점유율: {ball_control.get('team2', 0)}%"
+
+    my_team_instruction = ""
+    if my_team:
+        other_team = "팀2" if my_team == "팀1" else "팀1"
+        my_team_instruction = (
+            f"\n\n[중요] 너는 '{my_team}'의 전담 코치야. "
+            f"'{my_team}'을 '우리팀', '{other_team}'을 '상대팀'으로 지칭하고, "
+            f"우리팀의 승리를 위한 관점에서 분석하고 피드백해야 해. "
+            f"우리팀의 장점은 살리고, 약점은 냉철하게 지적하며, 상대팀의 허점을 공략하는 전술을 제시할 것."
+        )
+
+    system_prompt = (
+        "너는 데이터와 전술 이론에 정통한 '엘리트 축구 감독'이야. "
+        "경기 결과뿐만 아니라 팀의 전술적 구조(Structural Analysis)를 해부하고, "
+        "포지션별로 책임을 명확히 묻는 엄격한 피드백을 제공해야 해."
+        + my_team_instruction +
+        "\n\n[분석 지침: 5개 핵심 섹션] 아래 데이터를 바탕으로 다음 순서로 분석을 진행할 것:\n\n"
+        "1. 전반적인 전술 구조 분석 (Tactical Setup)\n"
+        "공격 형태: 지공/역습의 효율성, 공격 시 선수들의 간격과 대형(Structure)이 적절했는지 분석.\n"
+        "수비 형태: 전방 압박의 강도나 수비 블록의 견고함, 상대 전술에 대한 대응력을 평가할 것.\n\n"
+        "2. 결정력 및 xG(기대 득점) 분석\n"
+        "슈팅의 위치와 질을 평가하고, 기회 창출 대비 득점 전환율이 낮았던 원인을 분석할 것.\n\n"
+        "3. 포지션별 1:1 집중 피드백\n"
+        "공격진(FW): 박스 안에서의 집중력, 결정적 기회에서의 선택(Shot vs Pass).\n"
+        "수비진(DF): 대인 마크 실패 지점, 공간 커버 범위, 라인 조절의 미숙함.\n"
+        "골키퍼(GK): 실점 상황의 위치 선정 및 수비진을 지휘하는 리더십(Commanding).\n\n"
+        "4. 공수 전환 및 위기 관리 (Transition)\n"
+        "공격에서 수비로 전환될 때의 속도와 하프 스페이스(Half-space) 허용 여부를 지적할 것.\n\n"
+        "5. 감독의 최종 지시 (The Locker Room)\n"
+        "총평: 오늘 전술의 성패를 한 문장으로 요약할 것.\n"
+        "지시: 다음 경기 승리를 위해 '전술적 수정 사항'과 '선수단 정신 무장'을 냉철하게 전달할 것."
+    )
+
+    user_content = f"[볼 점유율]\n{ball_info}\n\n[AI 중계 내용]\n{commentary_text}\n\n[이벤트 기록]\n{events_text}"
+
+    try:
+        response = coaching_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content}
+            ],
+            max_tokens=1500,
+            temperature=0.7,
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        print(f"[COACHING GPT ERROR] {e}")
+        return "코칭 분석을 생성할 수 없습니다."
@@ -0,0 +1,134 @@
+import json
+import os
+
+# 감지기 백엔드: pytorch(기본, best.pt) / onnx / openvino
+DETECTOR_BACKEND = os.getenv("DETECTOR_BACKEND", "pytorch")
+DETECTOR_MODEL_PATH = os.getenv("DETECTOR_MODEL_PATH", "models/best.onnx")
+DETECTOR_BATCH_SIZE = int(os.getenv("DETECTOR_BATCH_SIZE", "8"))
+DETECTOR_THREADS = int(os.getenv("DETECTOR_THREADS", "0"))
+# 키프레임 감지: 움직임이 적은 구간은 키프레임에서만 감지하고 사이 프레임은 박스 보간
+KEYFRAME_DETECTION = os.getenv("KEYFRAME_DETECTION", "0") == "1"
+KEYFRAME_MAX_INTERVAL = int(os.getenv("KEYFRAME_MAX_INTERVAL", "3"))
+KEYFRAME_MOTION_THRESHOLD = float(os.getenv("KEYFRAME_MOTION_THRESHOLD", "0.03"))
+
+DETECTOR_CONFIG = {
+    "model_path": "models/best.pt",
+    "backend": DETECTOR_BACKEND,
+    "backend_model_path": DETECTOR_MODEL_PATH,
+    "batch_size": DETECTOR_BATCH_SIZE,
+    "threads": DETECTOR_THREADS,
+    "keyframe": KEYFRAME_DETECTION,
+    "keyframe_interval": KEYFRAME_MAX_INTERVAL,
+    "keyframe_motion": KEYFRAME_MOTION_THRESHOLD,
+}
+
+# 카메라 이동 추정: lk(기본, 기존 CameraMovementEstimator) / fast(축소 흑백 위상 상관 + LK 대체, 스레드 병렬)
+CAMERA_MOTION_MODE = os.getenv("CAMERA_MOTION_MODE", "lk")
+CAMERA_MOTION_SCALE = float(os.getenv("CAMERA_MOTION_SCALE", "0.25"))
+CAMERA_MOTION_METHOD = os.getenv("CAMERA_MOTION_METHOD", "phase")  # phase / lk
+CAMERA_MOTION_THREADS = int(os.getenv("CAMERA_MOTION_THREADS", "1"))
+
+CAMERA_CONFIG = {
+    "mode": CAMERA_MOTION_MODE,
+    "scale": CAMERA_MOTION_SCALE,
+    "method": CAMERA_MOTION_METHOD,
+    "workers": CAMERA_MOTION_THREADS,
+}
+
+
+# 모델 레지스트리: YOLO/감지기/해설 벡터 스토어를 프로세스에서 한 번만 로드해서 공유
+# 벡터 스토어는 mmap 디렉터리 형식(python -m retriever.vector_store로 pickle에서 변환)이 있으면 그것을,
+# 없으면 기존 vector_store.pkl을 사용
+_COMMENTARY_VECTOR_STORE_DIR = os.path.join("commentary_ai", "generator", "vector_store")
+COMMENTARY_VECTOR_STORE_PATH = os.path.abspath(os.getenv(
+    "COMMENTARY_VECTOR_STORE_PATH",
+    _COMMENTARY_VECTOR_STORE_DIR if os.path.isdir(_COMMENTARY_VECTOR_STORE_DIR)
+    else f"{_COMMENTARY_VECTOR_STORE_DIR}.pkl",
+))
+# 해설 생성: 동시에 진행하는 Bedrock 요청 수, 요청별 대기 제한(초, 넘으면 검색된 참고 해설로 대체)
+COMMENTARY_CONCURRENCY = int(os.getenv("COMMENTARY_CONCURRENCY", "4"))
+COMMENTARY_TIMEOUT_SECONDS = float(os.getenv("COMMENTARY_TIMEOUT_SECONDS", "20"))
+# 한 번의 모델 호출로 묶어서 생성할 해설 구간 수 (1이면 구간마다 호출, 실패한 구간은 단건 호출로 재시도)
+COMMENTARY_BATCH_SIZE = int(os.getenv("COMMENTARY_BATCH_SIZE", "8"))
+# 해설 시점: event(이벤트/점유 전환 중요도 순, 최소/최대 간격과 작업당 호출 수 제한) / fixed(72프레임마다)
+COMMENTARY_SCHEDULE = os.getenv("COMMENTARY_SCHEDULE", "event")
+COMMENTARY_MIN_GAP_SECONDS = float(os.getenv("COMMENTARY_MIN_GAP_SECONDS", "2"))
+COMMENTARY_MAX_GAP_SECONDS = float(os.getenv("COMMENTARY_MAX_GAP_SECONDS", "15"))  # 0이면 조용한 구간은 해설 안 함
+COMMENTARY_BUDGET = int(os.getenv("COMMENTARY_BUDGET", "60"))  # 0이면 제한 없음
+COMMENTARY_EVENT_WEIGHTS = json.loads(os.getenv("COMMENTARY_EVENT_WEIGHTS", "{}"))
+# 해설 방식: llm(Bedrock) / fast(로컬 템플릿, 외부 호출 없음, 코칭 생성도 생략). 요청의 commentary_mode가 우선
+COMMENTARY_MODES = ("llm", "fast")
+COMMENTARY_MODE = os.getenv("COMMENTARY_MODE", "llm")
+# llm 방식의 해설 단계 전체 대기 한도(초), 넘으면 남은 구간은 템플릿 해설로 채움 (0이면 제한 없음)
+COMMENTARY_LLM_BUDGET_SECONDS = float(os.getenv("COMMENTARY_LLM_BUDGET_SECONDS", "180"))
+PRELOAD_MODELS = os.getenv("PRELOAD_MODELS", "1") == "1"
+MODEL_IDLE_SECONDS = int(os.getenv("MODEL_IDLE_SECONDS", "0"))  # 0이면 유휴 언로드 안 함
+MODEL_MEMORY_LIMIT_MB = int(os.getenv("MODEL_MEMORY_LIMIT_MB", "0"))  # 0이면 메모리 한도 없음
+
+# 스트리밍 분석: 프레임을 윈도우 단위로 디코딩/처리해서 영상 길이와 무관하게 메모리 사용량 유지
+STREAMING_ANALYSIS = os.getenv("STREAMING_ANALYSIS", "1") == "1"
+STREAM_WINDOW_FRAMES = int(os.getenv("STREAM_WINDOW_FRAMES", "240"))
+# 디코딩 단계 설정: 최대 높이(초과 시 디코더에서 축소), 분석 fps(0이면 원본), 디코더 스레드 수(0이면 자동)
+ANALYSIS_MAX_HEIGHT = int(os.getenv("ANALYSIS_MAX_HEIGHT", "720"))
+ANALYSIS_FPS = float(os.getenv("ANALYSIS_FPS", "0"))
+DECODE_THREADS = int(os.getenv("DECODE_THREADS", "0"))
+
+
+# 청크 병렬 분석: 영상을 시간 구간으로 나눠 프로세스 풀에서 감지/추적 (1이면 사용 안 함)
+ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", "1"))
+CHUNK_OVERLAP_FRAMES = int(os.getenv("CHUNK_OVERLAP_FRAMES", "24"))
+MIN_CHUNK_FRAMES = int(os.getenv("MIN_CHUNK_FRAMES", "600"))
+
+# 이벤트 판정 규칙 (event_engine.EventRules 인자, JSON). 예: {"dribble_speed": 2.0, "goal_area": [[100, 50], [200, 100]]}
+EVENT_RULES = json.loads(os.getenv("EVENT_RULES", "{}"))
+
+# 결과 영상 인코딩: ffmpeg(기본, libx264로 바로 인코딩) / opencv(mp4v 저장 후 H.264 재인코딩)
+VIDEO_WRITER_CONFIG = {
+    "encoder": os.getenv("VIDEO_ENCODER", "ffmpeg"),
+    "preset": os.getenv("VIDEO_PRESET", "veryfast"),
+    "crf": int(os.getenv("VIDEO_CRF", "23")),
+    "threads": int(os.getenv("VIDEO_ENCODE_THREADS", "0")),  # 0이면 ffmpeg 자동
+}
+
+# 결과 영상 구간 병렬 렌더링: 시간 구간마다 별도 프로세스에서 그리기/인코딩 후 재인코딩 없이 이어 붙임
+# (1이면 사용 안 함, ffmpeg 인코더일 때만 사용, 점유율 패널은 항상 오버레이 스프라이트로 그림)
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", "1"))
+MIN_RENDER_SEGMENT_FRAMES = int(os.getenv("MIN_RENDER_SEGMENT_FRAMES", "480"))
+
+# 결과 영상 자막/점유율 오버레이 (문구별 스프라이트를 한 번만 그려서 캐시)
+# 한글 폰트(NanumGothic.ttf)는 저장소에 포함하지 않으므로 서버에 직접 설치해야 하고,
+# 켜져 있는데 폰트가 없으면 API 서버/분석 워커가 시작하지 않음 (docs/VIDEO-ANALYSIS.md 참고)
+OVERLAY_ENABLED = os.getenv("OVERLAY_ENABLED", "1") == "1"
+OVERLAY_FONT_PATH = os.getenv("OVERLAY_FONT_PATH", "fonts/NanumGothic.ttf")
+OVERLAY_CACHE_SIZE = int(os.getenv("OVERLAY_CACHE_SIZE", "256"))
+
+# 결과 형식: video(주석/자막을 입힌 H.264 영상) / overlay(영상 인코딩 없이 프레임별 주석 데이터와
+# WebVTT 자막만 만들고, 프론트엔드가 원본 영상 위에 직접 그림). 요청의 output_mode가 우선
+OUTPUT_MODES = ("video", "overlay")
+ANALYSIS_OUTPUT_MODE = os.getenv("ANALYSIS_OUTPUT_MODE", "video")
+
+# 볼 궤적: 튀는 감지 기준 속도(px/프레임, 0이면 사용 안 함), 칼만 스무딩 사용 여부
+BALL_TRAJECTORY_CONFIG = {
+    "max_speed": float(os.getenv("BALL_MAX_SPEED", "80")),
+    "kalman": os.getenv("BALL_KALMAN", "0") == "1",
+}
+
+# 팀 분류: 학습에 쓸 프레임 수, 트랙별 팀 재판정 주기(프레임)
+TEAM_FIT_FRAMES = int(os.getenv("TEAM_FIT_FRAMES", "8"))
+TEAM_REVALIDATE_FRAMES = int(os.getenv("TEAM_REVALIDATE_FRAMES", "120"))
+
+# 작업 상태 저장: 기본은 SQLite (재시작해도 작업 상태/결과 유지)
+JOB_STORE_URL = os.getenv("JOB_STORE_URL", "sqlite:///jobs.db")
+JOB_MAX_RECOVERIES = int(os.getenv("JOB_MAX_RECOVERIES", "2"))
+
+# 분석 작업 대기열: 동시 분석 수 제한 + 대기열 크기 제한
+ANALYSIS_JOB_WORKERS = int(os.getenv("ANALYSIS_JOB_WORKERS", "1"))
+ANALYSIS_QUEUE_SIZE = int(os.getenv("ANALYSIS_QUEUE_SIZE", "10"))
+ANALYSIS_AVG_JOB_SECONDS = float(os.getenv("ANALYSIS_AVG_JOB_SECONDS", "300"))
+
+# 분석 실행 위치: inprocess(API 서버 안의 스레드) / external(python -m video_analysis.worker 프로세스)
+ANALYSIS_MODE = os.getenv("ANALYSIS_MODE", "inprocess")
+# 워커가 대기 작업이 없을 때 저장소를 다시 확인하는 간격(초)
+WORKER_POLL_SECONDS = float(os.getenv("WORKER_POLL_SECONDS", "1"))
+
+S3_BUCKET = os.getenv('S3_BUCKET_NAME', 'football-analysis-bucket')
@@ -0,0 +1,28 @@
+from job_store import JobTable, create_job_store
+
+from .config import JOB_STORE_URL, JOB_MAX_RECOVERIES, ANALYSIS_MODE
+
+UNFINISHED_STATUSES = ("queued", "downloading", "analyzing", "uploading")
+RUNNING_STATUSES = ("downloading", "analyzing", "uploading")
+
+# 분석을 별도 워커 프로세스에서 하면 API 서버의 메모리 레코드는 금방 낡으므로
+# 조회할 때마다 저장소에서 다시 읽는다 (워커 프로세스는 worker.py에서 따로 설정)
+jobs = JobTable(create_job_store(JOB_STORE_URL), max_age=0 if ANALYSIS_MODE == "external" else None)
+
+
+def reset_for_retry(job, error_message):
+    """중단된 작업을 처음부터 다시 대기 상태로 되돌림
+
+    재시도 횟수가 JOB_MAX_RECOVERIES를 넘으면 에러 처리하고 False 반환.
+    """
+    recoveries = job.get("recovery_count", 0) + 1
+    job["recovery_count"] = recoveries
+    if recoveries > JOB_MAX_RECOVERIES:
+        job["error"] = error_message
+        job["status"] = "error"
+        return False
+    job["progress_percent"] = 0
+    job["progress_stage"] = "대기중"
+    job["current_frame"] = 0
+    job["status"] = "queued"
+    return True
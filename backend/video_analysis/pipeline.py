@@ -0,0 +1,488 @@
+import subprocess
+import shutil
+from bisect import bisect_right
+
+import numpy as np
+
+from video_io import VideoReader, read_video_frames, iter_frame_windows, create_video_writer
+from detectors import KeyframeDetector, create_tracker as build_tracker, draw_window_annotations
+from camera_motion import create_camera_movement_estimator
+from chunked_analysis import track_windows, track_video_chunked, assign_teams_sparse, render_video_segments
+from retriever.generate_commentary import load_vector_store
+from retriever.commentary_pool import CommentaryPool
+from track_store import TrackStore
+from event_engine import EventRules, CommentaryScheduler, detect_events, mark_ball_owners, ball_boxes
+from ball_trajectory import interpolate_ball
+from overlay import (
+    OverlayCompositor, OverlayTimeline, build_overlay_data, write_overlay_data, subtitles_to_vtt, events_to_vtt,
+)
+from team_classifier import TeamClassifier
+from kinematics import BatchViewTransformer, BatchSpeedAndDistanceEstimator
+from model_registry import get_registry
+
+from .config import (
+    DETECTOR_CONFIG, CAMERA_CONFIG, COMMENTARY_VECTOR_STORE_PATH, STREAMING_ANALYSIS, STREAM_WINDOW_FRAMES,
+    ANALYSIS_MAX_HEIGHT, ANALYSIS_FPS, DECODE_THREADS, ANALYSIS_WORKERS, CHUNK_OVERLAP_FRAMES,
+    MIN_CHUNK_FRAMES, EVENT_RULES, TEAM_FIT_FRAMES, TEAM_REVALIDATE_FRAMES, BALL_TRAJECTORY_CONFIG,
+    VIDEO_WRITER_CONFIG, OVERLAY_ENABLED, OVERLAY_FONT_PATH, OVERLAY_CACHE_SIZE, ANALYSIS_OUTPUT_MODE,
+    RENDER_WORKERS, MIN_RENDER_SEGMENT_FRAMES, COMMENTARY_CONCURRENCY, COMMENTARY_TIMEOUT_SECONDS,
+    COMMENTARY_BATCH_SIZE, COMMENTARY_SCHEDULE, COMMENTARY_MIN_GAP_SECONDS, COMMENTARY_MAX_GAP_SECONDS,
+    COMMENTARY_BUDGET, COMMENTARY_EVENT_WEIGHTS, COMMENTARY_MODE, COMMENTARY_LLM_BUDGET_SECONDS,
+    MODEL_IDLE_SECONDS, MODEL_MEMORY_LIMIT_MB,
+)
+from .jobs import jobs
+
+
+def create_tracker():
+    """Tracker 생성 (CPU 감지기 백엔드/키프레임 감지 설정 적용)"""
+    return build_tracker(**DETECTOR_CONFIG)
+
+
+def create_team_classifier():
+    """팀 분류기 생성 (학습 프레임 수/재판정 주기 설정 적용)"""
+    return TeamClassifier(fit_frames=TEAM_FIT_FRAMES, revalidate_interval=TEAM_REVALIDATE_FRAMES)
+
+
+def preload_models():
+    """서버 시작 시 분석 모델을 미리 로드 (첫 작업의 모델 로딩 지연 제거)"""
+    try:
+        create_tracker()
+        load_vector_store(COMMENTARY_VECTOR_STORE_PATH)
+    except Exception as e:
+        print(f"[REGISTRY] preload error: {e}")
+
+
+def start_model_janitor():
+    """유휴/메모리 한도 모델 정리 스레드 시작 (모델을 실제로 로드하는 프로세스에서 호출)"""
+    if MODEL_IDLE_SECONDS or MODEL_MEMORY_LIMIT_MB:
+        get_registry().start_janitor(
+            max_idle_seconds=MODEL_IDLE_SECONDS or None,
+            max_rss_mb=MODEL_MEMORY_LIMIT_MB or None,
+        )
+
+
+
+def track_video_streaming(reader, total_frames, update_stage, update_frame):
+    """윈도우 단위로 감지/추적/카메라 보정/팀 배정 수행 (프레임은 윈도우 처리 후 바로 버림)"""
+    tracker = create_tracker()
+    team_classifier = create_team_classifier()
+    processed = 0
+
+    def assign_teams(window, window_tracks):
+        nonlocal processed
+        # 팀 배정은 원본 프레임이 필요하므로 프레임을 버리기 전에 수행 (첫 윈도우에서 팀 모델 학습)
+        team_classifier.assign_tracks(window, window_tracks.store["players"], frame_offset=processed)
+
+        processed += len(window)
+        update_frame(processed)
+        if total_frames:
+            update_stage("선수/볼 추적 중...", round(10 + min(processed / total_frames, 1) * 40, 1))
+
+    track_store = track_windows(
+        tracker, reader.iter_windows(STREAM_WINDOW_FRAMES), on_window=assign_teams, camera_config=CAMERA_CONFIG,
+    )
+    return tracker, track_store, team_classifier
+
+
+def track_video_parallel(input_path, reader, total_frames, update_stage):
+    """청크별 프로세스 병렬 감지/추적 후 병합된 트랙에 팀 배정"""
+    def on_chunk_done(done, total):
+        update_stage("선수/볼 추적 중...", round(10 + done / total * 35, 1))
+
+    reader_options = {"max_height": ANALYSIS_MAX_HEIGHT, "target_fps": ANALYSIS_FPS, "threads": DECODE_THREADS}
+    # 청크가 너무 짧으면 모델 로딩/경계 매칭 비용이 더 크므로 청크 수 제한
+    num_chunks = min(ANALYSIS_WORKERS, total_frames // MIN_CHUNK_FRAMES)
+    track_store = track_video_chunked(
+        input_path, total_frames, num_chunks, DETECTOR_CONFIG, reader_options,
+        window_size=STREAM_WINDOW_FRAMES, overlap=CHUNK_OVERLAP_FRAMES, progress=on_chunk_done,
+        camera_config=CAMERA_CONFIG,
+    )
+
+    update_stage("팀 분석중", 45)
+    team_classifier = assign_teams_sparse(reader, track_store, create_team_classifier())
+    # 공 보간/소유자/주석 그리기용 Tracker (감지는 이미 끝났으므로 모델 추론은 하지 않음)
+    return create_tracker(), track_store, team_classifier
+
+
+def create_overlay(tracker, num_frames, subtitle_data, event_data, owner_team):
+    """자막/점유율 오버레이 함수 overlay(frames, start_frame) 생성 (사용하지 않으면 None)
+
+    점유율 패널은 오버레이가 캐시된 스프라이트로 그리므로 Tracker의 반투명 박스 그리기는 끈다.
+    """
+    if not OVERLAY_ENABLED:
+        return None
+    compositor = OverlayCompositor(OVERLAY_FONT_PATH, OVERLAY_CACHE_SIZE)
+    timeline = OverlayTimeline(num_frames, subtitle_data, event_data, owner_team)
+    tracker.draw_team_ball_control = lambda frame, frame_num, team_ball_control: frame
+
+    def overlay(frames, start_frame):
+        # 다시 디코딩한 프레임 수가 분석 프레임 수보다 많으면 넘치는 프레임은 그대로 둠
+        for frame_num, frame in enumerate(frames[:max(num_frames - start_frame, 0)], start_frame):
+            compositor.compose(frame, timeline, frame_num)
+        return frames
+
+    return overlay
+
+
+def render_video_streaming(input_path, output_path, tracker, tracks, team_ball_control, video_fps, overlay=None):
+    """원본 영상을 윈도우 단위로 다시 디코딩하면서 주석을 그리고 바로 인코더에 넘김
+
+    반환값: 결과 파일이 이미 H.264인지 (아니면 웹 재생용 재인코딩 필요)
+    """
+    start = 0
+    with create_video_writer(output_path, fps=video_fps, **VIDEO_WRITER_CONFIG) as writer:
+        for window in iter_frame_windows(
+            input_path, STREAM_WINDOW_FRAMES, max_height=ANALYSIS_MAX_HEIGHT, target_fps=ANALYSIS_FPS,
+            threads=DECODE_THREADS,
+        ):
+            end = start + len(window)
+            window_tracks = {key: frames[start:end] for key, frames in tracks.items()}
+            annotated = draw_window_annotations(tracker, window, window_tracks, team_ball_control, start)
+            writer.write(overlay(annotated, start) if overlay else annotated)
+            start = end
+    return writer.h264
+
+
+def use_segment_render(total_frames):
+    """구간 병렬 렌더링 사용 여부 (조각을 스트림 복사로 잇기 때문에 ffmpeg H.264 인코더가 필요)"""
+    return (
+        RENDER_WORKERS > 1
+        and VIDEO_WRITER_CONFIG["encoder"] == "ffmpeg"
+        and shutil.which("ffmpeg") is not None
+        and total_frames >= 2 * MIN_RENDER_SEGMENT_FRAMES
+    )
+
+
+def render_video_parallel(input_path, output_path, track_store, team_ball_control, video_fps, subtitle_data,
+                          event_data, owner_team, update_stage):
+    """구간별 프로세스 병렬 렌더링 (구간마다 필요한 점유율/자막 상태는 OverlayTimeline으로 미리 계산)"""
+    def on_segment_done(done, total):
+        update_stage("영상 렌더링중", round(85 + done / total * 10, 1))
+
+    # OVERLAY_ENABLED=0이면 직렬 경로와 같이 Tracker 기본 그리기만 사용
+    timeline = None
+    if OVERLAY_ENABLED:
+        timeline = OverlayTimeline(track_store.num_frames, subtitle_data, event_data, owner_team)
+    reader_options = {"max_height": ANALYSIS_MAX_HEIGHT, "target_fps": ANALYSIS_FPS, "threads": DECODE_THREADS}
+    writer_config = {key: value for key, value in VIDEO_WRITER_CONFIG.items() if key != "encoder"}
+    render_video_segments(
+        input_path, output_path, track_store, team_ball_control, timeline, RENDER_WORKERS, reader_options,
+        window_size=STREAM_WINDOW_FRAMES, writer_config=writer_config, fps=video_fps,
+        model_path=DETECTOR_CONFIG["model_path"], font_path=OVERLAY_FONT_PATH, cache_size=OVERLAY_CACHE_SIZE,
+        min_frames=MIN_RENDER_SEGMENT_FRAMES, progress=on_segment_done, overlay_enabled=OVERLAY_ENABLED,
+    )
+
+
+def commentary_frames(event_result, video_fps):
+    """해설을 생성할 프레임 번호 (event: 이벤트 중요도 기반 스케줄, fixed: 72프레임마다)"""
+    if COMMENTARY_SCHEDULE == "fixed":
+        return list(range(0, event_result.num_frames, 72))
+    scheduler = CommentaryScheduler(
+        min_gap=int(round(COMMENTARY_MIN_GAP_SECONDS * video_fps)),
+        max_gap=int(round(COMMENTARY_MAX_GAP_SECONDS * video_fps)),
+        budget=COMMENTARY_BUDGET,
+        weights=COMMENTARY_EVENT_WEIGHTS,
+        possession_hold=int(round(video_fps)),
+    )
+    return scheduler.schedule(event_result).tolist()
+
+
+def encode_h264(output_path):
+    """mp4v 결과를 웹 재생용 H.264로 다시 인코딩 (opencv writer를 쓴 경우만)"""
+    h264_path = output_path.replace(".mp4", "_h264.mp4")
+    subprocess.run(["ffmpeg", "-y", "-i", output_path, "-vcodec", "libx264", "-acodec", "aac", h264_path], capture_output=True)
+    shutil.move(h264_path, output_path)
+
+
+def overlay_output_paths(output_path):
+    """overlay 모드 결과 파일 경로 (주석 데이터 gzip JSON, 해설/이벤트 WebVTT)"""
+    base = output_path.rsplit(".", 1)[0]
+    return {
+        "overlay": f"{base}_overlay.json.gz",
+        "subtitles": f"{base}_subtitles.vtt",
+        "events": f"{base}_events.vtt",
+    }
+
+
+def write_overlay_outputs(output_path, track_store, team_colors, owner_team, subtitle_data, event_data,
+                          video_fps, video_info):
+    """영상 대신 프론트엔드가 원본 위에 그릴 주석 데이터와 WebVTT 자막을 저장"""
+    paths = overlay_output_paths(output_path)
+    num_frames = track_store.num_frames
+    write_overlay_data(paths["overlay"], build_overlay_data(
+        track_store, team_colors, owner_team, video_fps, video_info["width"], video_info["height"],
+    ))
+    with open(paths["subtitles"], "w", encoding="utf-8") as f:
+        f.write(subtitles_to_vtt(subtitle_data, num_frames, video_fps))
+    with open(paths["events"], "w", encoding="utf-8") as f:
+        f.write(events_to_vtt(event_data, num_frames, video_fps))
+    return paths
+
+
+def analyze_video(input_path: str, output_path: str, job_id: str = None, output_mode: str = None,
+                  commentary_mode: str = None):
+    """영상 분석 메인 로직
+
+    output_mode가 overlay면 주석 그리기/인코딩을 건너뛰고 output_path 대신
+    overlay_output_paths(output_path)의 파일들을 만든다.
+    commentary_mode가 fast면 해설을 Bedrock 호출 없이 로컬 템플릿으로 만든다.
+    """
+    output_mode = output_mode or ANALYSIS_OUTPUT_MODE
+    commentary_mode = commentary_mode or COMMENTARY_MODE
+    vector_store_path = COMMENTARY_VECTOR_STORE_PATH
+
+    # 진행 상황 초기화
+    if job_id and job_id in jobs:
+        jobs[job_id]["total_frames"] = 0
+        jobs[job_id]["current_frame"] = 0
+        jobs[job_id]["progress_percent"] = 0
+        jobs[job_id]["progress_stage"] = "초기화"
+
+    # 진행 단계 업데이트 헬퍼
+    def update_stage(stage_text, stage_progress):
+        if job_id and job_id in jobs:
+            jobs[job_id]["progress_percent"] = stage_progress
+            jobs[job_id]["progress_stage"] = stage_text
+
+    def update_frame(frame_num):
+        if job_id and job_id in jobs:
+            jobs[job_id]["current_frame"] = frame_num
+
+    update_stage("영상 전처리 중...", 5)
+
+    if STREAMING_ANALYSIS:
+        with VideoReader(
+            input_path, max_height=ANALYSIS_MAX_HEIGHT, target_fps=ANALYSIS_FPS, threads=DECODE_THREADS
+        ) as reader:
+            video_info = reader.info
+            video_fps = video_info["fps"]
+            print(f"[VIDEO] {video_info}")
+            if job_id and job_id in jobs:
+                jobs[job_id]["total_frames"] = video_info["frame_count"]
+            update_stage("선수/볼 추적 중...", 10)
+            if ANALYSIS_WORKERS > 1 and video_info["frame_count"] >= 2 * MIN_CHUNK_FRAMES:
+                tracker, track_store, team_classifier = track_video_parallel(
+                    input_path, reader, video_info["frame_count"], update_stage
+                )
+            else:
+                tracker, track_store, team_classifier = track_video_streaming(
+                    reader, video_info["frame_count"], update_stage, update_frame
+                )
+        video_frames = None
+    else:
+        # 720p 초과 영상은 디코딩 단계에서 축소해서 YOLO 처리 속도 향상
+        video_frames, video_info = read_video_frames(
+            input_path, max_height=ANALYSIS_MAX_HEIGHT, target_fps=ANALYSIS_FPS, threads=DECODE_THREADS
+        )
+        video_fps = video_info["fps"]
+        print(f"[VIDEO] {video_info}")
+
+        update_stage("선수/볼 추적 중...", 10)
+        tracker = create_tracker()
+        track_store = TrackStore.from_tracks(
+            tracker.get_object_tracks(video_frames, read_from_stub=False, stub_path=None)
+        )
+        track_store.add_positions()
+
+        update_stage("카메라 움직임 분석 중...", 30)
+        camera_movement_estimator = create_camera_movement_estimator(video_frames[0], **CAMERA_CONFIG)
+        camera_movement_per_frame = camera_movement_estimator.get_camera_movement(
+            video_frames, read_from_stub=False, stub_path=None
+        )
+        track_store.adjust_positions(camera_movement_per_frame)
+
+        # 팀 배정
+        update_stage("팀 분석중", 38)
+        team_classifier = create_team_classifier()
+        team_classifier.assign_tracks(video_frames, track_store["players"])
+
+    if isinstance(tracker.model, KeyframeDetector):
+        print(f"[KEYFRAME] detected {tracker.model.frames_detected}/{tracker.model.frames_total} frames")
+    print(f"[TRACKS] {track_store.num_frames} frames, {track_store.nbytes // 1024} KB")
+
+    # 볼 보간/렌더링처럼 기존 Tracker 함수를 쓰는 단계는 tracks 딕셔너리 인터페이스로 사용
+    tracks = track_store.view()
+
+    # 실제 디코딩된 프레임 수 기준으로 보정 (컨테이너 메타데이터가 부정확할 수 있음)
+    total_frames = len(tracks['players'])
+    if job_id and job_id in jobs:
+        jobs[job_id]["total_frames"] = total_frames
+
+    update_stage("좌표 변환 중...", 40)
+    # 전체 (프레임 x 트랙) 좌표에 원근 변환을 한 번에 적용
+    BatchViewTransformer().add_transformed_positions(track_store)
+
+    # 볼 보간 (튀는 감지 제거, 선택적으로 칼만 스무딩), 프레임별 신뢰도는 슛/골 판정에 사용
+    ball_trajectory = interpolate_ball(ball_boxes(track_store), **BALL_TRAJECTORY_CONFIG)
+    track_store["ball"] = ball_trajectory.to_objects()
+    print(f"[BALL] {int(ball_trajectory.detected.sum())} detections, {int(ball_trajectory.outlier.sum())} outliers")
+
+    update_stage("속도/거리 계산 중...", 45)
+    # 실제 fps 기준 속도/누적 거리, 선수별 합계(총 거리, 최고 속도, 스프린트 횟수)
+    player_stats = BatchSpeedAndDistanceEstimator(frame_rate=video_fps).add_speed_and_distance(track_store)
+
+    if job_id and job_id in jobs:
+        jobs[job_id]["progress_percent"] = 50
+
+    # 5단계: 이벤트 감지 (55-85%)
+    if job_id and job_id in jobs:
+        jobs[job_id]["progress_stage"] = "이벤트 감지중"
+        jobs[job_id]["progress_percent"] = 55
+    
+    def frame_to_time(f):
+        total_sec = int(f / video_fps)
+        m, s = divmod(total_sec, 60)
+        return f"{m}:{s:02d}"
+
+    # 볼 소유/패스/태클/슛/골은 전체 프레임에 대해 배열 연산으로 한 번에 계산
+    event_result = detect_events(track_store, EventRules(**EVENT_RULES), ball_confidence=ball_trajectory.confidence)
+    mark_ball_owners(track_store, event_result)
+    for frame_num in np.flatnonzero(event_result.owner != -1).tolist():
+        tracker.update_ball_owner(int(event_result.owner[frame_num]), int(event_result.owner_team[frame_num]) or None)
+    team_ball_control = event_result.team_ball_control
+    event_data = event_result.frame_texts()
+    events_list = event_result.listed_events(frame_to_time)
+    event_frames = [e["frame"] for e in events_list]
+    print(f"[EVENTS] {len(event_result.events)} events, ball owned in {len(team_ball_control)} frames")
+
+    # 총 프레임 수 (해설 진행률 계산용)
+    total_player_frames = len(tracks['players'])
+    # 프레임별 그 프레임까지 볼 소유자가 있었던 프레임 수 (최근 점유율 계산용)
+    owned_until = np.cumsum(event_result.owner != -1)
+
+    # 해설(검색 + Bedrock 호출)은 스레드 풀에서 동시에 생성하고 이벤트 루프는 질의만 만들고 넘어감
+    # (COMMENTARY_BATCH_SIZE개 구간씩 한 번의 호출로 묶음, 실패/예산 초과 구간과 fast 모드는 템플릿 해설)
+    with CommentaryPool(
+        vector_store_path, COMMENTARY_CONCURRENCY, COMMENTARY_TIMEOUT_SECONDS, COMMENTARY_BATCH_SIZE,
+        mode=commentary_mode, llm_budget=COMMENTARY_LLM_BUDGET_SECONDS or None,
+    ) as commentary_pool:
+        # 직전 해설 이후 발생한 이벤트를 질의에 넣음
+        prev_frame = 0
+        for frame_num in commentary_frames(event_result, video_fps):
+            # 진행률 업데이트 (50~55% 범위, 해설 구간마다, 해설은 백그라운드에서 생성)
+            if job_id and job_id in jobs:
+                frame_progress = 50 + ((frame_num + 1) / total_frames * 5)
+                jobs[job_id]["progress_percent"] = round(frame_progress, 1)
+                jobs[job_id]["progress_stage"] = "이벤트 분석 중..."
+                jobs[job_id]["current_frame"] = frame_num
+                jobs[job_id]["partial_subtitles"] = commentary_pool.completed()
+                jobs[job_id]["live_events"] = events_list[:bisect_right(event_frames, frame_num)]
+
+            assigned_player = int(event_result.owner[frame_num])
+            current_team_with_ball = int(event_result.possession_team[frame_num]) or None
+            speed = float(event_result.owner_speed[frame_num])
+            ball_speed = float(event_result.ball_speed[frame_num])
+
+            # 최근 이벤트 수집 (직전 해설 이후 발생한 이벤트)
+            recent_events = events_list[
+                bisect_right(event_frames, prev_frame):bisect_right(event_frames, frame_num)
+            ]
+            prev_frame = frame_num
+            recent_events_text = ""
+            if recent_events:
+                recent_events_text = "최근 이벤트: " + ", ".join([e["description"] for e in recent_events[-5:]])
+            else:
+                recent_events_text = "최근 특별한 이벤트 없음"
+
+            # 점유율 계산
+            owned_count = int(owned_until[frame_num])
+            recent_possession = None
+            if owned_count > 0:
+                recent_control = team_ball_control[max(owned_count - 72, 0):owned_count]
+                t1 = sum(1 for t in recent_control if t == 1)
+                t2 = sum(1 for t in recent_control if t == 2)
+                total = t1 + t2
+                recent_possession = (t1*100//max(total,1), t2*100//max(total,1))
+                possession_text = f"최근 점유율 - 팀1: {recent_possession[0]}%, 팀2: {recent_possession[1]}%"
+            else:
+                possession_text = "점유율 데이터 없음"
+
+            query = (
+                f"축구 경기 중계를 해주세요. 현재 상황:\n"
+                f"- 볼 소유: 팀{current_team_with_ball}의 플레이어 {assigned_player}\n"
+                f"- 플레이어 이동 속도: {speed:.2f}\n"
+                f"- 볼 속도: {ball_speed:.2f}\n"
+                f"- {possession_text}\n"
+                f"- {recent_events_text}\n"
+                f"짧고 생동감 있게 실제 축구 중계처럼 해설해주세요. 1~2문장으로."
+            )
+
+            # 템플릿 해설(fast 모드/대체용) 입력
+            situation = {
+                "player": assigned_player,
+                "team": current_team_with_ball,
+                "speed": speed,
+                "ball_speed": ball_speed,
+                "possession": recent_possession,
+                "events": [e["type"] for e in recent_events],
+            }
+            commentary_pool.submit(frame_num, frame_to_time(frame_num), query, situation)
+
+        # 남은 해설을 기다리는 동안 끝나는 순서대로 partial_subtitles 갱신 (55~85%)
+        def on_commentary(done, total, completed):
+            if job_id and job_id in jobs:
+                jobs[job_id]["progress_percent"] = round(55 + done / total * 30, 1)
+                jobs[job_id]["progress_stage"] = "해설 생성 중..."
+                jobs[job_id]["partial_subtitles"] = completed
+
+        subtitle_data = commentary_pool.results(on_commentary)
+
+    # BGR → RGB 변환 (OpenCV는 BGR, 프론트는 RGB)
+    team_colors_rgb = {}
+    for team_id, color in team_classifier.team_colors.items():
+        team_colors_rgb[str(team_id)] = [int(color[2]), int(color[1]), int(color[0])]
+
+    if output_mode == "overlay":
+        # 주석 영상 대신 프레임별 주석 데이터/WebVTT만 기록 (렌더링, 인코딩, 결과 영상 업로드 생략)
+        update_stage("오버레이 데이터 생성중", 85)
+        write_overlay_outputs(
+            output_path, track_store, team_colors_rgb, event_result.owner_team, subtitle_data, event_data,
+            video_fps, video_info,
+        )
+    else:
+        # 6단계: 영상 렌더링 (85-95%)
+        if job_id and job_id in jobs:
+            jobs[job_id]["progress_stage"] = "영상 렌더링중"
+            jobs[job_id]["progress_percent"] = 85
+    
+        if use_segment_render(total_frames):
+            render_video_parallel(
+                input_path, output_path, track_store, team_ball_control, video_fps, subtitle_data, event_data,
+                event_result.owner_team, update_stage,
+            )
+            is_h264 = True
+        elif STREAMING_ANALYSIS:
+            overlay = create_overlay(tracker, total_frames, subtitle_data, event_data, event_result.owner_team)
+            is_h264 = render_video_streaming(
+                input_path, output_path, tracker, tracks, team_ball_control, video_fps, overlay=overlay
+            )
+        else:
+            overlay = create_overlay(tracker, total_frames, subtitle_data, event_data, event_result.owner_team)
+            with create_video_writer(output_path, fps=video_fps, **VIDEO_WRITER_CONFIG) as writer:
+                annotated = tracker.draw_annotations(video_frames, tracks, team_ball_control)
+                writer.write(overlay(annotated, 0) if overlay else annotated)
+            is_h264 = writer.h264
+    
+        if job_id and job_id in jobs:
+            jobs[job_id]["progress_percent"] = 95
+
+        # 7단계: 최종 처리 (95-100%)
+        if job_id and job_id in jobs:
+            jobs[job_id]["progress_stage"] = "최종 처리중"
+            jobs[job_id]["progress_percent"] = 95
+    
+        if not is_h264:
+            encode_h264(output_path)
+
+    tc = np.array(team_ball_control)
+    t1 = int(np.sum(tc == 1))
+    t2 = int(np.sum(tc == 2))
+    total = t1 + t2
+    ball_control = {"team1": round(t1/total*100, 1) if total > 0 else 50.0, "team2": round(t2/total*100, 1) if total > 0 else 50.0}
+
+    if job_id and job_id in jobs:
+        jobs[job_id]["progress_percent"] = 100
+        jobs[job_id]["current_frame"] = total_player_frames
+
+    return events_list, ball_control, subtitle_data, event_data, team_colors_rgb, player_stats
+
@@ -0,0 +1,134 @@
+import os
+import time
+import traceback
+from datetime import datetime
+
+import boto3
+
+from model_registry import get_registry
+
+from .coaching import generate_coaching
+from .config import S3_BUCKET, ANALYSIS_OUTPUT_MODE, COMMENTARY_MODE
+from .jobs import jobs
+from .pipeline import analyze_video, overlay_output_paths
+
+s3_client = boto3.client('s3')
+
+# overlay 모드 결과 파일별 (결과 키 이름, S3 업로드 옵션)
+OVERLAY_UPLOADS = {
+    "overlay": ("overlay_url", {"ContentType": "application/json", "ContentEncoding": "gzip"}),
+    "subtitles": ("subtitles_vtt_url", {"ContentType": "text/vtt; charset=utf-8"}),
+    "events": ("events_vtt_url", {"ContentType": "text/vtt; charset=utf-8"}),
+}
+
+
+def presigned_get_url(s3_key):
+    return s3_client.generate_presigned_url(
+        'get_object',
+        Params={'Bucket': S3_BUCKET, 'Key': s3_key},
+        ExpiresIn=604800
+    )
+
+
+def upload_overlay_outputs(job_id, timestamp, output_local_path):
+    """overlay 모드 결과(주석 데이터, WebVTT)를 올리고 결과에 넣을 presigned URL 반환"""
+    urls = {}
+    for name, local_path in overlay_output_paths(output_local_path).items():
+        result_key, extra_args = OVERLAY_UPLOADS[name]
+        suffix = os.path.basename(local_path).split("_", 2)[-1]
+        s3_key = f"outputs/analyzed_{timestamp}_{job_id}_{suffix}"
+        s3_client.upload_file(local_path, S3_BUCKET, s3_key, ExtraArgs=extra_args)
+        urls[result_key] = presigned_get_url(s3_key)
+    return urls
+
+
+def run_analysis_job(job_id, s3_key):
+    """백그라운드에서 분석 실행"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    input_local_path = f"/tmp/input_{job_id}.mp4"
+    output_local_path = f"/tmp/output_{job_id}.mp4"
+    output_mode = jobs[job_id].get("output_mode") or ANALYSIS_OUTPUT_MODE
+    commentary_mode = jobs[job_id].get("commentary_mode") or COMMENTARY_MODE
+
+    try:
+        if jobs[job_id]["status"] == "cancelled":
+            print(f"[{job_id}] Cancelled while queued")
+            return
+
+        jobs[job_id]["started_at"] = time.time()
+        jobs[job_id]["status"] = "downloading"
+        print(f"[{job_id}] Downloading video from S3: {s3_key}")
+        s3_client.download_file(S3_BUCKET, s3_key, input_local_path)
+
+        if jobs[job_id]["status"] == "cancelled":
+            print(f"[{job_id}] Cancelled before analysis")
+            return
+
+        jobs[job_id]["status"] = "analyzing"
+        print(f"[{job_id}] Starting analysis...")
+        # 작업이 끝날 때까지 사용한 모델은 유휴/메모리 정리 대상에서 제외
+        with get_registry().lease():
+            events, ball_control, subtitles, event_texts, team_colors, player_stats = analyze_video(
+                input_local_path, output_local_path, job_id, output_mode=output_mode, commentary_mode=commentary_mode
+            )
+
+        if jobs[job_id]["status"] == "cancelled":
+            print(f"[{job_id}] Cancelled during analysis")
+            return
+
+        jobs[job_id]["status"] = "uploading"
+        overlay_urls = {}
+        if output_mode == "overlay":
+            # 결과 영상 없이 원본 영상 + 주석 데이터/자막만 전달 (프론트엔드가 원본 위에 그림)
+            print(f"[{job_id}] Uploading overlay data to S3")
+            overlay_urls = upload_overlay_outputs(job_id, timestamp, output_local_path)
+            output_url = presigned_get_url(s3_key)
+        else:
+            output_s3_key = f"outputs/analyzed_{timestamp}_{job_id}.mp4"
+            print(f"[{job_id}] Uploading result to S3: {output_s3_key}")
+            s3_client.upload_file(output_local_path, S3_BUCKET, output_s3_key)
+            jobs[job_id]["output_s3_key"] = output_s3_key
+            output_url = presigned_get_url(output_s3_key)
+
+        coaching = None
+        if commentary_mode != "fast":
+            # fast 모드(미리보기)는 외부 호출 없이 끝나도록 코칭 생성 생략
+            print(f"[{job_id}] Generating coaching analysis...")
+            coaching = generate_coaching(subtitles, event_texts, ball_control)
+
+        jobs[job_id]["finished_at"] = time.time()
+        jobs[job_id]["status"] = "done"
+        jobs[job_id]["result"] = {
+            "output_mode": output_mode,
+            "commentary_mode": commentary_mode,
+            "output_video_url": output_url,
+            "events": events,
+            "team_ball_control": ball_control,
+            "subtitles": subtitles,
+            "event_texts": event_texts,
+            "coaching": coaching,
+            "team_colors": team_colors,
+            "player_stats": player_stats,
+            **overlay_urls,
+        }
+        print(f"[{job_id}] Analysis completed successfully")
+
+    except Exception as e:
+        print(f"[{job_id}] Analysis Error: {str(e)}")
+        print(traceback.format_exc())
+        jobs[job_id]["status"] = "error"
+        
+        # 실패 시 어느 프레임에서 실패했는지 포함
+        current_frame = jobs[job_id].get("current_frame", 0)
+        total_frames = jobs[job_id].get("total_frames", 0)
+        progress_stage = jobs[job_id].get("progress_stage", "알 수 없음")
+        
+        error_msg = f"{str(e)}"
+        if total_frames > 0:
+            error_msg += f" (진행: {current_frame}/{total_frames} 프레임, 단계: {progress_stage})"
+        
+        jobs[job_id]["error"] = error_msg
+    finally:
+        for path in [input_local_path, output_local_path, *overlay_output_paths(output_local_path).values()]:
+            if os.path.exists(path):
+                os.remove(path)
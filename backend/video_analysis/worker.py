@@ -0,0 +1,104 @@
+"""분석 워커 프로세스
+
+API 서버를 ANALYSIS_MODE=external로 띄우면 서버는 작업을 저장소에 queued로 넣고 상태만 읽는다.
+이 스크립트가 워커 프로세스를 띄워서 저장소의 대기 작업을 하나씩 가져가 분석하고,
+진행률/결과는 같은 저장소(JOB_STORE_URL)에 기록한다.
+워커 프로세스가 죽으면 그 프로세스가 맡은 작업을 다시 대기열에 넣고 프로세스를 새로 띄운다.
+
+사용 예 (backend 디렉터리에서):
+    ANALYSIS_MODE=external uvicorn ec2-api:app --workers 4
+    python -m video_analysis.worker --workers 2
+"""
+import argparse
+import multiprocessing as mp
+import os
+import time
+import traceback
+
+from overlay import check_font
+
+from .config import ANALYSIS_JOB_WORKERS, OVERLAY_ENABLED, OVERLAY_FONT_PATH, PRELOAD_MODELS, WORKER_POLL_SECONDS
+from .jobs import jobs, reset_for_retry, RUNNING_STATUSES
+
+# 워커는 작업 중 이 간격으로 저장소를 다시 읽어서 API의 취소 요청을 반영
+WORKER_REFRESH_SECONDS = 1.0
+
+
+def worker_loop(poll_interval):
+    """대기 작업을 가져와서 분석 (프로세스마다 모델은 한 번만 로드)"""
+    from .pipeline import preload_models, start_model_janitor
+    from .runner import run_analysis_job
+
+    jobs.max_age = WORKER_REFRESH_SECONDS
+    if PRELOAD_MODELS:
+        preload_models()
+    # 모델은 워커 프로세스마다 따로 로드하므로 유휴/메모리 정리도 프로세스마다
+    start_model_janitor()
+
+    pid = os.getpid()
+    print(f"[WORKER {pid}] ready")
+    while True:
+        job_id = jobs.claim(status="downloading", worker_pid=pid)
+        if job_id is None:
+            time.sleep(poll_interval)
+            continue
+        print(f"[WORKER {pid}] claimed job {job_id}")
+        try:
+            run_analysis_job(job_id, jobs[job_id]["s3_key"])
+        except Exception:
+            print(f"[WORKER {pid}] job {job_id} crashed")
+            print(traceback.format_exc())
+
+
+def recover_worker_jobs(pid=None):
+    """워커가 처리하다 중단된 작업을 다시 대기열로 (pid가 None이면 전체)"""
+    for job_id, job in jobs.unfinished(RUNNING_STATUSES).items():
+        if pid is not None and job.get("worker_pid") != pid:
+            continue
+        if reset_for_retry(job, "분석 워커 프로세스가 반복 중단되었습니다"):
+            print(f"[{job_id}] Re-queued after worker exit")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분석 워커 프로세스 실행")
+    parser.add_argument("--workers", type=int, default=ANALYSIS_JOB_WORKERS)
+    parser.add_argument("--poll", type=float, default=WORKER_POLL_SECONDS)
+    args = parser.parse_args()
+
+    # 폰트가 없으면 워커 프로세스를 띄우기 전에 중단 (렌더링 단계에서 작업마다 실패하지 않도록)
+    if OVERLAY_ENABLED:
+        check_font(OVERLAY_FONT_PATH)
+    # 감독 프로세스는 워커가 기록한 최신 상태(worker_pid)를 봐야 하므로 항상 저장소에서 읽음
+    jobs.max_age = 0
+    # 시작 전에는 실행 중인 워커가 없으므로 남아 있는 실행 상태 작업은 모두 중단된 작업
+    recover_worker_jobs()
+
+    # 청크 병렬 분석이 다시 프로세스 풀을 만들 수 있도록 daemon이 아닌 프로세스로 실행
+    ctx = mp.get_context("spawn")
+
+    def spawn():
+        process = ctx.Process(target=worker_loop, args=(args.poll,), name="analysis-worker")
+        process.start()
+        return process
+
+    processes = [spawn() for _ in range(args.workers)]
+    try:
+        while True:
+            time.sleep(1)
+            for i, process in enumerate(processes):
+                if process.is_alive():
+                    continue
+                print(f"[WORKER {process.pid}] exited with code {process.exitcode}, restarting")
+                recover_worker_jobs(process.pid)
+                processes[i] = spawn()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+from .video_reader import VideoReader, read_video_frames
+from .video_stream import iter_frame_windows, StreamingVideoWriter
+from .ffmpeg_writer import FFmpegVideoWriter, create_video_writer, concat_videos
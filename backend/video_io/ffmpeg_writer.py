@@ -0,0 +1,137 @@
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+
+from .video_stream import StreamingVideoWriter
+
+
+class FFmpegVideoWriter:
+    """프레임을 raw BGR로 ffmpeg(libx264) 프로세스에 바로 넘겨 H.264 mp4로 한 번에 인코딩
+
+    StreamingVideoWriter와 같은 인터페이스 (write(frames), release(), with 문).
+    파이프 쓰기는 별도 스레드가 맡기 때문에 주석 그리기와 인코딩이 겹쳐서 진행되고,
+    mp4v로 저장한 뒤 다시 인코딩하는 두 번째 단계가 필요 없다.
+    """
+
+    h264 = True
+
+    def __init__(self, output_path, fps=24, preset="veryfast", crf=23, threads=0, queue_frames=48,
+                 ffmpeg="ffmpeg"):
+        self.output_path = output_path
+        self.fps = fps
+        self.preset = preset
+        self.crf = crf
+        self.threads = threads
+        self.ffmpeg = ffmpeg
+        self.frame_count = 0
+        self._queue = queue.Queue(maxsize=queue_frames)
+        self._process = None
+        self._thread = None
+        self._stderr = None
+        self._error = None
+
+    def _command(self, width, height):
+        return [
+            self.ffmpeg, "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{width}x{height}", "-r", str(self.fps), "-i", "-",
+            # yuv420p는 짝수 해상도가 필요
+            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-c:v", "libx264", "-preset", self.preset, "-crf", str(self.crf), "-threads", str(self.threads),
+            "-pix_fmt", "yuv420p", "-movflags", "+faststart",
+            self.output_path,
+        ]
+
+    def _start(self, frame):
+        height, width = frame.shape[:2]
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            self._command(width, height), stdin=subprocess.PIPE, stderr=self._stderr,
+        )
+        self._thread = threading.Thread(target=self._pump, args=(self._process.stdin,), daemon=True)
+        self._thread.start()
+
+    def _pump(self, stdin):
+        try:
+            while True:
+                frame = self._queue.get()
+                if frame is None:
+                    break
+                stdin.write(frame.tobytes())
+        except (BrokenPipeError, OSError) as e:
+            self._error = e
+            # 생산자가 막히지 않도록 남은 프레임은 버림
+            while self._queue.get() is not None:
+                pass
+        finally:
+            try:
+                stdin.close()
+            except OSError:
+                pass
+
+    def write(self, frames):
+        for frame in frames:
+            if self._process is None:
+                self._start(frame)
+            if self._error is not None:
+                break
+            self._queue.put(frame)
+            self.frame_count += 1
+        if self._error is not None:
+            self.release()
+
+    def release(self):
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        self._queue.put(None)
+        self._thread.join()
+        returncode = process.wait()
+        self._stderr.seek(0)
+        message = self._stderr.read().decode(errors="replace").strip()
+        self._stderr.close()
+        if returncode != 0 or self._error is not None:
+            raise RuntimeError(f"ffmpeg encoding failed ({returncode}): {message[-500:] or self._error}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.release()
+        except RuntimeError:
+            # 이미 다른 예외로 빠져나가는 중이면 원래 예외를 유지
+            if exc_type is None:
+                raise
+
+
+def create_video_writer(output_path, fps=24, encoder="ffmpeg", preset="veryfast", crf=23, threads=0):
+    """결과 영상 writer 생성 (encoder: ffmpeg=H.264 직접 인코딩 / opencv=mp4v, 이후 재인코딩 필요)
+
+    ffmpeg 실행 파일이 없으면 opencv writer로 대체한다. 반환된 writer의 h264 속성으로 구분한다.
+    """
+    if encoder == "ffmpeg" and shutil.which("ffmpeg"):
+        return FFmpegVideoWriter(output_path, fps=fps, preset=preset, crf=crf, threads=threads)
+    return StreamingVideoWriter(output_path, fps=fps)
+
+
+def concat_videos(paths, output_path, ffmpeg="ffmpeg"):
+    """같은 설정으로 인코딩한 mp4 조각들을 concat demuxer로 재인코딩 없이(-c copy) 이어 붙임"""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for path in paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+        list_path = f.name
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", list_path,
+             "-c", "copy", "-movflags", "+faststart", output_path],
+            capture_output=True,
+        )
+    finally:
+        os.remove(list_path)
+    if result.returncode != 0:
+        message = result.stderr.decode(errors="replace").strip()
+        raise RuntimeError(f"ffmpeg concat failed ({result.returncode}): {message[-500:]}")
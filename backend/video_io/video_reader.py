@@ -0,0 +1,259 @@
+import cv2
+
+try:
+    import av
+except ImportError:  # PyAV가 없는 환경에서는 OpenCV 디코더로 대체
+    av = None
+
+
+_ROTATE_CODES = {
+    90: cv2.ROTATE_90_CLOCKWISE,
+    180: cv2.ROTATE_180,
+    270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+}
+
+
+def _scaled_size(width, height, max_height):
+    """높이가 max_height를 넘으면 비율을 유지해 축소한 (w, h) 반환 (짝수로 맞춤)"""
+    if not max_height or height <= max_height:
+        return width, height
+    new_w = int(width * (max_height / height)) // 2 * 2
+    return new_w, max_height
+
+
+class VideoReader:
+    """영상 입력 레이어
+
+    컨테이너를 한 번만 열어서 메타데이터(fps, 길이, 회전)와 프레임을 함께 제공한다.
+    PyAV가 있으면 멀티스레드 디코딩 후 swscale로 목표 해상도/BGR 변환을 한 번에 처리하고,
+    없으면 OpenCV VideoCapture로 동일한 결과를 만든다.
+
+    - max_height: 이 높이보다 큰 영상은 디코딩 단계에서 축소
+    - target_fps: 지정하면 원본 fps보다 낮은 경우 프레임을 솎아냄 (0/None이면 원본 유지)
+    - threads: 디코더 스레드 수 (0이면 자동)
+    """
+
+    def __init__(self, video_path, max_height=720, target_fps=None, threads=0, default_fps=24):
+        self.video_path = video_path
+        self.max_height = max_height
+        self.threads = threads
+        self._container = None
+        self._stream = None
+        self._cap = None
+
+        if av is not None:
+            self._open_av(default_fps)
+        else:
+            self._open_cv2(default_fps)
+
+        # 원본보다 높은 fps는 의미가 없으므로 원본 fps로 제한
+        if target_fps and target_fps < self.source_fps:
+            self.fps = float(target_fps)
+        else:
+            self.fps = self.source_fps
+
+        display_w, display_h = self.source_width, self.source_height
+        if self.rotation in (90, 270):
+            display_w, display_h = display_h, display_w
+        self.width, self.height = _scaled_size(display_w, display_h, max_height)
+
+        if self.duration:
+            self.frame_count = int(round(self.duration * self.fps))
+        else:
+            self.frame_count = self._source_frame_count
+
+    def _open_av(self, default_fps):
+        self._container = av.open(self.video_path)
+        stream = self._container.streams.video[0]
+        stream.thread_type = "AUTO"
+        stream.codec_context.thread_count = self.threads
+        self._stream = stream
+
+        rate = stream.average_rate or stream.guessed_rate
+        self.source_fps = float(rate) if rate else default_fps
+        self.source_width = stream.codec_context.width
+        self.source_height = stream.codec_context.height
+        self._source_frame_count = stream.frames or 0
+
+        if stream.duration is not None and stream.time_base is not None:
+            self.duration = float(stream.duration * stream.time_base)
+        elif self._container.duration is not None:
+            self.duration = self._container.duration / av.time_base
+        else:
+            self.duration = 0.0
+
+        # 'rotate' 태그는 시계 방향 각도
+        self.rotation = int(stream.metadata.get("rotate", 0)) % 360
+
+    def _open_cv2(self, default_fps):
+        cap = cv2.VideoCapture(self.video_path)
+        # 회전은 직접 처리하므로 OpenCV 자동 회전은 끔
+        cap.set(cv2.CAP_PROP_ORIENTATION_AUTO, 0)
+        self._cap = cap
+
+        self.source_fps = cap.get(cv2.CAP_PROP_FPS) or default_fps
+        self.source_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.source_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self._source_frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        self.duration = self._source_frame_count / self.source_fps if self._source_frame_count else 0.0
+        self.rotation = int(cap.get(cv2.CAP_PROP_ORIENTATION_META) or 0) % 360
+
+    @property
+    def info(self):
+        return {
+            "fps": self.fps,
+            "source_fps": self.source_fps,
+            "frame_count": self.frame_count,
+            "duration": self.duration,
+            "rotation": self.rotation,
+            "width": self.width,
+            "height": self.height,
+        }
+
+    def _decode_size(self):
+        """회전 전 기준의 디코딩 목표 크기"""
+        if self.rotation in (90, 270):
+            return self.height, self.width
+        return self.width, self.height
+
+    def _rotate(self, frame):
+        code = _ROTATE_CODES.get(self.rotation)
+        return cv2.rotate(frame, code) if code is not None else frame
+
+    def frames(self, start_frame=0, end_frame=None):
+        """BGR 프레임 제너레이터 (목표 해상도/fps 적용 완료)
+
+        start_frame/end_frame은 목표 fps 기준 프레임 번호이며, 시작 위치로는 탐색(seek)해서 이동한다.
+        """
+        for _, frame in self._iter_frames(start_frame, end_frame):
+            yield frame
+
+    def frames_at(self, indices):
+        """지정한 프레임 번호의 프레임만 (index, frame)으로 반환 (나머지는 변환 없이 건너뜀)"""
+        wanted = set(indices)
+        if not wanted:
+            return
+        yield from self._iter_frames(min(wanted), max(wanted) + 1, wanted)
+
+    def keyframes(self):
+        """원본 키프레임 위치 (목표 fps 기준 프레임 번호, 정렬됨)
+
+        PyAV로 패킷만 읽고 디코딩은 하지 않는다. 읽기 위치가 바뀌지 않도록 컨테이너를 따로 연다.
+        PyAV가 없으면 빈 리스트.
+        """
+        if av is None:
+            return []
+        with av.open(self.video_path) as container:
+            stream = container.streams.video[0]
+            origin = float(stream.start_time * stream.time_base) if stream.start_time is not None else 0.0
+            frames = {
+                int(round((float(packet.pts * stream.time_base) - origin) * self.fps))
+                for packet in container.demux(stream)
+                if packet.is_keyframe and packet.pts is not None
+            }
+        return sorted(frames)
+
+    def _iter_frames(self, start_frame=0, end_frame=None, wanted=None):
+        if self._container is not None:
+            yield from self._frames_av(start_frame, end_frame, wanted)
+        else:
+            yield from self._frames_cv2(start_frame, end_frame, wanted)
+
+    def _frames_av(self, start_frame, end_frame, wanted):
+        decode_w, decode_h = self._decode_size()
+        stream = self._stream
+        frame_interval = 1.0 / self.fps
+        tolerance = 0.5 / self.source_fps
+        origin = float(stream.start_time * stream.time_base) if stream.start_time is not None else 0.0
+        next_time = origin + start_frame * frame_interval
+        if start_frame:
+            # 시작 시점 이전 키프레임으로 이동 후 디코딩하면서 앞부분은 버림
+            self._container.seek(int(next_time / stream.time_base), stream=stream, backward=True)
+        index = start_frame
+        first = True
+
+        for decoded, frame in enumerate(self._container.decode(stream)):
+            if first:
+                first = False
+                # 디스플레이 매트릭스 회전(반시계 방향)은 첫 프레임에서만 알 수 있음
+                frame_rotation = getattr(frame, "rotation", 0)
+                if not self.rotation and frame_rotation:
+                    self.rotation = (-int(frame_rotation)) % 360
+                    if self.rotation in (90, 270):
+                        self.width, self.height = _scaled_size(
+                            self.source_height, self.source_width, self.max_height
+                        )
+                    decode_w, decode_h = self._decode_size()
+
+            # fps 선택: 버릴 프레임은 색 변환/리사이즈 전에 건너뜀
+            t = frame.time if frame.time is not None else origin + decoded / self.source_fps
+            if t < next_time - tolerance:
+                continue
+            next_time += frame_interval
+            if end_frame is not None and index >= end_frame:
+                break
+            index += 1
+            if wanted is not None and index - 1 not in wanted:
+                continue
+
+            image = frame.reformat(
+                width=decode_w, height=decode_h, format="bgr24", interpolation="AREA"
+            ).to_ndarray()
+            yield index - 1, self._rotate(image)
+
+    def _frames_cv2(self, start_frame, end_frame, wanted):
+        decode_w, decode_h = self._decode_size()
+        step = self.source_fps / self.fps
+        next_source = start_frame * step
+        source_index = int(round(next_source))
+        if source_index:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, source_index)
+        index = start_frame
+        while end_frame is None or index < end_frame:
+            ret, frame = self._cap.read()
+            if not ret:
+                break
+            source_index += 1
+            if source_index - 1 + 1e-6 < next_source:
+                continue
+            next_source += step
+            index += 1
+            if wanted is not None and index - 1 not in wanted:
+                continue
+            if (frame.shape[1], frame.shape[0]) != (decode_w, decode_h):
+                frame = cv2.resize(frame, (decode_w, decode_h), interpolation=cv2.INTER_AREA)
+            yield index - 1, self._rotate(frame)
+
+    def iter_windows(self, window_size, start_frame=0, end_frame=None):
+        """window_size 프레임씩 묶어서 반환"""
+        window = []
+        for frame in self.frames(start_frame, end_frame):
+            window.append(frame)
+            if len(window) >= window_size:
+                yield window
+                window = []
+        if window:
+            yield window
+
+    def close(self):
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_video_frames(video_path, max_height=720, target_fps=None, threads=0):
+    """전체 프레임 리스트와 메타데이터를 한 번에 반환 (기존 read_video + fps 조회 대체)"""
+    with VideoReader(video_path, max_height=max_height, target_fps=target_fps, threads=threads) as reader:
+        frames = list(reader.frames())
+        info = reader.info
+    info["frame_count"] = len(frames)
+    return frames, info
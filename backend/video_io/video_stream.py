@@ -0,0 +1,50 @@
+import cv2
+
+from .video_reader import VideoReader
+
+
+def iter_frame_windows(video_path, window_size=240, max_height=720, target_fps=None, threads=0):
+    """영상을 window_size 프레임씩 끊어서 디코딩하는 제너레이터
+
+    전체 프레임을 리스트로 들고 있지 않기 때문에 영상 길이와 상관없이
+    메모리에는 항상 한 윈도우 분량의 프레임만 올라간다.
+    max_height보다 큰 프레임은 디코딩 단계에서 비율을 유지한 채 축소한다.
+    threads는 디코더 스레드 수 (0이면 자동)
+    """
+    with VideoReader(video_path, max_height=max_height, target_fps=target_fps, threads=threads) as reader:
+        yield from reader.iter_windows(window_size)
+
+
+class StreamingVideoWriter:
+    """프레임을 받는 즉시 파일에 기록하는 VideoWriter 래퍼
+
+    첫 프레임이 들어올 때 해상도를 결정하므로 미리 크기를 몰라도 된다.
+    """
+
+    h264 = False  # mp4v로 기록하므로 웹 재생용 H.264 변환이 따로 필요
+
+    def __init__(self, output_path, fps=24, fourcc="mp4v"):
+        self.output_path = output_path
+        self.fps = fps
+        self.fourcc = cv2.VideoWriter_fourcc(*fourcc)
+        self.writer = None
+        self.frame_count = 0
+
+    def write(self, frames):
+        for frame in frames:
+            if self.writer is None:
+                h, w = frame.shape[:2]
+                self.writer = cv2.VideoWriter(self.output_path, self.fourcc, self.fps, (w, h))
+            self.writer.write(frame)
+            self.frame_count += 1
+
+    def release(self):
+        if self.writer is not None:
+            self.writer.release()
+            self.writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
@@ -5,6 +5,7 @@ import { Upload, Goal, Crosshair, Shield, AlertCircle, HelpCircle, Download, Mes
 import { useAuth } from "@/context/AuthContext";
 import Link from "next/link";
 import ReactMarkdown from "react-markdown";
+import OverlayVideoPlayer from "@/components/OverlayVideoPlayer";
 
 const API_URL = process.env.NEXT_PUBLIC_VIDEO_API_URL || "https://bvologzwm8.execute-api.us-east-1.amazonaws.com";
 
@@ -22,6 +23,8 @@ type AnalysisResult = {
   team_ball_control?: { team1: number; team2: number }; player_stats?: PlayerStat[];
   subtitles?: string[]; event_texts?: string[]; coaching?: string;
   team_colors?: { [key: string]: number[] }; status?: string; message?: string;
+  // overlay 모드: output_video_url은 원본 영상, 주석은 overlay_url 데이터로 화면에서 그림
+  output_mode?: "video" | "overlay"; overlay_url?: string; subtitles_vtt_url?: string; events_vtt_url?: string;
 };
 
 function Skeleton({ className }: { className?: string }) {
@@ -55,6 +58,8 @@ export default function VideoPage() {
   const [progressPercent, setProgressPercent] = useState<number>(0);
   const [currentFrame, setCurrentFrame] = useState<number>(0);
   const [totalFrames, setTotalFrames] = useState<number>(0);
+  const [overlayMode, setOverlayMode] = useState(false);
+  const [previewMode, setPreviewMode] = useState(false);
   const videoRef = useRef<HTMLVideoElement>(null);
 
   const sampleResult = {
@@ -143,7 +148,7 @@ export default function VideoPage() {
       // 백엔드 진행률은 25%부터 시작하도록 오프셋 설정하지 않음 (백엔드에서 조정)
       setEstimatedTime(0);
       const analyzeStart = Date.now();
-      const analyzeRes = await fetch(`${API_URL}/api/analyze`, { method: "POST", headers: { "Content-Type": "application/json" }, body: JSON.stringify({ video_s3_key: s3_key }) });
+      const analyzeRes = await fetch(`${API_URL}/api/analyze`, { method: "POST", headers: { "Content-Type": "application/json" }, body: JSON.stringify({ video_s3_key: s3_key, output_mode: overlayMode ? "overlay" : "video", commentary_mode: previewMode ? "fast" : "llm" }) });
       if (!analyzeRes.ok) throw new Error(`분석 요청 실패 (${analyzeRes.status})`);
       const { jobId } = await analyzeRes.json();
       setProgressMessage("선수 추적중...");
@@ -197,10 +202,11 @@ export default function VideoPage() {
           setProgressMessage("분석 완료!");
           setProgressPercent(100);
           const r = statusData.result;
-          setResult({ output_video_url: r.output_video_url, events: r.events, team_ball_control: r.team_ball_control, subtitles: r.subtitles || [], event_texts: r.event_texts || [], coaching: r.coaching || null, team_colors: r.team_colors || null, status: "success", message: "분석 완료" });
+          setResult({ output_video_url: r.output_video_url, output_mode: r.output_mode, overlay_url: r.overlay_url, subtitles_vtt_url: r.subtitles_vtt_url, events_vtt_url: r.events_vtt_url, events: r.events, team_ball_control: r.team_ball_control, subtitles: r.subtitles || [], event_texts: r.event_texts || [], coaching: r.coaching || null, team_colors: r.team_colors || null, status: "success", message: "분석 완료" });
           setStatus("done");
           setAbortController(null);
-          fetchBothCoachings(r.subtitles || [], r.event_texts || [], r.team_ball_control || {});
+          // 미리보기(fast) 분석은 외부 AI 호출 없이 끝나도록 코칭은 요청하지 않음
+          if (r.commentary_mode !== "fast") fetchBothCoachings(r.subtitles || [], r.event_texts || [], r.team_ball_control || {});
           break;
         } else if (statusData.status === "error") { throw new Error(statusData.error || "분석 중 오류 발생"); }
       }
@@ -344,13 +350,25 @@ export default function VideoPage() {
           </div>
         )}
         {error && <div className="w-full py-3 rounded-xl text-center text-sm text-red-500 dark:text-red-400 border border-red-200 dark:border-red-400/20 bg-red-50 dark:bg-red-400/5">{error}</div>}
+        {localUrl && !isLoading && (
+          <label className="flex items-center gap-2 text-sm cursor-pointer w-fit" style={{ color: "var(--text-secondary)" }}>
+            <input type="checkbox" checked={overlayMode} onChange={(e) => setOverlayMode(e.target.checked)} />
+            빠른 분석 (결과 영상을 만들지 않고 원본 영상 위에 분석 결과 표시)
+          </label>
+        )}
+        {localUrl && !isLoading && (
+          <label className="flex items-center gap-2 text-sm cursor-pointer w-fit" style={{ color: "var(--text-secondary)" }}>
+            <input type="checkbox" checked={previewMode} onChange={(e) => setPreviewMode(e.target.checked)} />
+            미리보기 (AI 중계 대신 즉시 생성되는 기본 중계, AI 코칭 없음)
+          </label>
+        )}
         {localUrl && !isLoading && (<button onClick={analyze} className="w-full py-3 rounded-xl font-semibold text-sm text-white" style={{ background: "var(--brand-primary)" }}>{status === "done" ? "다시 분석" : "AI 분석 시작"}</button>)}
 
         {(localUrl || showSkeleton || done || user) && (<>
           {/* 상단 2컬럼: 영상 | 점유율+이벤트카드 */}
           <div className="grid grid-cols-1 lg:grid-cols-2 gap-5">
             <div className="w-full aspect-video bg-black rounded-xl border border-gray-200 dark:border-white/10 overflow-hidden flex items-center justify-center">
-              {done && result.output_video_url ? <video ref={videoRef} src={result.output_video_url} controls className="w-full h-full" /> : localUrl ? <video ref={videoRef} src={localUrl} controls className="w-full h-full" /> : <p className="text-gray-400 text-sm">영상을 업로드하면 여기서 재생돼요</p>}
+              {done && result.output_mode === "overlay" && result.overlay_url ? <OverlayVideoPlayer src={localUrl || result.output_video_url} overlayUrl={result.overlay_url} subtitlesUrl={result.subtitles_vtt_url} eventsUrl={result.events_vtt_url} videoRef={videoRef} teamColor={getTeamColor} /> : done && result.output_video_url ? <video ref={videoRef} src={result.output_video_url} controls className="w-full h-full" /> : localUrl ? <video ref={videoRef} src={localUrl} controls className="w-full h-full" /> : <p className="text-gray-400 text-sm">영상을 업로드하면 여기서 재생돼요</p>}
             </div>
             <div className="space-y-4 flex flex-col justify-center">
               <div className="bg-gray-50 dark:bg-white/5 border border-gray-200 dark:border-white/10 rounded-xl p-5 space-y-3">
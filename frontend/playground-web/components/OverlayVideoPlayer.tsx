@@ -0,0 +1,195 @@
+"use client";
+
+import { useEffect, useRef, useState, type RefObject } from "react";
+
+// 백엔드 overlay 모드 결과 (backend/overlay/overlay_data.py 형식)
+// offsets[f]..offsets[f + 1]이 f번 프레임의 행 범위, bbox는 행마다 x1, y1, x2, y2
+type ObjectColumns = { offsets: number[]; bbox: number[]; id?: number[]; team?: number[]; has_ball?: number[] };
+export type OverlayData = {
+  version: number; fps: number; num_frames: number; width: number; height: number;
+  team_colors: { [key: string]: number[] };
+  players: ObjectColumns; referees: ObjectColumns; ball: ObjectColumns;
+  possession: [number, number][];
+};
+
+const REFEREE_COLOR = "rgb(255, 255, 0)";
+const BALL_COLOR = "rgb(0, 255, 0)";
+const OWNER_COLOR = "rgb(255, 0, 0)";
+
+function possessionAt(possession: [number, number][], frame: number) {
+  // 팀1 점유율이 바뀌는 지점만 있으므로 frame 이하의 마지막 지점을 이진 탐색
+  let lo = 0, hi = possession.length - 1, found = -1;
+  while (lo <= hi) {
+    const mid = (lo + hi) >> 1;
+    if (possession[mid][0] <= frame) { found = mid; lo = mid + 1; } else hi = mid - 1;
+  }
+  return found >= 0 ? possession[found][1] : null;
+}
+
+function drawEllipse(ctx: CanvasRenderingContext2D, x1: number, x2: number, y2: number, color: string, label?: number) {
+  const cx = (x1 + x2) / 2, w = x2 - x1;
+  ctx.strokeStyle = color;
+  ctx.lineWidth = 2;
+  ctx.beginPath();
+  ctx.ellipse(cx, y2, w / 2, 0.35 * w / 2, 0, (-45 * Math.PI) / 180, (235 * Math.PI) / 180);
+  ctx.stroke();
+  if (label === undefined) return;
+  const boxW = 40, boxH = 20, top = y2 + 15 - boxH / 2 + 5;
+  ctx.fillStyle = color;
+  ctx.fillRect(cx - boxW / 2, top, boxW, boxH);
+  ctx.fillStyle = "black";
+  ctx.font = "bold 12px sans-serif";
+  ctx.textAlign = "center";
+  ctx.textBaseline = "middle";
+  ctx.fillText(String(label), cx, top + boxH / 2);
+}
+
+function drawTriangle(ctx: CanvasRenderingContext2D, x: number, y: number, color: string) {
+  ctx.fillStyle = color;
+  ctx.strokeStyle = "black";
+  ctx.lineWidth = 2;
+  ctx.beginPath();
+  ctx.moveTo(x, y);
+  ctx.lineTo(x - 10, y - 20);
+  ctx.lineTo(x + 10, y - 20);
+  ctx.closePath();
+  ctx.fill();
+  ctx.stroke();
+}
+
+function drawEventText(ctx: CanvasRenderingContext2D, data: OverlayData, text: string) {
+  const size = Math.round(data.height / 32), pad = size / 2, top = Math.round(data.height / 30);
+  ctx.font = `bold ${size}px sans-serif`;
+  const w = ctx.measureText(text).width + 2 * pad;
+  ctx.fillStyle = "rgba(0, 0, 0, 0.6)";
+  ctx.fillRect((data.width - w) / 2, top, w, size * 1.25 + 2 * pad);
+  ctx.fillStyle = "rgb(255, 255, 0)";
+  ctx.textAlign = "center";
+  ctx.textBaseline = "top";
+  ctx.fillText(text, data.width / 2, top + pad);
+}
+
+function drawFrame(
+  ctx: CanvasRenderingContext2D, data: OverlayData, owners: Set<number>, frame: number, teamColor: (team: number) => string,
+) {
+  const { players, referees, ball } = data;
+
+  for (let i = players.offsets[frame]; i < players.offsets[frame + 1]; i++) {
+    const [x1, y1, x2, y2] = players.bbox.slice(i * 4, i * 4 + 4);
+    drawEllipse(ctx, x1, x2, y2, teamColor(players.team?.[i] || 0), players.id?.[i]);
+    if (owners.has(i)) drawTriangle(ctx, (x1 + x2) / 2, y1, OWNER_COLOR);
+  }
+  for (let i = referees.offsets[frame]; i < referees.offsets[frame + 1]; i++) {
+    const [x1, , x2, y2] = referees.bbox.slice(i * 4, i * 4 + 4);
+    drawEllipse(ctx, x1, x2, y2, REFEREE_COLOR);
+  }
+  for (let i = ball.offsets[frame]; i < ball.offsets[frame + 1]; i++) {
+    const [x1, y1, x2] = ball.bbox.slice(i * 4, i * 4 + 4);
+    drawTriangle(ctx, (x1 + x2) / 2, y1, BALL_COLOR);
+  }
+
+  const team1 = possessionAt(data.possession, frame);
+  if (team1 !== null) {
+    const size = Math.round(data.height / 30), pad = size / 2, margin = Math.round(data.height / 30);
+    const lines = [`팀1 점유율: ${team1}%`, `팀2 점유율: ${100 - team1}%`];
+    ctx.font = `${size}px sans-serif`;
+    const w = Math.max(...lines.map((line) => ctx.measureText(line).width)) + 2 * pad;
+    const h = lines.length * size * 1.25 + 2 * pad;
+    const x = data.width - margin - w, y = data.height - margin - h;
+    ctx.fillStyle = "rgba(255, 255, 255, 0.45)";
+    ctx.fillRect(x, y, w, h);
+    ctx.fillStyle = "black";
+    ctx.textAlign = "left";
+    ctx.textBaseline = "top";
+    lines.forEach((line, i) => ctx.fillText(line, x + pad, y + pad + i * size * 1.25));
+  }
+}
+
+interface OverlayVideoPlayerProps {
+  src: string;
+  overlayUrl: string;
+  subtitlesUrl?: string;
+  eventsUrl?: string;
+  videoRef: RefObject<HTMLVideoElement | null>;
+  teamColor: (team: number) => string;
+}
+
+// 주석을 입힌 결과 영상 대신 원본 영상 위에 선수/볼 주석과 점유율을 canvas로 그리고,
+// 해설 자막은 WebVTT 트랙으로 표시 (이벤트 문구는 metadata 트랙의 현재 큐를 canvas 위쪽에 그림)
+export default function OverlayVideoPlayer({ src, overlayUrl, subtitlesUrl, eventsUrl, videoRef, teamColor }: OverlayVideoPlayerProps) {
+  const canvasRef = useRef<HTMLCanvasElement>(null);
+  const [data, setData] = useState<OverlayData | null>(null);
+  const [tracks, setTracks] = useState<{ subtitles?: string; events?: string }>({});
+
+  useEffect(() => {
+    // presigned S3 GET도 다른 출처 fetch이므로 버킷 CORS 규칙 필요
+    let cancelled = false;
+    fetch(overlayUrl).then((res) => (res.ok ? res.json() : null)).then((d) => { if (!cancelled) setData(d); })
+      .catch((e) => console.error("[OVERLAY] load error:", e));
+    return () => { cancelled = true; };
+  }, [overlayUrl]);
+
+  useEffect(() => {
+    // 다른 출처의 <track>을 쓰려면 <video crossOrigin>이 필요해서 원본 영상까지 CORS 요청이 되므로
+    // 내용을 받아서 같은 출처의 blob URL로 붙임. fetch 자체는 CORS 요청이라 위 주석 데이터와 마찬가지로
+    // S3 버킷 CORS 규칙에 GET 허용이 있어야 함 (docs/VIDEO-ANALYSIS.md "overlay 모드 S3 CORS")
+    let cancelled = false;
+    const created: string[] = [];
+    const load = async (url?: string) => {
+      if (!url) return undefined;
+      const res = await fetch(url);
+      if (!res.ok) return undefined;
+      const blobUrl = URL.createObjectURL(new Blob([await res.text()], { type: "text/vtt" }));
+      created.push(blobUrl);
+      return blobUrl;
+    };
+    Promise.all([load(subtitlesUrl), load(eventsUrl)]).then(([subtitles, events]) => {
+      if (!cancelled) setTracks({ subtitles, events });
+    }).catch((e) => console.error("[OVERLAY] subtitle load error:", e));
+    return () => { cancelled = true; created.forEach((url) => URL.revokeObjectURL(url)); };
+  }, [subtitlesUrl, eventsUrl]);
+
+  useEffect(() => {
+    if (!data) return;
+    const owners = new Set(data.players.has_ball || []);
+    let handle = 0;
+    let lastKey = "";
+    const render = () => {
+      handle = requestAnimationFrame(render);
+      const video = videoRef.current, canvas = canvasRef.current;
+      if (!video || !canvas || data.num_frames === 0) return;
+      const dpr = window.devicePixelRatio || 1;
+      const cw = Math.round(canvas.clientWidth * dpr), ch = Math.round(canvas.clientHeight * dpr);
+      const frame = Math.min(data.num_frames - 1, Math.floor(video.currentTime * data.fps));
+      const eventTrack = Array.from(video.textTracks).find((t) => t.kind === "metadata");
+      if (eventTrack && eventTrack.mode === "disabled") eventTrack.mode = "hidden";
+      const eventText = (eventTrack?.activeCues?.[0] as VTTCue | undefined)?.text || "";
+      // 프레임/이벤트 문구/화면 크기가 바뀔 때만 다시 그림
+      const key = `${frame}:${eventText}:${cw}x${ch}`;
+      if (key === lastKey) return;
+      lastKey = key;
+      if (canvas.width !== cw || canvas.height !== ch) { canvas.width = cw; canvas.height = ch; }
+      const ctx = canvas.getContext("2d");
+      if (!ctx) return;
+      ctx.setTransform(1, 0, 0, 1, 0, 0);
+      ctx.clearRect(0, 0, cw, ch);
+      // 영상은 비율을 유지한 채 가운데 배치되므로 분석 해상도 좌표를 같은 영역으로 맞춤
+      const scale = Math.min(cw / data.width, ch / data.height);
+      ctx.setTransform(scale, 0, 0, scale, (cw - data.width * scale) / 2, (ch - data.height * scale) / 2);
+      drawFrame(ctx, data, owners, frame, teamColor);
+      if (eventText) drawEventText(ctx, data, eventText);
+    };
+    handle = requestAnimationFrame(render);
+    return () => cancelAnimationFrame(handle);
+  }, [data, videoRef, teamColor]);
+
+  return (
+    <div className="relative w-full h-full">
+      <video ref={videoRef} src={src} controls className="w-full h-full">
+        {tracks.subtitles && <track kind="subtitles" label="AI 중계" srcLang="ko" src={tracks.subtitles} default />}
+        {tracks.events && <track kind="metadata" label="이벤트" srcLang="ko" src={tracks.events} />}
+      </video>
+      <canvas ref={canvasRef} className="absolute inset-0 w-full h-full pointer-events-none" />
+    </div>
+  );
+}